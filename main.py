@@ -8,6 +8,7 @@ Point d'entrée principal du programme
 
 import argparse
 from src.game.game import Game
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
 
 def main():
     """
@@ -17,8 +18,34 @@ def main():
     parser = argparse.ArgumentParser(description='Jeu Snake en Python avec Pygame')
     parser.add_argument('--debug', action='store_true', help='Activer le mode débogage')
     parser.add_argument('--test', action='store_true', help='Exécuter les tests')
+    parser.add_argument('--seed', type=int, help='Graine des parties (parties reproductibles)')
+    parser.add_argument('--record', metavar='FICHIER', help='Enregistrer la dernière partie jouée')
+    parser.add_argument('--replay', metavar='FICHIER', help='Rejouer une partie enregistrée sans affichage')
+    parser.add_argument('--seek', type=int, metavar='TICK', help='Avec --replay, s\'arrêter au tick indiqué')
+    parser.add_argument('--batch', type=int, metavar='N', help='Simuler N parties par réglage sans affichage')
+    parser.add_argument('--policy', default='greedy', help='Politiques des bots, séparées par des virgules')
+    parser.add_argument('--base-speed', default='10', help='Vitesses de base, séparées par des virgules')
+    parser.add_argument('--level-multiplier', default='1.5', help='Multiplicateurs de niveau, séparés par des virgules')
+    parser.add_argument('--obstacles-per-level', default='3', help='Obstacles par niveau, séparés par des virgules')
+    parser.add_argument('--max-ticks', type=int, default=10000, help='Durée maximale d\'une partie simulée')
+    parser.add_argument('--workers', type=int, help='Nombre de processus pour --batch')
+    parser.add_argument('--output', metavar='FICHIER', help='Résultats de --batch au format JSONL')
+    parser.add_argument('--watch', action='store_true',
+                        help='Regarder un bot jouer (plateau entier affiché, voir --board et --policy)')
+    parser.add_argument('--board', metavar='LARGEURxHAUTEUR',
+                        help='Taille du plateau en cases (par défaut celle de la fenêtre)')
     args = parser.parse_args()
     
+    # Taille du plateau
+    board_size = (GRID_WIDTH, GRID_HEIGHT)
+    if args.board:
+        try:
+            board_size = tuple(int(value) for value in args.board.lower().split('x'))
+        except ValueError:
+            board_size = ()
+        if len(board_size) != 2 or min(board_size) < 5:
+            parser.error("--board attend une taille LARGEURxHAUTEUR d'au moins 5x5 cases")
+    
     # Exécuter les tests si demandé
     if args.test:
         print("Exécution des tests...")
@@ -34,9 +61,64 @@ def main():
         from tests.run_tests import run_tests
         return run_tests()
     
+    # Simuler un lot de parties
+    if args.batch:
+        import json
+        from src.game.batch_runner import BatchRunner, make_jobs
+        
+        first_seed = args.seed or 0
+        jobs = make_jobs(
+            range(first_seed, first_seed + args.batch),
+            policies=args.policy.split(','),
+            base_speeds=[float(value) for value in args.base_speed.split(',')],
+            level_multipliers=[float(value) for value in args.level_multiplier.split(',')],
+            obstacles_per_level=[int(value) for value in args.obstacles_per_level.split(',')],
+            max_ticks=args.max_ticks,
+            width=board_size[0],
+            height=board_size[1]
+        )
+        stats = BatchRunner(workers=args.workers).run(jobs, output=args.output)
+        print(json.dumps(stats.to_dict(), indent=2))
+        print(f"{stats.games} parties en {stats.duration:.1f} s")
+        return 0
+    
+    # Regarder un bot jouer sur le plateau demandé
+    if args.watch:
+        from src.game.spectator import Spectator
+        
+        Spectator(
+            board_size[0],
+            board_size[1],
+            policy=args.policy.split(',')[0],
+            seed=args.seed,
+            base_speed=float(args.base_speed.split(',')[0]),
+            level_multiplier=float(args.level_multiplier.split(',')[0]),
+            obstacles_per_level=int(args.obstacles_per_level.split(',')[0])
+        ).run()
+        return 0
+    
+    # Rejouer une partie enregistrée
+    if args.replay:
+        from src.game.replay import Replay, ReplayPlayer, BinaryReplayReader, is_binary_replay
+        
+        try:
+            if is_binary_replay(args.replay):
+                # Accès direct par image clé, sans rejouer le début de la partie
+                with BinaryReplayReader(args.replay) as reader:
+                    core = reader.seek(reader.ticks if args.seek is None else args.seek)
+            else:
+                core = ReplayPlayer(Replay.load(args.replay)).play(args.seek)
+        except ValueError as e:
+            parser.error(f"--replay: {e}")
+        print(f"Graine: {core.seed}")
+        print(f"Ticks: {core.tick}")
+        print(f"Score: {core.score.value} | Niveau: {core.level.current_level}")
+        print(f"Fin de partie: {core.death_cause or 'interrompue'}")
+        return 0
+    
     # Sinon, lancer le jeu
     print("Initialisation du jeu Snake...")
-    game = Game(debug_mode=args.debug)
+    game = Game(debug_mode=args.debug, seed=args.seed, record_path=args.record, board_size=board_size)
     game.run()
 
 if __name__ == "__main__":
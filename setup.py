@@ -28,6 +28,9 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=requirements,
+    extras_require={
+        "simulation": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "snake-game=main:main",
@@ -0,0 +1,131 @@
+"""
+Module contenant la classe ArrayRenderer, affichage vectorisé (NumPy) du
+plateau entier pour les très grandes grilles.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est une dépendance optionnelle (simulation)
+    np = None
+
+import pygame
+from src.utils.constants import BLACK, GREEN, DARK_GREEN, GRAY
+from src.game.grid import CellState
+from src.game.food import FoodType, FOOD_COLORS
+
+class ArrayRenderer:
+    """
+    Image du plateau entier à un pixel par case, mise à jour en une seule
+    copie de tableau par frame.
+    
+    L'image est une surface 8 bits à palette dont chaque pixel est l'état
+    (CellState) de sa case: la carte d'occupation de la grille y est copiée
+    telle quelle (pygame.surfarray.blit_array sur une vue NumPy sans copie,
+    ou écriture directe du tampon quand les lignes ont la même largeur), et
+    la palette convertit les états en couleurs lors de la copie à l'écran,
+    après la mise à l'échelle. Le coût d'une frame dépend de la taille du
+    plateau, pas du nombre de segments ou d'obstacles: c'est le mode
+    d'affichage des spectateurs et des simulations sur des plateaux trop
+    grands pour BoardCanvas.
+    """
+    
+    def __init__(self, grid):
+        """
+        Initialise l'image du plateau.
+        
+        Args:
+            grid (Grid): Carte d'occupation à représenter
+        """
+        if np is None:
+            raise ImportError("ArrayRenderer nécessite NumPy (pip install numpy)")
+        
+        self.grid = grid
+        
+        # Vue sans copie sur la grille, dans l'ordre des axes de surfarray (x, y)
+        self.cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width).T
+        
+        # Couleur de chaque état de case (la nourriture dépend de son type)
+        self.palette = [BLACK] * 256
+        self.palette[CellState.BODY] = GREEN
+        self.palette[CellState.HEAD] = DARK_GREEN
+        self.palette[CellState.OBSTACLE] = GRAY
+        self.palette[CellState.FOOD] = FOOD_COLORS[FoodType.NORMAL]
+        self.food_type = FoodType.NORMAL
+        
+        self.surface = pygame.Surface((grid.width, grid.height), 0, 8)
+        self.surface.set_palette(self.palette)
+        
+        # Image mise à l'échelle, réutilisée tant que la zone d'affichage ne change pas
+        self.scaled = None
+    
+    def _set_food_color(self, food_type):
+        """
+        Change la couleur de la nourriture dans la palette.
+        """
+        color = FOOD_COLORS[food_type]
+        self.palette[CellState.FOOD] = color
+        self.surface.set_palette_at(CellState.FOOD, color)
+        if self.scaled is not None:
+            self.scaled.set_palette_at(CellState.FOOD, color)
+        self.food_type = food_type
+    
+    def update(self, food_type=FoodType.NORMAL):
+        """
+        Recopie la carte d'occupation dans l'image du plateau.
+        
+        Args:
+            food_type (FoodType, optional): Type de la nourriture sur le plateau
+        
+        Returns:
+            pygame.Surface: Image du plateau (une case par pixel, 8 bits à palette)
+        """
+        if food_type != self.food_type:
+            self._set_food_color(food_type)
+        
+        if self.surface.get_pitch() == self.grid.width:
+            # Lignes contiguës: la grille a exactement la disposition des
+            # pixels, copiée d'un bloc dans le tampon de la surface
+            with memoryview(self.surface.get_buffer()) as pixels:
+                pixels[:] = self.grid.cells
+        else:
+            pygame.surfarray.blit_array(self.surface, self.cells)
+        return self.surface
+    
+    def fit(self, rect):
+        """
+        Calcule la plus grande zone de même proportion que le plateau, centrée
+        dans une zone de l'écran.
+        
+        Args:
+            rect (pygame.Rect): Zone disponible
+        
+        Returns:
+            pygame.Rect: Zone où afficher le plateau
+        """
+        scale = min(rect.width / self.grid.width, rect.height / self.grid.height)
+        fitted = pygame.Rect(0, 0, max(1, int(self.grid.width * scale)), max(1, int(self.grid.height * scale)))
+        fitted.center = rect.center
+        return fitted
+    
+    def draw(self, screen, rect=None):
+        """
+        Copie l'image du plateau à l'écran, mise à l'échelle de la zone donnée.
+        
+        Args:
+            screen (pygame.Surface): Surface de l'écran
+            rect (pygame.Rect, optional): Zone de destination. Par défaut tout l'écran.
+        
+        Returns:
+            pygame.Rect: Zone modifiée
+        """
+        rect = pygame.Rect(rect) if rect is not None else screen.get_rect()
+        if rect.size == self.surface.get_size():
+            return screen.blit(self.surface, rect)
+        
+        # Mise à l'échelle en 8 bits (un octet par pixel), puis conversion des
+        # couleurs par la palette lors de la copie à l'écran
+        if self.scaled is None or self.scaled.get_size() != rect.size:
+            self.scaled = pygame.Surface(rect.size, 0, 8)
+            self.scaled.set_palette(self.palette)
+        pygame.transform.scale(self.surface, rect.size, self.scaled)
+        return screen.blit(self.scaled, rect)
@@ -0,0 +1,349 @@
+"""
+Module contenant la classe BatchSnakeEnv qui simule de nombreuses parties en parallèle avec NumPy.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est une dépendance optionnelle (simulation)
+    np = None
+
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
+from src.game.grid import CellState
+from src.game.food import FoodType
+from src.game.core import GameCore, DeathCause
+
+# Ordre des actions: identique à celui de l'énumération Direction
+# (UP, DOWN, LEFT, RIGHT); l'opposé d'une action a s'obtient par a ^ 1
+ACTION_DX = (0, 0, -1, 1)
+ACTION_DY = (-1, 1, 0, 0)
+NO_ACTION = -1
+
+# Codes numériques des causes de fin de partie (0 = partie en cours)
+DEATH_CAUSES = (None, DeathCause.OBSTACLE, DeathCause.WALL, DeathCause.SELF, DeathCause.BOARD_FULL)
+_OBSTACLE, _WALL, _SELF, _BOARD_FULL = 1, 2, 3, 4
+
+
+class BatchSnakeEnv:
+    """
+    Environnement vectorisé qui fait avancer N parties indépendantes en même temps.
+    
+    Tout l'état (plateaux, corps, directions, nourriture, niveaux, effets) est
+    stocké dans des tableaux NumPy et chaque tick est calculé par opérations
+    groupées. Les règles sont celles de GameCore (snake.py, food.py, level.py):
+    même ordre des vérifications, mêmes types de nourriture et mêmes effets de
+    vitesse en temps de jeu. Les parties terminées sont relancées
+    automatiquement pour garder un débit constant.
+    """
+    
+    def __init__(self, num_games, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None,
+                 base_speed=10, level_multiplier=1.5, obstacles_per_level=3):
+        """
+        Initialise un lot de parties.
+        
+        Args:
+            num_games (int): Nombre de parties simulées en parallèle
+            width (int, optional): Largeur du plateau en cases. Par défaut GRID_WIDTH.
+            height (int, optional): Hauteur du plateau en cases. Par défaut GRID_HEIGHT.
+            seed (int, optional): Graine du générateur aléatoire.
+            base_speed (int, optional): Vitesse de base du serpent. Par défaut 10.
+            level_multiplier (float, optional): Multiplicateur du score du niveau suivant. Par défaut 1.5.
+            obstacles_per_level (int, optional): Obstacles tentés par niveau. Par défaut 3.
+        """
+        if np is None:
+            raise ImportError("BatchSnakeEnv nécessite NumPy (pip install numpy)")
+        
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.num_cells = width * height
+        self.rng = np.random.default_rng(seed)
+        
+        self.base_speed = base_speed
+        self.level_multiplier = level_multiplier
+        self.obstacles_per_level = obstacles_per_level
+        
+        # Mêmes constantes que Food et GameCore
+        self.food_active_time = 10000
+        self.speed_effect_duration = GameCore.SPEED_EFFECT_DURATION
+        self.points = np.zeros(len(FoodType), dtype=np.int64)
+        self.speed_multipliers = np.ones(len(FoodType))
+        for food_type, points in {
+            FoodType.NORMAL: 10,
+            FoodType.BONUS: 30,
+            FoodType.SPEED: 20,
+            FoodType.SLOW: 5
+        }.items():
+            self.points[food_type.value] = points
+        for food_type, multiplier in GameCore.SPEED_MULTIPLIERS.items():
+            self.speed_multipliers[food_type.value] = multiplier
+        
+        n, c = num_games, self.num_cells
+        self.boards = np.zeros((n, c), dtype=np.uint8)
+        
+        # Corps en tampon circulaire: indices de cases, de la queue vers la tête
+        self.bodies = np.zeros((n, c), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.lengths = np.zeros(n, dtype=np.int64)
+        self.directions = np.zeros(n, dtype=np.int8)
+        self.just_ate = np.zeros(n, dtype=bool)
+        
+        self.food_pos = np.zeros(n, dtype=np.int64)
+        self.food_type = np.zeros(n, dtype=np.int8)
+        self.food_creation_time = np.zeros(n)
+        
+        self.levels = np.zeros(n, dtype=np.int64)
+        self.score_for_next_level = np.zeros(n, dtype=np.int64)
+        self.speeds = np.zeros(n)
+        self.scores = np.zeros(n, dtype=np.int64)
+        
+        self.speed_multiplier = np.ones(n)
+        self.speed_effect_end_time = np.zeros(n)
+        self.times = np.zeros(n)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        
+        # Nombre total de parties terminées (et relancées)
+        self.episodes = 0
+        
+        self.reset()
+    
+    def reset(self, rows=None):
+        """
+        Réinitialise des parties.
+        
+        Args:
+            rows (numpy.ndarray, optional): Indices des parties à relancer. Par défaut toutes.
+        """
+        if rows is None:
+            rows = np.arange(self.num_games)
+        if len(rows) == 0:
+            return
+        
+        self.boards[rows] = CellState.EMPTY
+        
+        # Serpent de 3 segments au centre, vers la droite (comme Snake)
+        cx, cy = self.width // 2, self.height // 2
+        start = cy * self.width + cx
+        self.bodies[rows, 0] = start - 2
+        self.bodies[rows, 1] = start - 1
+        self.bodies[rows, 2] = start
+        self.head_ptr[rows] = 2
+        self.lengths[rows] = 3
+        self.directions[rows] = 3  # RIGHT
+        self.just_ate[rows] = False
+        self.boards[rows, start - 2] = CellState.BODY
+        self.boards[rows, start - 1] = CellState.BODY
+        self.boards[rows, start] = CellState.HEAD
+        
+        self.levels[rows] = 1
+        self.score_for_next_level[rows] = 100
+        self.speeds[rows] = self.base_speed
+        self.scores[rows] = 0
+        
+        self.speed_multiplier[rows] = 1.0
+        self.speed_effect_end_time[rows] = 0
+        self.times[rows] = 0
+        self.ticks[rows] = 0
+        
+        self._respawn_food(rows)
+    
+    def observe(self):
+        """
+        Renvoie les plateaux de toutes les parties.
+        
+        Returns:
+            numpy.ndarray: Tableau (N, hauteur, largeur) des états de cases (CellState)
+        """
+        return self.boards.reshape(self.num_games, self.height, self.width)
+    
+    def head_positions(self):
+        """
+        Renvoie l'indice de case de la tête de chaque serpent.
+        
+        Returns:
+            numpy.ndarray: Indices des têtes (y * largeur + x)
+        """
+        return self.bodies[np.arange(self.num_games), self.head_ptr]
+    
+    def step(self, actions=None):
+        """
+        Exécute un tick dans toutes les parties.
+        
+        Args:
+            actions (numpy.ndarray, optional): Action de chaque partie (indice de
+                direction dans l'ordre UP, DOWN, LEFT, RIGHT, ou NO_ACTION).
+        
+        Returns:
+            tuple: (récompenses, parties terminées, infos). Les récompenses sont
+                   les points gagnés pendant le tick; infos contient le score,
+                   le niveau, le nombre de ticks et la cause de fin des parties
+                   terminées (avant leur relance automatique).
+        """
+        n = self.num_games
+        all_rows = np.arange(n)
+        rewards = np.zeros(n, dtype=np.int64)
+        causes = np.zeros(n, dtype=np.int8)
+        
+        # Changement de direction (les demi-tours sont ignorés)
+        if actions is not None:
+            actions = np.asarray(actions)
+            valid = (actions >= 0) & (actions != (self.directions ^ 1))
+            self.directions[valid] = actions[valid]
+        
+        # Passage au niveau suivant
+        level_up = self.scores >= self.score_for_next_level
+        if level_up.any():
+            self._level_up(np.flatnonzero(level_up))
+        
+        # Expiration des effets de vitesse
+        effect_over = (self.times >= self.speed_effect_end_time) & (self.speed_multiplier != 1.0)
+        self.speed_multiplier[effect_over] = 1.0
+        
+        # Expiration de la nourriture spéciale
+        expired = (self.food_type != FoodType.NORMAL.value) & \
+                  (self.times - self.food_creation_time > self.food_active_time)
+        if expired.any():
+            full = self._respawn_food(np.flatnonzero(expired))
+            causes[full] = _BOARD_FULL
+        
+        # Prochaine position de la tête
+        heads = self.bodies[all_rows, self.head_ptr]
+        hx, hy = heads % self.width, heads // self.width
+        dx = np.array(ACTION_DX)[self.directions]
+        dy = np.array(ACTION_DY)[self.directions]
+        nx, ny = hx + dx, hy + dy
+        in_bounds = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+        next_cells = np.where(in_bounds, ny * self.width + nx, 0)
+        next_states = self.boards[all_rows, next_cells]
+        
+        # Collision avec un obstacle
+        alive = causes == 0
+        hit_obstacle = alive & in_bounds & (next_states == CellState.OBSTACLE)
+        causes[hit_obstacle] = _OBSTACLE
+        alive &= ~hit_obstacle
+        
+        # Nourriture sur la case de la tête
+        eating = alive & (self.food_pos == heads)
+        if eating.any():
+            rows = np.flatnonzero(eating)
+            eaten = self.food_type[rows]
+            self.just_ate[rows] = True
+            rewards[rows] = self.points[eaten]
+            self.scores[rows] += rewards[rows]
+            
+            multipliers = self.speed_multipliers[eaten]
+            special = multipliers != 1.0
+            self.speed_multiplier[rows[special]] = multipliers[special]
+            self.speed_effect_end_time[rows[special]] = self.times[rows[special]] + self.speed_effect_duration
+            
+            full = self._respawn_food(rows)
+            causes[full] = _BOARD_FULL
+            alive[full] = False
+            
+            # La nourriture réapparue peut occuper la case visée
+            next_states = self.boards[all_rows, next_cells]
+        
+        # Collisions avec les murs et avec le corps (la queue compte encore)
+        hit_wall = alive & ~in_bounds
+        causes[hit_wall] = _WALL
+        alive &= ~hit_wall
+        hit_self = alive & ((next_states == CellState.BODY) | (next_states == CellState.HEAD))
+        causes[hit_self] = _SELF
+        alive &= ~hit_self
+        
+        # Déplacement des serpents vivants
+        rows = np.flatnonzero(alive)
+        if len(rows):
+            self.boards[rows, heads[rows]] = CellState.BODY
+            self.boards[rows, next_cells[rows]] = CellState.HEAD
+            self.head_ptr[rows] = (self.head_ptr[rows] + 1) % self.num_cells
+            self.bodies[rows, self.head_ptr[rows]] = next_cells[rows]
+            
+            growing = self.just_ate[rows]
+            shrinking = rows[~growing]
+            tails = self.bodies[shrinking, (self.head_ptr[shrinking] - self.lengths[shrinking]) % self.num_cells]
+            self.boards[shrinking, tails] = CellState.EMPTY
+            self.lengths[rows[growing]] += 1
+            self.just_ate[rows] = False
+            
+            self.times[rows] += 1000.0 / (self.speeds[rows] * self.speed_multiplier[rows])
+        
+        self.ticks += 1
+        
+        # Relance automatique des parties terminées
+        dones = causes != 0
+        info = {
+            "score": self.scores.copy(),
+            "level": self.levels.copy(),
+            "ticks": self.ticks.copy(),
+            "death_cause": causes
+        }
+        if dones.any():
+            done_rows = np.flatnonzero(dones)
+            self.episodes += len(done_rows)
+            self.reset(done_rows)
+        
+        return rewards, dones, info
+    
+    def _level_up(self, rows):
+        """
+        Fait passer des parties au niveau suivant (voir Level.level_up).
+        
+        Args:
+            rows (numpy.ndarray): Indices des parties concernées
+        """
+        self.levels[rows] += 1
+        self.score_for_next_level[rows] = (self.score_for_next_level[rows] * self.level_multiplier).astype(np.int64)
+        self.speeds[rows] = self.base_speed + (self.levels[rows] - 1) * 2
+        
+        # Obstacles à partir du niveau 3, jamais sur une case occupée
+        rows = rows[self.levels[rows] > 2]
+        for _ in range(self.obstacles_per_level):
+            if len(rows) == 0:
+                break
+            xs = self.rng.integers(2, self.width - 2, size=len(rows))
+            ys = self.rng.integers(2, self.height - 2, size=len(rows))
+            cells = ys * self.width + xs
+            free = self.boards[rows, cells] == CellState.EMPTY
+            self.boards[rows[free], cells[free]] = CellState.OBSTACLE
+    
+    def _respawn_food(self, rows):
+        """
+        Replace la nourriture de plusieurs parties sur une case libre tirée uniformément.
+        
+        Args:
+            rows (numpy.ndarray): Indices des parties concernées
+        
+        Returns:
+            numpy.ndarray: Indices des parties dont le plateau est plein
+        """
+        boards = self.boards[rows]
+        free = boards == CellState.EMPTY
+        
+        # Ancienne nourriture encore en place (expiration): sa case est libérée
+        old = self.food_pos[rows]
+        old_is_food = boards[np.arange(len(rows)), old] == CellState.FOOD
+        
+        keys = self.rng.random(free.shape)
+        keys[~free] = -1.0
+        cells = keys.argmax(axis=1)
+        has_free = free.any(axis=1)
+        
+        self.boards[rows[old_is_food], old[old_is_food]] = CellState.EMPTY
+        placed = rows[has_free]
+        self.boards[placed, cells[has_free]] = CellState.FOOD
+        self.food_pos[placed] = cells[has_free]
+        self.food_pos[rows[~has_free]] = -1
+        self.food_creation_time[rows] = self.times[rows]
+        
+        # Type de nourriture selon le niveau (mêmes proportions que Food)
+        levels = self.levels[rows]
+        draws = self.rng.integers(0, np.where(levels >= 3, 100, 90))
+        types = np.select(
+            [draws < 70, draws < 90, draws < 95],
+            [FoodType.NORMAL.value, FoodType.BONUS.value, FoodType.SPEED.value],
+            FoodType.SLOW.value
+        )
+        types[levels < 2] = FoodType.NORMAL.value
+        self.food_type[rows] = types
+        
+        return rows[~has_free]
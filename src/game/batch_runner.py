@@ -0,0 +1,310 @@
+"""
+Module contenant le lanceur de simulations en lot: des milliers de parties
+reproductibles réparties sur plusieurs processus.
+"""
+
+import itertools
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
+from src.game.core import GameCore
+from src.game.bots import POLICIES
+
+# Moteurs réutilisés d'une partie à l'autre dans chaque processus, par taille de plateau
+_worker_cores = {}
+
+def make_jobs(seeds, policies=("greedy",), base_speeds=(10,), level_multipliers=(1.5,),
+              obstacles_per_level=(3,), max_ticks=10000, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """
+    Génère le produit cartésien des graines et des réglages à évaluer.
+    
+    Args:
+        seeds (iterable): Graines des parties
+        policies (iterable, optional): Noms des politiques (voir bots.POLICIES)
+        base_speeds (iterable, optional): Vitesses de base
+        level_multipliers (iterable, optional): Multiplicateurs du score du niveau suivant
+        obstacles_per_level (iterable, optional): Nombres d'obstacles par niveau
+        max_ticks (int, optional): Durée maximale d'une partie en ticks
+        width (int, optional): Largeur du plateau en cases
+        height (int, optional): Hauteur du plateau en cases
+    
+    Returns:
+        iterator: Parties à jouer, sous forme de dictionnaires
+    """
+    for policy in policies:
+        if policy not in POLICIES:
+            raise ValueError(f"Politique inconnue: {policy} (disponibles: {', '.join(POLICIES)})")
+    
+    for seed, policy, base_speed, level_multiplier, obstacles in itertools.product(
+            seeds, policies, base_speeds, level_multipliers, obstacles_per_level):
+        yield {
+            "seed": seed,
+            "policy": policy,
+            "base_speed": base_speed,
+            "level_multiplier": level_multiplier,
+            "obstacles_per_level": obstacles,
+            "max_ticks": max_ticks,
+            "width": width,
+            "height": height
+        }
+
+def run_game(job):
+    """
+    Joue une partie complète sans affichage.
+    
+    Args:
+        job (dict): Partie à jouer (voir make_jobs)
+    
+    Returns:
+        dict: Réglages de la partie complétés par son résultat
+    """
+    size = (job["width"], job["height"])
+    core = _worker_cores.get(size)
+    if core is None:
+        core = _worker_cores[size] = GameCore(job["width"], job["height"], seed=job["seed"])
+    
+    core.base_speed = job["base_speed"]
+    core.level_multiplier = job["level_multiplier"]
+    core.obstacles_per_level = job["obstacles_per_level"]
+    core.reset(job["seed"])
+    
+    policy = POLICIES[job["policy"]]
+    rng = random.Random(job["seed"])
+    max_ticks = job["max_ticks"]
+    while not core.game_over and core.tick < max_ticks:
+        direction = policy(core, rng)
+        if direction is not None:
+            core.change_direction(direction)
+        core.step()
+    
+    result = dict(job)
+    result.update({
+        "score": core.score.value,
+        "level": core.level.current_level,
+        "length": len(core.snake.body),
+        "ticks": core.tick,
+        "death_cause": core.death_cause
+    })
+    return result
+
+def run_games(jobs):
+    """
+    Joue une série de parties (une tâche du pool, pour amortir les échanges
+    entre processus).
+    
+    Args:
+        jobs (list): Parties à jouer
+    
+    Returns:
+        list: Résultats des parties
+    """
+    return [run_game(job) for job in jobs]
+
+
+class RunningStat:
+    """
+    Moyenne, écart type, minimum et maximum calculés au fil de l'eau
+    (algorithme de Welford).
+    """
+    
+    def __init__(self):
+        """
+        Initialise une statistique vide.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        """
+        Ajoute une valeur.
+        
+        Args:
+            value (float): Valeur observée
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def stdev(self):
+        """
+        Renvoie l'écart type de l'échantillon.
+        
+        Returns:
+            float: Écart type (0 avec moins de deux valeurs)
+        """
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+    
+    def to_dict(self):
+        """
+        Résume la statistique.
+        
+        Returns:
+            dict: count, mean, stdev, min et max
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev(),
+            "min": self.min,
+            "max": self.max
+        }
+
+
+class BatchStats:
+    """
+    Statistiques agrégées d'un lot de parties, mises à jour à chaque résultat
+    sans conserver les résultats eux-mêmes.
+    """
+    
+    def __init__(self, score_bin=50):
+        """
+        Initialise des statistiques vides.
+        
+        Args:
+            score_bin (int, optional): Largeur des tranches de l'histogramme des scores. Par défaut 50.
+        """
+        self.score_bin = score_bin
+        self.games = 0
+        self.score = RunningStat()
+        self.ticks = RunningStat()
+        self.score_histogram = Counter()  # Début de tranche de score -> nombre de parties
+        self.levels = Counter()
+        self.death_causes = Counter()
+        self.duration = 0.0  # Durée totale du lot en secondes
+    
+    def add(self, result):
+        """
+        Ajoute le résultat d'une partie.
+        
+        Args:
+            result (dict): Résultat renvoyé par run_game()
+        """
+        self.games += 1
+        self.score.add(result["score"])
+        self.ticks.add(result["ticks"])
+        self.score_histogram[result["score"] // self.score_bin * self.score_bin] += 1
+        self.levels[result["level"]] += 1
+        self.death_causes[result["death_cause"] or "max_ticks"] += 1
+    
+    def to_dict(self):
+        """
+        Résume les statistiques.
+        
+        Returns:
+            dict: Statistiques sérialisables en JSON
+        """
+        return {
+            "games": self.games,
+            "duration": self.duration,
+            "score": self.score.to_dict(),
+            "ticks": self.ticks.to_dict(),
+            "score_histogram": dict(sorted(self.score_histogram.items())),
+            "levels": dict(sorted(self.levels.items())),
+            "death_causes": dict(self.death_causes.most_common())
+        }
+
+
+class BatchRunner:
+    """
+    Répartit des parties sur un pool de processus réutilisés.
+    
+    Les parties sont envoyées par paquets (chunk_size) pour amortir le coût des
+    échanges entre processus, et le nombre de paquets en cours est borné: la
+    mémoire reste constante quel que soit le nombre de parties. Les résultats
+    sont traités dans leur ordre d'arrivée.
+    """
+    
+    def __init__(self, workers=None, chunk_size=32):
+        """
+        Initialise un nouveau lanceur.
+        
+        Args:
+            workers (int, optional): Nombre de processus. Par défaut le nombre de cœurs;
+                                     1 joue les parties dans le processus courant.
+            chunk_size (int, optional): Nombre de parties par tâche. Par défaut 32.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+    
+    def _chunks(self, jobs):
+        """
+        Découpe les parties en paquets.
+        """
+        jobs = iter(jobs)
+        while True:
+            chunk = list(itertools.islice(jobs, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def iter_results(self, jobs):
+        """
+        Joue les parties et renvoie les résultats au fur et à mesure.
+        
+        Args:
+            jobs (iterable): Parties à jouer (voir make_jobs)
+        
+        Returns:
+            iterator: Résultats des parties, dans leur ordre d'arrivée
+        """
+        chunks = self._chunks(jobs)
+        
+        if self.workers == 1:
+            for chunk in chunks:
+                yield from run_games(chunk)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for chunk in itertools.islice(chunks, self.workers * 2):
+                pending.add(executor.submit(run_games, chunk))
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Relancer un paquet avant de traiter les résultats
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.add(executor.submit(run_games, chunk))
+                    yield from future.result()
+    
+    def run(self, jobs, output=None, progress=None):
+        """
+        Joue les parties et agrège leurs résultats.
+        
+        Args:
+            jobs (iterable): Parties à jouer (voir make_jobs)
+            output (str, optional): Fichier JSONL où écrire un résultat par ligne
+            progress (callable, optional): Fonction appelée avec (parties jouées, BatchStats)
+                                           après chaque résultat
+        
+        Returns:
+            BatchStats: Statistiques agrégées
+        """
+        stats = BatchStats()
+        start_time = time.perf_counter()
+        
+        output_file = open(output, 'w') if output else None
+        try:
+            for result in self.iter_results(jobs):
+                stats.add(result)
+                if output_file is not None:
+                    output_file.write(json.dumps(result) + "\n")
+                if progress is not None:
+                    progress(stats.games, stats)
+        finally:
+            if output_file is not None:
+                output_file.close()
+        
+        stats.duration = time.perf_counter() - start_time
+        return stats
@@ -0,0 +1,126 @@
+"""
+Module contenant les politiques de jeu automatiques (bots) utilisées pour les
+simulations sans affichage.
+
+Une politique est une fonction policy(core, rng) qui renvoie la Direction à
+prendre au prochain tick, ou None pour garder la direction courante.
+"""
+
+from src.game.snake import Direction
+from src.game.grid import BLOCKING_STATES
+
+def _safe_moves(core):
+    """
+    Renvoie les déplacements qui ne provoquent pas de collision immédiate.
+    
+    Args:
+        core (GameCore): Moteur de jeu
+    
+    Returns:
+        list: Liste de (Direction, position cible)
+    """
+    head_x, head_y = core.snake.get_head_position()
+    current = core.snake.direction.value
+    moves = []
+    for direction in Direction:
+        dx, dy = direction.value
+        # Le demi-tour est refusé par Snake.change_direction
+        if (dx, dy) == (-current[0], -current[1]):
+            continue
+        target = (head_x + dx, head_y + dy)
+        if not core.grid.is_blocked(target):
+            moves.append((direction, target))
+    return moves
+
+def _distance_to_food(core, position):
+    """
+    Renvoie la distance de Manhattan entre une position et la nourriture.
+    """
+    if core.food.position is None:
+        return 0
+    return abs(position[0] - core.food.position[0]) + abs(position[1] - core.food.position[1])
+
+def _reachable_area(core, start, limit):
+    """
+    Compte les cases libres accessibles depuis une position (parcours en largeur
+    sur les indices de la grille, sans passer par des tuples).
+    
+    Args:
+        core (GameCore): Moteur de jeu
+        start (tuple): Position de départ (libre)
+        limit (int): Nombre de cases au-delà duquel le parcours s'arrête
+    
+    Returns:
+        int: Nombre de cases accessibles, borné par limit
+    """
+    grid = core.grid
+    width = grid.width
+    cells = grid.cells
+    size = len(cells)
+    start_index = start[1] * width + start[0]
+    
+    seen = bytearray(size)
+    seen[start_index] = 1
+    queue = [start_index]
+    count = 1
+    for index in queue:
+        if count >= limit:
+            break
+        x = index % width
+        for neighbor, valid in (
+            (index - width, index >= width),
+            (index + width, index + width < size),
+            (index - 1, x > 0),
+            (index + 1, x < width - 1)
+        ):
+            if valid and not seen[neighbor] and cells[neighbor] not in BLOCKING_STATES:
+                seen[neighbor] = 1
+                queue.append(neighbor)
+                count += 1
+    return count
+
+def random_policy(core, rng):
+    """
+    Choisit au hasard parmi les déplacements sans collision immédiate.
+    """
+    moves = _safe_moves(core)
+    return rng.choice(moves)[0] if moves else None
+
+def greedy_policy(core, rng):
+    """
+    Se rapproche de la nourriture en évitant les collisions immédiates.
+    """
+    moves = _safe_moves(core)
+    if not moves:
+        return None
+    return min(moves, key=lambda move: (_distance_to_food(core, move[1]), rng.random()))[0]
+
+def cautious_policy(core, rng):
+    """
+    Comme greedy_policy, mais évite de s'enfermer dans une zone plus petite
+    que le serpent.
+    """
+    moves = _safe_moves(core)
+    if not moves:
+        return None
+    
+    moves.sort(key=lambda move: (_distance_to_food(core, move[1]), rng.random()))
+    length = len(core.snake.body)
+    best_move, best_area = None, -1
+    for move in moves:
+        # Le premier déplacement (le plus proche de la nourriture) qui laisse
+        # assez de place est retenu sans examiner les suivants
+        area = _reachable_area(core, move[1], length + 1)
+        if area > length:
+            return move[0]
+        if area > best_area:
+            best_move, best_area = move, area
+    return best_move[0]
+
+
+# Politiques disponibles par nom (ligne de commande, simulations en lot)
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "cautious": cautious_policy
+}
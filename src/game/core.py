@@ -0,0 +1,396 @@
+"""
+Module contenant la classe GameCore, le moteur de règles du jeu Snake sans affichage.
+"""
+
+import random
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
+from collections import deque
+from src.game.grid import Grid
+from src.game.snake import Snake
+from src.game.food import Food, FoodType
+from src.game.score import Score
+from src.game.level import Level, Obstacle
+
+class CoreEvent:
+    """
+    Énumération des événements produits par un pas de simulation.
+    """
+    LEVEL_UP = "level_up"
+    SPEED_EFFECT_END = "speed_effect_end"
+    FOOD_EXPIRED = "food_expired"
+    ATE = "ate"
+    DIED = "died"
+
+
+class DeathCause:
+    """
+    Énumération des causes de fin de partie.
+    """
+    OBSTACLE = "obstacle"
+    WALL = "wall"
+    SELF = "self"
+    BOARD_FULL = "board_full"
+
+
+class GameCore:
+    """
+    Moteur de règles du jeu, indépendant de l'affichage, des polices, du mixer
+    et de l'horloge murale.
+    
+    Le temps est logique: chaque appel à step() correspond à un déplacement du
+    serpent et fait avancer l'horloge interne de la durée d'un tick à la vitesse
+    courante. La classe Game n'est qu'une interface graphique au-dessus.
+    
+    Chaque partie possède sa graine et ses propres générateurs aléatoires
+    (nourriture et obstacles): une même graine et les mêmes changements de
+    direction aux mêmes ticks donnent exactement la même partie.
+    """
+    
+    SPEED_EFFECT_DURATION = 5000  # Durée des effets de vitesse (ms de jeu)
+    SPEED_MULTIPLIERS = {
+        FoodType.SPEED: 1.5,
+        FoodType.SLOW: 0.75
+    }
+    
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None,
+                 base_speed=10, level_multiplier=1.5, obstacles_per_level=3):
+        """
+        Initialise un nouveau moteur de jeu.
+        
+        Args:
+            width (int, optional): Largeur du plateau en cases. Par défaut GRID_WIDTH.
+            height (int, optional): Hauteur du plateau en cases. Par défaut GRID_HEIGHT.
+            seed (int, optional): Graine de la première partie. Par défaut tirée au hasard.
+            base_speed (int, optional): Vitesse de base du serpent. Par défaut 10.
+            level_multiplier (float, optional): Multiplicateur du score du niveau suivant. Par défaut 1.5.
+            obstacles_per_level (int, optional): Obstacles ajoutés par niveau. Par défaut 3.
+        """
+        self.grid = Grid(width, height)
+        
+        # Réglages de difficulté, appliqués à chaque nouvelle partie
+        self.base_speed = base_speed
+        self.level_multiplier = level_multiplier
+        self.obstacles_per_level = obstacles_per_level
+        
+        # Enregistreur de partie optionnel (voir ReplayRecorder)
+        self.recorder = None
+        
+        self.reset(seed)
+    
+    def reset(self, seed=None):
+        """
+        Réinitialise la partie (la grille est réutilisée).
+        
+        Args:
+            seed (int, optional): Graine de la nouvelle partie. Par défaut tirée au hasard.
+        """
+        self.grid.clear()
+        
+        # Graine et flux aléatoires séparés pour la nourriture et les obstacles
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed
+        master_rng = random.Random(seed)
+        self.food_rng = random.Random(master_rng.getrandbits(64))
+        self.obstacle_rng = random.Random(master_rng.getrandbits(64))
+        
+        # Horloge logique (ms) et compteur de ticks
+        self.time = 0.0
+        self.tick = 0
+        
+        self.level = Level(
+            grid=self.grid,
+            rng=self.obstacle_rng,
+            base_speed=self.base_speed,
+            level_multiplier=self.level_multiplier,
+            obstacles_per_level=self.obstacles_per_level
+        )
+        self.snake = Snake(grid=self.grid)
+        self.food = Food(
+            self.snake.body,
+            level=self.level.current_level,
+            grid=self.grid,
+            clock=self.get_time,
+            rng=self.food_rng
+        )
+        self.score = Score()
+        
+        # Effets temporaires
+        self.speed_multiplier = 1.0
+        self.speed_effect_end_time = 0
+        
+        # État de fin de partie
+        self.game_over = False
+        self.death_cause = None
+        self.death_position = None
+        
+        # Type de la dernière nourriture mangée
+        self.last_eaten_type = None
+        
+        if self.recorder is not None:
+            self.recorder.start(self)
+    
+    def get_settings(self):
+        """
+        Renvoie les réglages de difficulté du moteur.
+        
+        Returns:
+            dict: base_speed, level_multiplier et obstacles_per_level
+        """
+        return {
+            "base_speed": self.base_speed,
+            "level_multiplier": self.level_multiplier,
+            "obstacles_per_level": self.obstacles_per_level
+        }
+    
+    def get_time(self):
+        """
+        Renvoie le temps logique de la partie.
+        
+        Returns:
+            float: Temps écoulé en millisecondes de jeu
+        """
+        return self.time
+    
+    def get_current_speed(self):
+        """
+        Renvoie la vitesse actuelle du serpent, effets compris.
+        
+        Returns:
+            float: Vitesse en cases par seconde
+        """
+        return self.level.get_current_speed() * self.speed_multiplier
+    
+    def get_tick_duration(self):
+        """
+        Renvoie la durée d'un tick à la vitesse actuelle.
+        
+        Returns:
+            float: Durée en millisecondes
+        """
+        return 1000.0 / self.get_current_speed()
+    
+    def is_speed_effect_active(self):
+        """
+        Indique si un effet de vitesse est en cours.
+        
+        Returns:
+            bool: True si la vitesse est modifiée par un effet
+        """
+        return self.speed_multiplier != 1.0
+    
+    def change_direction(self, direction):
+        """
+        Transmet une demande de changement de direction au serpent.
+        
+        Args:
+            direction (Direction): La nouvelle direction souhaitée
+        """
+        previous_direction = self.snake.direction
+        self.snake.change_direction(direction)
+        
+        # Seuls les changements effectifs sont enregistrés
+        if self.recorder is not None and self.snake.direction != previous_direction:
+            self.recorder.record(self.tick, direction)
+    
+    def get_state(self):
+        """
+        Capture l'état complet de la partie, générateurs aléatoires compris.
+        
+        Returns:
+            dict: État sérialisable (valeurs Python simples)
+        """
+        level = self.level
+        food = self.food
+        return {
+            "seed": self.seed,
+            "tick": self.tick,
+            "time": self.time,
+            "speed_multiplier": self.speed_multiplier,
+            "speed_effect_end_time": self.speed_effect_end_time,
+            "game_over": self.game_over,
+            "death_cause": self.death_cause,
+            "death_position": self.death_position,
+            "last_eaten_type": self.last_eaten_type,
+            "food_rng": self.food_rng.getstate(),
+            "obstacle_rng": self.obstacle_rng.getstate(),
+            "snake_body": list(self.snake.body),
+            "snake_direction": self.snake.direction,
+            "snake_just_ate": self.snake.just_ate,
+            "snake_alive": self.snake.alive,
+            "food_position": food.position,
+            "food_type": food.type,
+            "food_level": food.level,
+            "food_creation_time": food.creation_time,
+            "food_active_time": food.active_time,
+            "level": level.current_level,
+            "score_for_next_level": level.score_for_next_level,
+            "level_multiplier": level.level_multiplier,
+            "base_speed": level.base_speed,
+            "current_speed": level.current_speed,
+            "obstacles_per_level": level.obstacles_per_level,
+            "obstacles": [obstacle.position for obstacle in level.obstacles],
+            "score": self.score.value,
+            "grid": self.grid.get_state()
+        }
+    
+    def set_state(self, state):
+        """
+        Restaure un état capturé par get_state() (même taille de plateau).
+        
+        Args:
+            state (dict): État à restaurer
+        """
+        self.seed = state["seed"]
+        self.tick = state["tick"]
+        self.time = state["time"]
+        self.speed_multiplier = state["speed_multiplier"]
+        self.speed_effect_end_time = state["speed_effect_end_time"]
+        self.game_over = state["game_over"]
+        self.death_cause = state["death_cause"]
+        self.death_position = state["death_position"]
+        self.last_eaten_type = state["last_eaten_type"]
+        self.food_rng.setstate(state["food_rng"])
+        self.obstacle_rng.setstate(state["obstacle_rng"])
+        
+        # Les objets sont restaurés sans passer par la grille, rétablie en dernier
+        snake = self.snake
+        snake.body = deque(state["snake_body"])
+        snake.occupied = set(snake.body)
+        snake.direction = state["snake_direction"]
+        snake.just_ate = state["snake_just_ate"]
+        snake.alive = state["snake_alive"]
+        
+        food = self.food
+        food.position = state["food_position"]
+        food.type = state["food_type"]
+        food.level = state["food_level"]
+        food.creation_time = state["food_creation_time"]
+        food.active_time = state["food_active_time"]
+        
+        level = self.level
+        level.current_level = state["level"]
+        level.score_for_next_level = state["score_for_next_level"]
+        level.level_multiplier = state["level_multiplier"]
+        level.base_speed = state["base_speed"]
+        level.current_speed = state["current_speed"]
+        level.obstacles_per_level = state["obstacles_per_level"]
+        level.clear_obstacles()
+        for position in state["obstacles"]:
+            level.obstacles.append(Obstacle(position))
+            level.obstacle_positions.add(position)
+        
+        self.score.value = state["score"]
+        self.grid.set_state(state["grid"])
+    
+    def step(self, action=None):
+        """
+        Exécute un tick de simulation.
+        
+        Args:
+            action (Direction, optional): Direction à appliquer avant le déplacement.
+        
+        Returns:
+            list: Événements (CoreEvent) survenus pendant le tick
+        """
+        if self.game_over:
+            return []
+        
+        if action is not None:
+            self.change_direction(action)
+        
+        events = self._run_tick()
+        
+        if self.recorder is not None:
+            self.recorder.on_tick(self)
+        return events
+    
+    def _run_tick(self):
+        """
+        Applique les règles du jeu pour un tick.
+        
+        Returns:
+            list: Événements (CoreEvent) survenus pendant le tick
+        """
+        events = []
+        
+        # Vérifier le passage au niveau suivant
+        if self.level.check_level_up(self.score.value):
+            events.append(CoreEvent.LEVEL_UP)
+        
+        # Vérifier l'expiration des effets temporaires
+        if self.time >= self.speed_effect_end_time and self.speed_multiplier != 1.0:
+            self.speed_multiplier = 1.0
+            events.append(CoreEvent.SPEED_EFFECT_END)
+        
+        # Vérifier l'expiration de la nourriture spéciale
+        if self.food.should_expire():
+            events.append(CoreEvent.FOOD_EXPIRED)
+            if not self._respawn_food():
+                return self._end(events, DeathCause.BOARD_FULL)
+        
+        # Vérifier si le serpent se heurte à un obstacle
+        next_head_pos = self.snake.get_next_head_position()
+        if self.level.check_obstacle_collision(next_head_pos):
+            self.death_position = next_head_pos
+            return self._end(events, DeathCause.OBSTACLE)
+        
+        # Vérifier si le serpent a mangé de la nourriture
+        if self.food.is_collision(self.snake.get_head_position()):
+            self.snake.grow()
+            self.last_eaten_type = self.food.type
+            events.append(CoreEvent.ATE)
+            
+            # Traiter les effets spéciaux de la nourriture
+            if self.food.type in self.SPEED_MULTIPLIERS:
+                self.speed_multiplier = self.SPEED_MULTIPLIERS[self.food.type]
+                self.speed_effect_end_time = self.time + self.SPEED_EFFECT_DURATION
+            
+            # Augmenter le score selon le type de nourriture
+            self.score.increase(self.food.get_points())
+            
+            # Générer une nouvelle nourriture
+            if not self._respawn_food():
+                return self._end(events, DeathCause.BOARD_FULL)
+        
+        # Déplacer le serpent
+        if not self.snake.move():
+            self.death_position = next_head_pos
+            if self.grid.in_bounds(next_head_pos):
+                return self._end(events, DeathCause.SELF)
+            return self._end(events, DeathCause.WALL)
+        
+        # Avancer l'horloge logique
+        self.time += self.get_tick_duration()
+        self.tick += 1
+        return events
+    
+    def _respawn_food(self):
+        """
+        Replace la nourriture sur une case libre.
+        
+        Returns:
+            bool: True si la nourriture a été placée, False si le plateau est plein
+        """
+        return self.food.respawn(
+            self.snake.body,
+            self.level.obstacles,
+            self.level.current_level
+        )
+    
+    def _end(self, events, cause):
+        """
+        Termine la partie.
+        
+        Args:
+            events (list): Événements du tick en cours
+            cause (str): Cause de la fin de partie (DeathCause)
+        
+        Returns:
+            list: Événements du tick, complétés par CoreEvent.DIED
+        """
+        self.game_over = True
+        self.death_cause = cause
+        self.tick += 1
+        events.append(CoreEvent.DIED)
+        return events
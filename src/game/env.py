@@ -0,0 +1,119 @@
+"""
+Module contenant la classe SnakeEnv, interface d'apprentissage (reset/step) à
+la manière de Gymnasium au-dessus de GameCore.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est une dépendance optionnelle (simulation)
+    np = None
+
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
+from src.game.snake import Direction
+from src.game.core import GameCore, CoreEvent
+from src.game.batch_env import NO_ACTION
+
+# Actions: indices de direction dans l'ordre de l'énumération Direction
+# (UP, DOWN, LEFT, RIGHT), comme pour BatchSnakeEnv
+ACTIONS = tuple(Direction)
+
+
+class SnakeEnv:
+    """
+    Environnement à une partie: reset() renvoie (observation, info) et step()
+    renvoie (observation, récompense, terminé, tronqué, info).
+    
+    L'observation est une vue NumPy (hauteur, largeur) sur la carte
+    d'occupation de la grille (CellState), que les objets du jeu mettent à
+    jour en place à chaque tick: aucun tableau n'est alloué ni copié par pas.
+    Elle reste donc valable d'un appel à l'autre, mais il faut la copier pour
+    conserver un état passé. Le dictionnaire info est lui aussi réutilisé.
+    
+    Les actions passent par Snake.change_direction (un demi-tour est ignoré),
+    la récompense est le nombre de points de la nourriture mangée
+    (Food.get_points) et la partie se termine sur les collisions de GameCore.
+    """
+    
+    num_actions = len(ACTIONS)
+    
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, max_steps=None, death_reward=-10.0, **settings):
+        """
+        Initialise un nouvel environnement.
+        
+        Args:
+            width (int, optional): Largeur du plateau en cases. Par défaut GRID_WIDTH.
+            height (int, optional): Hauteur du plateau en cases. Par défaut GRID_HEIGHT.
+            max_steps (int, optional): Nombre de pas avant troncature. Par défaut illimité.
+            death_reward (float, optional): Récompense d'une fin de partie. Par défaut -10.
+            **settings: Réglages de difficulté transmis à GameCore (base_speed,
+                        level_multiplier, obstacles_per_level).
+        """
+        if np is None:
+            raise ImportError("SnakeEnv nécessite NumPy (pip install numpy)")
+        
+        self.core = GameCore(width, height, **settings)
+        self.max_steps = max_steps
+        self.death_reward = death_reward
+        self.steps = 0
+        
+        # Vue sans copie sur la grille: la grille est réutilisée par GameCore.reset
+        self.observation = np.frombuffer(self.core.grid.cells, dtype=np.uint8).reshape(height, width)
+        self.observation.flags.writeable = False
+        
+        self.observation_shape = self.observation.shape
+        self.info = {}
+    
+    def _update_info(self):
+        """
+        Met à jour le dictionnaire info réutilisé.
+        """
+        core = self.core
+        info = self.info
+        info["score"] = core.score.value
+        info["level"] = core.level.current_level
+        info["length"] = len(core.snake.body)
+        info["tick"] = core.tick
+        info["death_cause"] = core.death_cause
+        return info
+    
+    def reset(self, seed=None):
+        """
+        Commence une nouvelle partie.
+        
+        Args:
+            seed (int, optional): Graine de la partie. Par défaut tirée au hasard.
+        
+        Returns:
+            tuple: (observation, info)
+        """
+        self.core.reset(seed)
+        self.steps = 0
+        return self.observation, self._update_info()
+    
+    def step(self, action):
+        """
+        Exécute un tick.
+        
+        Args:
+            action (int): Indice de direction (voir ACTIONS), ou NO_ACTION
+                          (ou None) pour garder la direction courante.
+        
+        Returns:
+            tuple: (observation, récompense, terminé, tronqué, info)
+        """
+        core = self.core
+        if core.game_over:
+            raise RuntimeError("La partie est terminée: appeler reset()")
+        
+        if action is not None and action != NO_ACTION:
+            core.change_direction(ACTIONS[action])
+        
+        score = core.score.value
+        events = core.step()
+        reward = core.score.value - score
+        if CoreEvent.DIED in events:
+            reward += self.death_reward
+        
+        self.steps += 1
+        truncated = self.max_steps is not None and self.steps >= self.max_steps and not core.game_over
+        return self.observation, reward, core.game_over, truncated, self._update_info()
@@ -6,8 +6,9 @@ import pygame
 import random
 from enum import Enum
 from src.utils.constants import (
-    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, RED, GREEN, BLUE, WHITE
+    GRID_WIDTH, GRID_HEIGHT, RED, GREEN, BLUE, GOLD
 )
+from src.game.grid import CellState
 
 class FoodType(Enum):
     """
@@ -19,12 +20,21 @@ class FoodType(Enum):
     SLOW = 3    # Malus de vitesse (pomme verte) - serpent plus lent temporairement
 
 
+# Couleur de chaque type de nourriture
+FOOD_COLORS = {
+    FoodType.NORMAL: RED,
+    FoodType.BONUS: GOLD,  # Or
+    FoodType.SPEED: BLUE,
+    FoodType.SLOW: GREEN
+}
+
+
 class Food:
     """
     Classe représentant la nourriture (pomme) que le serpent peut manger.
     """
     
-    def __init__(self, snake_body=None, level=1):
+    def __init__(self, snake_body=None, level=1, grid=None, clock=None, rng=None):
         """
         Initialise une nouvelle nourriture à une position aléatoire.
         
@@ -32,11 +42,26 @@ class Food:
             snake_body (list, optional): Liste des positions du corps du serpent pour éviter
                                         que la nourriture n'apparaisse sur le serpent.
             level (int, optional): Niveau actuel pour déterminer les types de nourriture disponibles.
-        """
+            grid (Grid, optional): Carte d'occupation partagée. Si elle est fournie, elle sert
+                                   à éviter le serpent et les obstacles et est tenue à jour.
+            clock (callable, optional): Fonction renvoyant le temps courant en millisecondes,
+                                        utilisée pour l'expiration et la pulsation. Par défaut
+                                        pygame.time.get_ticks.
+            rng (random.Random, optional): Générateur aléatoire dédié (parties reproductibles).
+                                           Par défaut le module random.
+        """
+        self.rng = rng if rng is not None else random
+        self.grid = grid
+        self.clock = clock if clock is not None else pygame.time.get_ticks
+        self.width = grid.width if grid is not None else GRID_WIDTH
+        self.height = grid.height if grid is not None else GRID_HEIGHT
+        
         self.level = level
-        self.position = self._generate_random_position(snake_body)
+        self.position = None
+        self.max_random_attempts = 64  # Tirages avec rejet avant l'énumération des cases libres
+        self._place(self._generate_random_position(snake_body))
         self.type = self._get_random_type()
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = self.clock()
         self.active_time = 10000  # Temps pendant lequel la nourriture reste active (10 sec)
         
         # Points attribués pour chaque type de nourriture
@@ -68,7 +93,7 @@ class Food:
             choices.extend([FoodType.SPEED] * 5)  # 5% de bonus de vitesse
             choices.extend([FoodType.SLOW] * 5)   # 5% de malus de vitesse
         
-        return random.choice(choices)
+        return self.rng.choice(choices)
     
     def _generate_random_position(self, snake_body=None, obstacles=None):
         """
@@ -77,24 +102,35 @@ class Food:
         Args:
             snake_body (list, optional): Liste des positions du corps du serpent.
             obstacles (list, optional): Liste des obstacles.
-            
+        
         Returns:
-            tuple: (x, y) coordonnées de la nouvelle position
-        """
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            # Vérifier que la position n'est pas sur le serpent
-            if snake_body is not None and (x, y) in snake_body:
-                continue
-            
-            # Vérifier que la position n'est pas sur un obstacle
-            if obstacles is not None:
-                if any(obs.position == (x, y) for obs in obstacles):
-                    continue
-            
-            return (x, y)
+            tuple or None: (x, y) coordonnées de la nouvelle position, ou None si le plateau est plein
+        """
+        # Avec une grille partagée, tirage direct dans l'index des cases libres
+        if self.grid is not None:
+            return self.grid.random_free_cell(self.rng)
+        
+        # Sinon, tirage avec rejet, borné pour ne pas boucler sur un plateau (presque) plein
+        occupied = set(snake_body) if snake_body is not None else set()
+        if obstacles is not None:
+            occupied.update(obs.position for obs in obstacles)
+        
+        for _ in range(self.max_random_attempts):
+            x = self.rng.randint(0, self.width - 1)
+            y = self.rng.randint(0, self.height - 1)
+            if (x, y) not in occupied:
+                return (x, y)
+        
+        # Repli: énumérer les cases libres restantes
+        free_cells = [
+            (x, y)
+            for y in range(self.height)
+            for x in range(self.width)
+            if (x, y) not in occupied
+        ]
+        if not free_cells:
+            return None
+        return self.rng.choice(free_cells)
     
     def is_collision(self, position):
         """
@@ -102,7 +138,7 @@ class Food:
         
         Args:
             position (tuple): Position (x, y) à vérifier
-            
+        
         Returns:
             bool: True s'il y a une collision, False sinon
         """
@@ -118,7 +154,7 @@ class Food:
         if self.type == FoodType.NORMAL:
             return False
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock()
         return current_time - self.creation_time > self.active_time
     
     def get_points(self):
@@ -138,53 +174,54 @@ class Food:
             snake_body (list): Liste des positions du corps du serpent
             obstacles (list, optional): Liste des obstacles.
             level (int, optional): Niveau actuel pour déterminer les types de nourriture disponibles.
+        
+        Returns:
+            bool: True si la nourriture a été placée, False si le plateau est plein
         """
         if level is not None:
             self.level = level
         
-        self.position = self._generate_random_position(snake_body, obstacles)
+        self._place(self._generate_random_position(snake_body, obstacles))
         self.type = self._get_random_type()
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = self.clock()
+        return self.position is not None
     
-    def draw(self, screen):
+    def _place(self, position):
+        """
+        Déplace la nourriture et met à jour la grille partagée.
+        
+        Args:
+            position (tuple or None): Nouvelle position (x, y), None si le plateau est plein
+        """
+        if self.grid is not None:
+            # La case n'est libérée que si le serpent ne l'occupe pas déjà
+            if self.position is not None and self.grid.get(self.position) == CellState.FOOD:
+                self.grid.set(self.position, CellState.EMPTY)
+            if position is not None:
+                self.grid.set(position, CellState.FOOD)
+        self.position = position
+    
+    def draw(self, screen, atlas, origin=(0, 0)):
         """
         Dessine la nourriture sur l'écran.
         
         Args:
             screen (pygame.Surface): Surface de l'écran
+            atlas (SpriteAtlas): Tuiles pré-rendues
+            origin (tuple, optional): Case du plateau affichée en haut à gauche de l'écran.
+                                      Par défaut (0, 0).
         """
-        x, y = self.position
-        
-        # Dessiner un cercle pour la nourriture
-        rect = pygame.Rect(
-            x * GRID_SIZE, 
-            y * GRID_SIZE, 
-            GRID_SIZE, 
-            GRID_SIZE
-        )
+        if self.position is None:
+            return
         
-        # Centre et rayon du cercle
-        center = rect.center
-        radius = GRID_SIZE // 2 - 2
+        x = self.position[0] - origin[0]
+        y = self.position[1] - origin[1]
         
-        # Couleur selon le type
-        if self.type == FoodType.NORMAL:
-            color = RED
-        elif self.type == FoodType.BONUS:
-            color = (255, 215, 0)  # Or
-        elif self.type == FoodType.SPEED:
-            color = BLUE
-        elif self.type == FoodType.SLOW:
-            color = GREEN
-        
-        pygame.draw.circle(screen, color, center, radius)
-        
-        # Pour les types spéciaux, ajouter un effet visuel (pulsation ou brillance)
+        # Pour les types spéciaux, effet de pulsation basé sur le temps du
+        # jeu (identique à la relecture, figé pendant la pause)
+        pulse = None
         if self.type != FoodType.NORMAL:
-            # Effet de pulsation basé sur le temps
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock()
             pulse = abs(((current_time - self.creation_time) % 1000) - 500) / 500  # Valeur entre 0 et 1
-            
-            # Dessiner un cercle intérieur
-            inner_radius = int(radius * (0.5 + pulse * 0.2))
-            pygame.draw.circle(screen, WHITE, center, inner_radius)
+        
+        screen.blit(atlas.food_tile(self.type, pulse), (x * atlas.cell_size, y * atlas.cell_size))
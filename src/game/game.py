@@ -8,19 +8,26 @@ import time
 import logging
 from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, 
-    FPS, GAME_TITLE, SNAKE_SPEED
+    FPS, GAME_TITLE, SNAKE_SPEED, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, DIRTY_RECT_UPDATES,
+    IDLE_WAIT_TIMEOUT, IDLE_ANIMATION_FPS, SCALED_DISPLAY, MAX_PITCH_SEMITONES
 )
-from src.game.snake import Snake, Direction
-from src.game.food import Food, FoodType
-from src.game.score import Score
-from src.game.level import Level
+from src.game.snake import Direction
+from src.game.food import FoodType
+from src.game.core import GameCore, CoreEvent, DeathCause
+from src.game.scheduler import TickScheduler
+from src.game.replay import create_recorder
+from src.game.renderer import DirtyRectTracker, BoardCanvas, Camera
+from src.game.sprites import SpriteAtlas
 from src.ui.menu import Menu, MenuOption
 from src.ui.game_over import GameOverScreen, GameOverOption
 from src.ui.highscore_screen import HighScoreScreen, HighScoreScreenOption
 from src.ui.sound_options import SoundOptions, SoundOptionAction
 from src.utils.highscore import HighScore
-from src.utils.sound_manager import SoundManager, SoundEffect
+from src.utils.sound_manager import SoundEffect
+from src.utils.sound_queue import create_sound_manager
 from src.utils.logger import Logger
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class GameState:
     """
@@ -40,12 +47,18 @@ class Game:
     Classe principale du jeu qui gère le cycle de vie et les états du jeu.
     """
     
-    def __init__(self, debug_mode=False):
+    def __init__(self, debug_mode=False, seed=None, record_path=None, board_size=None):
         """
         Initialise une nouvelle instance du jeu.
         
         Args:
             debug_mode (bool, optional): Indique si le mode débogage est activé. Par défaut False.
+            seed (int, optional): Graine utilisée pour chaque partie. Par défaut une graine
+                                  aléatoire différente à chaque partie.
+            record_path (str, optional): Fichier où enregistrer la dernière partie jouée.
+            board_size (tuple, optional): Taille (largeur, hauteur) du plateau en cases.
+                                          Par défaut celle de la fenêtre; un plateau plus
+                                          grand défile avec la tête du serpent.
         """
         # Initialisation du logger
         log_level = logging.DEBUG if debug_mode else logging.INFO
@@ -55,14 +68,24 @@ class Game:
         # Initialisation de Pygame
         pygame.init()
         
-        # Création de la fenêtre
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Création de la fenêtre; en mode mis à l'échelle, SDL agrandit l'image
+        # (WINDOW_WIDTH x WINDOW_HEIGHT) à la taille de la fenêtre ou de l'écran
+        self.scaled_display = SCALED_DISPLAY
+        flags = pygame.SCALED | pygame.RESIZABLE if self.scaled_display else 0
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), flags)
         pygame.display.set_caption(GAME_TITLE)
         self.logger.info(f"Fenêtre créée ({WINDOW_WIDTH}x{WINDOW_HEIGHT})")
         
+        # Tuiles du plateau, dessinées une fois au format de l'écran
+        self.atlas = SpriteAtlas()
+        
         # Horloge pour contrôler le FPS
         self.clock = pygame.time.Clock()
         
+        # Polices des messages et des informations de débogage (registre partagé)
+        self.message_font = get_font(36)
+        self.debug_font = get_font(20)
+        
         # État du jeu
         self.state = GameState.MENU
         self.running = True
@@ -80,73 +103,113 @@ class Game:
         # Écran des meilleurs scores
         self.highscore_screen = HighScoreScreen(self.highscore_manager)
         
-        # Gestionnaire de sons
-        self.sound_manager = SoundManager()
+        # Gestionnaire de sons (file de commandes vers le fil audio, ou
+        # récepteur muet sans sortie audio)
+        self.sound_manager = create_sound_manager()
         
         # Écran des options sonores
         self.sound_options = SoundOptions(self.sound_manager)
         
-        # Pour les tests, créer des sons placeholders
-        self.sound_manager.create_placeholder_sounds()
-        
-        # Lancer la musique du menu
+        # Lancer la musique du menu et préparer celle de la partie
         self.sound_manager.play_music()
+        self.sound_manager.preload_music("game_background.wav")
         
         # Création des objets du jeu
-        self.reset_game()
+        self.seed = seed
+        board_width, board_height = board_size or (GRID_WIDTH, GRID_HEIGHT)
+        self.core = GameCore(board_width, board_height, seed=seed)
+        
+        # Enregistrement des parties pour les rejouer à l'identique
+        self.record_path = record_path
+        self.recorder = create_recorder(self.core, record_path) if record_path else None
+        
+        # Cadencement des ticks logiques, découplé du FPS
+        self.scheduler = TickScheduler()
+        
+        # Mises à jour partielles de l'écran: seules les zones modifiées sont transmises
+        self.dirty_rects_enabled = DIRTY_RECT_UPDATES
+        self.dirty_rects = DirtyRectTracker()
+        self.rendered_state = None
         
-        # Effets temporaires
-        self.speed_effect_end_time = 0
-        self.speed_multiplier = 1.0
+        # Image persistante de la zone visible du plateau, repeinte case par case
+        self.camera = Camera(board_width, board_height)
+        self.board_canvas = BoardCanvas(self.core.grid, self.atlas, self.camera)
+        
+        self.reset_game()
         
         # Statistiques de performance
         self.frame_times = []
         self.max_frame_times = 100  # Pour calculer une moyenne sur les 100 dernières frames
         
         self.logger.info("Initialisation du jeu terminée")
-        
+    
     def reset_game(self):
         """
         Réinitialise le jeu pour une nouvelle partie.
         """
         self.logger.info("Réinitialisation du jeu")
         
-        # Création du système de niveaux
-        self.level = Level()
-        
-        # Création du serpent
-        self.snake = Snake()
-        
-        # Création de la nourriture
-        self.food = Food(self.snake.body, level=self.level.current_level)
-        
-        # Création du score
-        self.score = Score()
+        # Réinitialisation des règles (serpent, nourriture, niveaux, score)
+        self.core.reset(self.seed)
         
         # Écran de Game Over (sera créé quand nécessaire)
         self.game_over_screen = None
         
         # Timing pour le mouvement du serpent
-        self.last_move_time = time.time()
-        
-        # Réinitialisation des effets
-        self.speed_effect_end_time = 0
-        self.speed_multiplier = 1.0
+        self.scheduler.reset()
         
         # Changer la musique pour le jeu
         if self.state == GameState.PLAYING:
             self.sound_manager.play_music("game_background.wav")
     
-    def process_events(self):
+    @property
+    def snake(self):
+        """
+        Serpent de la partie en cours.
+        """
+        return self.core.snake
+    
+    @property
+    def food(self):
+        """
+        Nourriture de la partie en cours.
+        """
+        return self.core.food
+    
+    @property
+    def level(self):
+        """
+        Système de niveaux de la partie en cours.
+        """
+        return self.core.level
+    
+    @property
+    def score(self):
+        """
+        Score de la partie en cours.
+        """
+        return self.core.score
+    
+    def process_events(self, events=None):
         """
         Gère les événements Pygame (clavier, souris, etc.).
+        
+        Args:
+            events (list, optional): Événements à traiter. Par défaut ceux de la file de pygame.
         """
-        events = pygame.event.get()
+        if events is None:
+            events = pygame.event.get()
         
         for event in events:
             if event.type == pygame.QUIT:
                 self.logger.info("Événement QUIT détecté")
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                # La fenêtre a été recouverte ou redimensionnée: tout réafficher
+                self.dirty_rects.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11 and self.scaled_display:
+                pygame.display.toggle_fullscreen()
+                self.dirty_rects.invalidate()
         
         # Traitement des événements selon l'état du jeu
         if self.state == GameState.MENU:
@@ -169,7 +232,7 @@ class Game:
                 self.logger.info("Quitter le jeu depuis le menu")
                 self.running = False
                 self.sound_manager.play_sound(SoundEffect.MENU_SELECT)
-                
+        
         elif self.state == GameState.PLAYING:
             for event in events:
                 if event.type == pygame.KEYDOWN:
@@ -185,18 +248,18 @@ class Game:
                     if not self.paused:
                         direction_changed = False
                         if event.key == pygame.K_UP:
-                            self.snake.change_direction(Direction.UP)
+                            self.core.change_direction(Direction.UP)
                             direction_changed = True
                         elif event.key == pygame.K_DOWN:
-                            self.snake.change_direction(Direction.DOWN)
+                            self.core.change_direction(Direction.DOWN)
                             direction_changed = True
                         elif event.key == pygame.K_LEFT:
-                            self.snake.change_direction(Direction.LEFT)
+                            self.core.change_direction(Direction.LEFT)
                             direction_changed = True
                         elif event.key == pygame.K_RIGHT:
-                            self.snake.change_direction(Direction.RIGHT)
+                            self.core.change_direction(Direction.RIGHT)
                             direction_changed = True
-                            
+                        
                         if direction_changed:
                             self.logger.debug(f"Direction du serpent changée: {self.snake.direction}")
                             self.sound_manager.play_sound(SoundEffect.MOVE)
@@ -262,78 +325,20 @@ class Game:
         
         if self.state == GameState.MENU:
             self.menu.update(dt)
-            
+        
         elif self.state == GameState.PLAYING and not self.paused:
-            # Vérifier le passage au niveau suivant
-            if self.level.check_level_up(self.score.value):
-                self.logger.info(f"Niveau suivant! Niveau {self.level.current_level}")
-                # Jouer le son de passage de niveau
-                self.sound_manager.play_sound(SoundEffect.LEVEL_UP)
-            
-            # Vérifier l'expiration des effets temporaires
-            current_time = pygame.time.get_ticks()
-            if current_time >= self.speed_effect_end_time:
-                if self.speed_multiplier != 1.0:
-                    self.logger.debug("Fin de l'effet de vitesse")
-                    self.speed_multiplier = 1.0
-            
-            # Vérifier l'expiration de la nourriture spéciale
-            if self.food.should_expire():
-                self.logger.debug("Nourriture expirée, respawn")
-                self.food.respawn(
-                    self.snake.body, 
-                    self.level.obstacles,
-                    self.level.current_level
-                )
-            
-            # Calculer la vitesse actuelle du serpent
-            current_speed = self.level.get_current_speed() * self.speed_multiplier
-            
-            # Déplacer le serpent à intervalle régulier
-            current_time = time.time()
-            if current_time - self.last_move_time > 1.0 / current_speed:
-                # Vérifier si le serpent se heurte à un obstacle
-                next_head_pos = self.snake.get_next_head_position()
-                if self.level.check_obstacle_collision(next_head_pos):
-                    self.logger.info(f"Collision avec un obstacle à {next_head_pos}")
-                    self._handle_game_over()
+            # Exécuter tous les ticks dus depuis la frame précédente; la durée
+            # de chaque tick dépend de la vitesse courante (effets compris)
+            self.scheduler.advance()
+            while self.scheduler.consume(self.core.get_tick_duration() / 1000.0):
+                events = self.core.step()
+                self._handle_core_events(events)
+                if self.core.game_over:
                     return
-                
-                # Vérifier si le serpent a mangé de la nourriture
-                if self.food.is_collision(self.snake.get_head_position()):
-                    self.snake.grow()
-                    self.logger.info(f"Nourriture mangée de type {self.food.type}, score: {self.score.value}")
-                    
-                    # Jouer le son de consommation de nourriture
-                    self.sound_manager.play_sound(SoundEffect.EAT)
-                    
-                    # Traiter les effets spéciaux de la nourriture
-                    if self.food.type == FoodType.SPEED:
-                        self.logger.debug("Effet de vitesse augmentée activé")
-                        self.speed_multiplier = 1.5
-                        self.speed_effect_end_time = pygame.time.get_ticks() + 5000  # 5 secondes
-                    elif self.food.type == FoodType.SLOW:
-                        self.logger.debug("Effet de vitesse réduite activé")
-                        self.speed_multiplier = 0.75
-                        self.speed_effect_end_time = pygame.time.get_ticks() + 5000  # 5 secondes
-                    
-                    # Augmenter le score selon le type de nourriture
-                    self.score.increase(self.food.get_points())
-                    
-                    # Générer une nouvelle nourriture
-                    self.food.respawn(
-                        self.snake.body, 
-                        self.level.obstacles,
-                        self.level.current_level
-                    )
-                
-                # Déplacer le serpent
-                if not self.snake.move():
-                    self.logger.info(f"Collision fatale du serpent, score final: {self.score.value}")
-                    self._handle_game_over()
-                    return
-                
-                self.last_move_time = current_time
+        
+        elif self.state == GameState.PLAYING:
+            # Le temps passé en pause n'est pas rattrapé
+            self.scheduler.pause()
         
         elif self.state == GameState.GAME_OVER:
             self.game_over_screen.update(dt)
@@ -351,12 +356,67 @@ class Game:
             avg_frame_time = sum(self.frame_times) / len(self.frame_times)
             self.logger.debug(f"Temps moyen de frame: {avg_frame_time * 1000:.2f} ms, FPS: {1.0 / avg_frame_time:.1f}")
     
+    def _handle_core_events(self, events):
+        """
+        Traduit les événements d'un tick du moteur en sons et en journalisation.
+        
+        Args:
+            events (list): Événements (CoreEvent) renvoyés par GameCore.step()
+        """
+        for event in events:
+            if event == CoreEvent.LEVEL_UP:
+                self.logger.info(f"Niveau suivant! Niveau {self.level.current_level}")
+                # Jouer le son de passage de niveau, plus aigu à chaque niveau
+                self.sound_manager.play_sound(
+                    SoundEffect.LEVEL_UP, min(self.level.current_level - 1, MAX_PITCH_SEMITONES)
+                )
+            
+            elif event == CoreEvent.SPEED_EFFECT_END:
+                self.logger.debug("Fin de l'effet de vitesse")
+            
+            elif event == CoreEvent.FOOD_EXPIRED:
+                self.logger.debug("Nourriture expirée, respawn")
+            
+            elif event == CoreEvent.ATE:
+                self.logger.info(f"Nourriture mangée de type {self.core.last_eaten_type}, score: {self.score.value}")
+                
+                # Jouer le son de consommation de nourriture, plus aigu à
+                # mesure que le serpent s'allonge
+                self.sound_manager.play_sound(
+                    SoundEffect.EAT, min(len(self.snake.body) // 4, MAX_PITCH_SEMITONES)
+                )
+                
+                if self.core.last_eaten_type == FoodType.SPEED:
+                    self.logger.debug("Effet de vitesse augmentée activé")
+                elif self.core.last_eaten_type == FoodType.SLOW:
+                    self.logger.debug("Effet de vitesse réduite activé")
+            
+            elif event == CoreEvent.DIED:
+                if self.core.death_cause == DeathCause.OBSTACLE:
+                    self.logger.info(f"Collision avec un obstacle à {self.core.death_position}")
+                elif self.core.death_cause == DeathCause.BOARD_FULL:
+                    self.logger.info(f"Plateau plein, score final: {self.score.value}")
+                else:
+                    self.logger.info(f"Collision fatale du serpent, score final: {self.score.value}")
+                self._handle_game_over()
+    
     def _handle_game_over(self):
         """
         Gère la fin de partie et vérifie les meilleurs scores.
         """
+        # Sauvegarder l'enregistrement de la partie
+        if self.recorder is not None:
+            try:
+                self.recorder.save(self.record_path)
+                self.logger.info(f"Partie enregistrée dans {self.record_path} (graine {self.core.seed})")
+            except IOError as e:
+                self.logger.error(f"Erreur lors de l'enregistrement de la partie: {e}")
+        
         # Jouer le son de game over
         self.sound_manager.play_sound(SoundEffect.GAME_OVER)
+        if self.debug_mode:
+            # get_stats() attend le fil audio: seulement en mode débogage
+            self.logger.debug(f"Effets sonores: {self.sound_manager.get_stats()}")
         
         # Changer pour la musique du menu
         self.sound_manager.play_music()
@@ -376,59 +436,99 @@ class Game:
         """
         Dessine les éléments du jeu sur l'écran.
         """
-        # Effacer l'écran
-        self.screen.fill(BLACK)
+        # Effacer l'écran (le plateau couvre tout l'écran pendant la partie)
+        if self.state != GameState.PLAYING:
+            self.screen.fill(BLACK)
+        
+        # Un changement d'écran impose une mise à jour complète
+        dirty_rects = self.dirty_rects
+        if self.state != self.rendered_state:
+            dirty_rects.invalidate()
+            self.rendered_state = self.state
         
         # Rendu selon l'état du jeu
         if self.state == GameState.MENU:
             self.menu.draw(self.screen)
-            
+        
         elif self.state == GameState.PLAYING:
-            # Dessiner les obstacles
-            self.level.draw(self.screen)
+            # Suivre la tête, puis repeindre les cases visibles modifiées
+            # (serpent, obstacles, nourriture) sur l'image persistante
+            self.camera.follow(self.snake.get_head_position())
+            all_changed, changed_cells = self.board_canvas.update(self.food.type)
+            if all_changed:
+                dirty_rects.invalidate()
             
-            # Dessiner le serpent
-            self.snake.draw(self.screen)
+            if dirty_rects.full:
+                # Copier toute la vue (un plateau plus petit que la fenêtre laisse un fond noir)
+                if self.board_canvas.surface.get_size() != self.screen.get_size():
+                    self.screen.fill(BLACK)
+                self.screen.blit(self.board_canvas.surface, (0, 0))
+            else:
+                # Ne recopier que les cases modifiées et les zones où des
+                # éléments ont été superposés à la frame précédente
+                dirty_rects.add_cells(changed_cells, self.camera.view_width)
+                self.board_canvas.restore(self.screen, dirty_rects.rects + dirty_rects.overlay_rects())
             
-            # Dessiner la nourriture
-            self.food.draw(self.screen)
+            # La nourriture spéciale est animée par-dessus le plateau
+            food_cell = self.camera.to_view(self.food.position) if self.food.position is not None else None
+            if food_cell is not None and self.food.type != FoodType.NORMAL:
+                self.food.draw(self.screen, self.atlas, (self.camera.x, self.camera.y))
+                food_rect = pygame.Rect(food_cell[0] * GRID_SIZE, food_cell[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                dirty_rects.overlay("food", food_rect)
+                dirty_rects.add(food_rect)
             
-            # Afficher le score
-            self.score.draw(self.screen)
+            # Afficher le niveau et le score
+            level_rect = self.level.draw_info(self.screen)
+            score_rect = self.score.draw(self.screen)
+            
+            # Zones modifiées: textes du HUD
+            dirty_rects.overlay("score", score_rect, self.score.value)
+            dirty_rects.overlay("level", level_rect, self.level.current_level)
             
             # Afficher message de pause
             if self.paused:
-                self._render_message("PAUSE - Appuyez sur P pour continuer", WHITE)
+                message = "PAUSE - Appuyez sur P pour continuer"
+                dirty_rects.overlay("pause", self._render_message(message, WHITE), message)
             
             # Afficher les effets actifs
-            if pygame.time.get_ticks() < self.speed_effect_end_time:
-                if self.speed_multiplier > 1.0:
-                    self._render_message("VITESSE AUGMENTÉE!", WHITE, y_offset=30)
+            if self.core.is_speed_effect_active():
+                if self.core.speed_multiplier > 1.0:
+                    message = "VITESSE AUGMENTÉE!"
                 else:
-                    self._render_message("VITESSE RÉDUITE!", WHITE, y_offset=30)
+                    message = "VITESSE RÉDUITE!"
+                dirty_rects.overlay("effect", self._render_message(message, WHITE, y_offset=30), message)
             
-            # Afficher les informations de débogage
+            # Afficher les informations de débogage (changent à chaque frame)
             if self.debug_mode:
-                self._render_debug_info()
-        
-        elif self.state == GameState.GAME_OVER:
-            self.game_over_screen.draw(self.screen)
+                debug_rect = self._render_debug_info()
+                dirty_rects.overlay("debug", debug_rect)
+                dirty_rects.add(debug_rect)
         
-        elif self.state == GameState.HIGHSCORES:
-            self.highscore_screen.draw(self.screen)
-        
-        elif self.state == GameState.NAME_INPUT:
-            self.highscore_manager.draw_input(self.screen)
-        
-        elif self.state == GameState.SOUND_OPTIONS:
-            self.sound_options.draw(self.screen)
-        
-        elif self.state == GameState.OPTIONS:
-            # Écran d'options simple
-            self._render_message("OPTIONS - Appuyez sur ECHAP pour revenir au menu", WHITE)
+        else:
+            # Écrans de menus: mise à jour complète
+            dirty_rects.invalidate()
+            
+            if self.state == GameState.GAME_OVER:
+                self.game_over_screen.draw(self.screen)
+            
+            elif self.state == GameState.HIGHSCORES:
+                self.highscore_screen.draw(self.screen)
+            
+            elif self.state == GameState.NAME_INPUT:
+                self.highscore_manager.draw_input(self.screen)
+            
+            elif self.state == GameState.SOUND_OPTIONS:
+                self.sound_options.draw(self.screen)
+            
+            elif self.state == GameState.OPTIONS:
+                # Écran d'options simple
+                self._render_message("OPTIONS - Appuyez sur ECHAP pour revenir au menu", WHITE)
         
         # Mise à jour de l'affichage
-        pygame.display.flip()
+        if self.dirty_rects_enabled:
+            dirty_rects.present()
+        else:
+            pygame.display.flip()
     
     def _render_message(self, message, color, y_offset=0):
         """
@@ -438,50 +538,114 @@ class Game:
             message (str): Le message à afficher
             color (tuple): La couleur RGB du texte
             y_offset (int, optional): Décalage vertical par rapport au centre. Par défaut 0.
+        
+        Returns:
+            pygame.Rect: Zone occupée par le message
         """
-        font = pygame.font.Font(None, 36)
-        text = font.render(message, True, color)
+        text = render_text(self.message_font, message, True, color)
         text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + y_offset))
-        self.screen.blit(text, text_rect)
+        return self.screen.blit(text, text_rect)
     
     def _render_debug_info(self):
         """
         Affiche des informations de débogage sur l'écran.
+        
+        Returns:
+            pygame.Rect: Zone occupée par les informations
         """
-        debug_font = pygame.font.Font(None, 20)
+        debug_font = self.debug_font
         y_pos = 10
+        rects = []
         
         # FPS
         fps = int(self.clock.get_fps())
-        fps_text = debug_font.render(f"FPS: {fps}", True, WHITE)
-        self.screen.blit(fps_text, (WINDOW_WIDTH - fps_text.get_width() - 10, y_pos))
+        fps_text = render_text(debug_font, f"FPS: {fps}", True, WHITE)
+        rects.append(self.screen.blit(fps_text, (WINDOW_WIDTH - fps_text.get_width() - 10, y_pos)))
         y_pos += 20
         
         # Taille du serpent
         snake_length = len(self.snake.body)
-        snake_text = debug_font.render(f"Taille serpent: {snake_length}", True, WHITE)
-        self.screen.blit(snake_text, (WINDOW_WIDTH - snake_text.get_width() - 10, y_pos))
+        snake_text = render_text(debug_font, f"Taille serpent: {snake_length}", True, WHITE)
+        rects.append(self.screen.blit(snake_text, (WINDOW_WIDTH - snake_text.get_width() - 10, y_pos)))
         y_pos += 20
         
         # Niveau et score
-        level_text = debug_font.render(f"Niveau: {self.level.current_level} | Score: {self.score.value}", True, WHITE)
-        self.screen.blit(level_text, (WINDOW_WIDTH - level_text.get_width() - 10, y_pos))
+        level_text = render_text(debug_font, f"Niveau: {self.level.current_level} | Score: {self.score.value}", True, WHITE)
+        rects.append(self.screen.blit(level_text, (WINDOW_WIDTH - level_text.get_width() - 10, y_pos)))
         y_pos += 20
         
         # Type de nourriture
-        food_text = debug_font.render(f"Nourriture: {self.food.type.name}", True, WHITE)
-        self.screen.blit(food_text, (WINDOW_WIDTH - food_text.get_width() - 10, y_pos))
+        food_text = render_text(debug_font, f"Nourriture: {self.food.type.name}", True, WHITE)
+        rects.append(self.screen.blit(food_text, (WINDOW_WIDTH - food_text.get_width() - 10, y_pos)))
+        
+        return rects[0].unionall(rects[1:])
+    
+    def is_static(self):
+        """
+        Indique si l'écran courant ne change qu'en réponse aux entrées du
+        joueur (menus, meilleurs scores, options, fin de partie, pause).
+        
+        Returns:
+            bool: True si l'écran est statique, False pendant la partie
+        """
+        if self.debug_mode:
+            # Les informations de débogage (FPS) changent à chaque frame
+            return False
+        return self.state != GameState.PLAYING or self.paused
+    
+    def get_animation_interval(self):
+        """
+        Renvoie l'intervalle entre deux images des animations d'un écran statique.
+        
+        Returns:
+            int: Intervalle en millisecondes, ou None si rien n'est animé
+        """
+        # La nourriture spéciale pulse au rythme du temps du jeu: figée en
+        # pause, elle ne demande aucune nouvelle image
+        if (self.state == GameState.PLAYING and not self.paused and self.food.position is not None
+                and self.food.type != FoodType.NORMAL):
+            return 1000 // IDLE_ANIMATION_FPS
+        return None
+    
+    def wait_events(self, timeout):
+        """
+        Attend un événement sans consommer de temps processeur.
+        
+        Args:
+            timeout (int): Attente maximale en millisecondes
+        
+        Returns:
+            list: Événements reçus (vide si l'attente a expiré)
+        """
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
     
     def run(self):
         """
         Boucle principale du jeu.
+        
+        Pendant la partie, la boucle tourne à FPS images par seconde. Sur un
+        écran statique déjà affiché, elle se bloque dans l'attente d'un
+        événement et ne redessine qu'en réponse à une entrée ou à l'échéance
+        d'une animation.
         """
         self.logger.info("Démarrage de la boucle principale du jeu")
         try:
             while self.running:
-                self.process_events()
+                if self.is_static() and self.state == self.rendered_state:
+                    animation_interval = self.get_animation_interval()
+                    events = self.wait_events(animation_interval or IDLE_WAIT_TIMEOUT)
+                    redraw = bool(events) or animation_interval is not None
+                else:
+                    events = pygame.event.get()
+                    redraw = True
+                
+                self.process_events(events)
                 self.update()
-                self.render()
+                if redraw or self.state != self.rendered_state:
+                    self.render()
                 self.clock.tick(FPS)
             
             self.logger.info("Fin de la boucle principale, arrêt du jeu")
@@ -491,5 +655,8 @@ class Game:
             self.logger.critical(traceback.format_exc())
         finally:
             # Nettoyage avant de quitter
+            if self.recorder is not None:
+                self.recorder.close()
+            self.sound_manager.close()
             pygame.quit()
             sys.exit()
@@ -0,0 +1,221 @@
+"""
+Module contenant la classe Grid, carte d'occupation partagée de la grille de jeu.
+"""
+
+import random
+from array import array
+from src.utils.constants import GRID_WIDTH, GRID_HEIGHT
+
+class CellState:
+    """
+    Énumération des états possibles d'une case de la grille.
+    """
+    EMPTY = 0
+    BODY = 1
+    HEAD = 2
+    OBSTACLE = 3
+    FOOD = 4
+
+
+# États qui tuent le serpent lorsqu'il entre dans la case
+BLOCKING_STATES = (CellState.BODY, CellState.HEAD, CellState.OBSTACLE)
+
+
+class Grid:
+    """
+    Carte d'occupation compacte (une case = un octet) partagée par le serpent,
+    les obstacles et la nourriture.
+    
+    Chaque objet du jeu met à jour ses propres cases au fil de l'eau, ce qui
+    permet de répondre à « qu'y a-t-il dans cette case ? » en temps constant.
+    La grille tient aussi un index des cases vides (tableau dense + position
+    de chaque case dans ce tableau) pour tirer une case libre en O(1).
+    """
+    
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Initialise une grille vide.
+        
+        Args:
+            width (int, optional): Largeur en cases. Par défaut GRID_WIDTH.
+            height (int, optional): Hauteur en cases. Par défaut GRID_HEIGHT.
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        
+        # Index des cases vides: liste dense des indices de cases libres et,
+        # pour chaque case, sa place dans cette liste (-1 si occupée)
+        self.free_cells = array('i')
+        self.free_slots = array('i')
+        self._reset_free_index()
+        
+        # Suivi optionnel des cases modifiées (pour l'affichage), voir track_changes()
+        self.changed_cells = None
+        self.all_changed = True
+    
+    def _reset_free_index(self):
+        """
+        Reconstruit l'index des cases vides (toutes les cases sont vides).
+        """
+        size = self.width * self.height
+        self.free_cells = array('i', range(size))
+        self.free_slots = array('i', range(size))
+    
+    def in_bounds(self, position):
+        """
+        Vérifie si une position est à l'intérieur de la grille.
+        
+        Args:
+            position (tuple): Position (x, y) à vérifier
+        
+        Returns:
+            bool: True si la position est dans la grille, False sinon
+        """
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def get(self, position):
+        """
+        Renvoie l'état d'une case.
+        
+        Args:
+            position (tuple): Position (x, y) dans la grille
+        
+        Returns:
+            int: État de la case (voir CellState)
+        """
+        x, y = position
+        return self.cells[y * self.width + x]
+    
+    def set(self, position, state):
+        """
+        Modifie l'état d'une case.
+        
+        Args:
+            position (tuple): Position (x, y) dans la grille
+            state (int): Nouvel état de la case (voir CellState)
+        """
+        x, y = position
+        index = y * self.width + x
+        old_state = self.cells[index]
+        self.cells[index] = state
+        
+        if self.changed_cells is not None and old_state != state:
+            self.changed_cells.add(index)
+        
+        if old_state == CellState.EMPTY and state != CellState.EMPTY:
+            # Retirer la case de l'index par échange avec la dernière case libre
+            slot = self.free_slots[index]
+            last = self.free_cells.pop()
+            if last != index:
+                self.free_cells[slot] = last
+                self.free_slots[last] = slot
+            self.free_slots[index] = -1
+        elif old_state != CellState.EMPTY and state == CellState.EMPTY:
+            self.free_slots[index] = len(self.free_cells)
+            self.free_cells.append(index)
+    
+    def is_free(self, position):
+        """
+        Vérifie si une case est vide.
+        
+        Args:
+            position (tuple): Position (x, y) dans la grille
+        
+        Returns:
+            bool: True si la case est vide, False sinon
+        """
+        return self.get(position) == CellState.EMPTY
+    
+    def free_count(self):
+        """
+        Renvoie le nombre de cases vides.
+        
+        Returns:
+            int: Nombre de cases vides
+        """
+        return len(self.free_cells)
+    
+    def random_free_cell(self, rng=random):
+        """
+        Tire uniformément une case vide, en temps constant.
+        
+        Args:
+            rng (random.Random, optional): Générateur aléatoire à utiliser.
+        
+        Returns:
+            tuple or None: Position (x, y) d'une case vide, ou None si la grille est pleine
+        """
+        if not self.free_cells:
+            return None
+        index = self.free_cells[rng.randrange(len(self.free_cells))]
+        return (index % self.width, index // self.width)
+    
+    def is_blocked(self, position):
+        """
+        Vérifie si entrer dans une case serait fatal (mur, corps ou obstacle).
+        
+        Args:
+            position (tuple): Position (x, y) à vérifier
+        
+        Returns:
+            bool: True si la case est hors de la grille ou bloquante
+        """
+        if not self.in_bounds(position):
+            return True
+        return self.get(position) in BLOCKING_STATES
+    
+    def track_changes(self):
+        """
+        Active le suivi des cases modifiées (désactivé par défaut pour ne rien
+        coûter aux simulations sans affichage).
+        """
+        if self.changed_cells is None:
+            self.changed_cells = set()
+            self.all_changed = True
+    
+    def pop_changes(self):
+        """
+        Renvoie les cases modifiées depuis le dernier appel et remet le suivi à zéro.
+        
+        Returns:
+            tuple: (toute la grille a changé, ensemble des indices de cases modifiées)
+        """
+        all_changed, changed_cells = self.all_changed, self.changed_cells
+        self.all_changed = False
+        self.changed_cells = set() if changed_cells is not None else None
+        return all_changed, changed_cells or set()
+    
+    def get_state(self):
+        """
+        Renvoie une copie de l'état de la grille, index des cases libres compris
+        (son ordre conditionne le tirage des cases libres).
+        
+        Returns:
+            tuple: (cases, cases libres) sous forme de bytes et d'array('i')
+        """
+        return bytes(self.cells), array('i', self.free_cells)
+    
+    def set_state(self, state):
+        """
+        Restaure un état renvoyé par get_state().
+        
+        Args:
+            state (tuple): (cases, cases libres)
+        """
+        cells, free_cells = state
+        self.cells[:] = cells
+        self.free_cells = array('i', free_cells)
+        self.free_slots = array('i', [-1]) * len(self.cells)
+        for slot, index in enumerate(self.free_cells):
+            self.free_slots[index] = slot
+        self.all_changed = True
+    
+    def clear(self):
+        """
+        Vide toutes les cases de la grille.
+        """
+        self.cells[:] = bytes(len(self.cells))
+        self._reset_free_index()
+        self.all_changed = True
@@ -2,11 +2,13 @@
 Module contenant la classe Level qui gère les niveaux et la difficulté du jeu.
 """
 
-import pygame
 import random
 from src.utils.constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
+    WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, GRAY, GRID_WIDTH, GRID_HEIGHT
 )
+from src.game.grid import CellState
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class Obstacle:
     """
@@ -20,24 +22,7 @@ class Obstacle:
             position (tuple): Position (x, y) de l'obstacle sur la grille
         """
         self.position = position
-        self.color = (100, 100, 100)  # Gris
-    
-    def draw(self, screen):
-        """
-        Dessine l'obstacle sur l'écran.
-        
-        Args:
-            screen (pygame.Surface): Surface de l'écran
-        """
-        x, y = self.position
-        rect = pygame.Rect(
-            x * GRID_SIZE, 
-            y * GRID_SIZE, 
-            GRID_SIZE, 
-            GRID_SIZE
-        )
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, (50, 50, 50), rect, 1)  # Bordure
+        self.color = GRAY
 
 
 class Level:
@@ -45,22 +30,46 @@ class Level:
     Classe gérant les niveaux et la difficulté du jeu.
     """
     
-    def __init__(self):
+    def __init__(self, grid=None, rng=None, base_speed=10, level_multiplier=1.5, obstacles_per_level=3):
         """
         Initialise un nouveau gestionnaire de niveaux.
-        """
+        
+        Args:
+            grid (Grid, optional): Carte d'occupation partagée à tenir à jour.
+            rng (random.Random, optional): Générateur aléatoire dédié aux obstacles
+                                           (parties reproductibles). Par défaut le module random.
+            base_speed (int, optional): Vitesse de base du serpent. Par défaut 10.
+            level_multiplier (float, optional): Multiplicateur du score du niveau suivant. Par défaut 1.5.
+            obstacles_per_level (int, optional): Obstacles ajoutés par niveau. Par défaut 3.
+        """
+        self.grid = grid
+        self.rng = rng if rng is not None else random
+        self.width = grid.width if grid is not None else GRID_WIDTH
+        self.height = grid.height if grid is not None else GRID_HEIGHT
+        
         self.current_level = 1
         self.score_for_next_level = 100  # Score nécessaire pour passer au niveau suivant
-        self.level_multiplier = 1.5  # Multiplicateur pour le score du niveau suivant
+        self.level_multiplier = level_multiplier  # Multiplicateur pour le score du niveau suivant
         
-        self.base_speed = 10  # Vitesse de base du serpent
+        self.base_speed = base_speed  # Vitesse de base du serpent
         self.current_speed = self.base_speed
         
         self.obstacles = []
-        self.font = pygame.font.Font(None, 24)
+        self.obstacle_positions = set()
         
         # Nombre d'obstacles par niveau
-        self.obstacles_per_level = 3
+        self.obstacles_per_level = obstacles_per_level
+    
+    @property
+    def font(self):
+        """
+        Police d'affichage du niveau, chargée à la première utilisation pour que
+        la logique des niveaux ne dépende pas de pygame.font.
+        
+        Returns:
+            pygame.font.Font: Police du niveau
+        """
+        return get_font(24)
     
     def get_current_speed(self):
         """
@@ -112,12 +121,37 @@ class Level:
         # Ajouter de nouveaux obstacles
         for _ in range(self.obstacles_per_level):
             # Générer une position aléatoire, pas trop près des bords
-            x = random.randint(2, GRID_WIDTH - 3)
-            y = random.randint(2, GRID_HEIGHT - 3)
+            x = self.rng.randint(2, self.width - 3)
+            y = self.rng.randint(2, self.height - 3)
+            
+            # Éviter de placer un obstacle sur un autre (ou, avec une grille,
+            # sur le serpent ou la nourriture)
+            if self.grid is not None:
+                if not self.grid.is_free((x, y)):
+                    continue
+            elif (x, y) in self.obstacle_positions:
+                continue
             
-            # Éviter de placer un obstacle sur un autre
-            if not any(obs.position == (x, y) for obs in self.obstacles):
-                self.obstacles.append(Obstacle((x, y)))
+            self.add_obstacle((x, y))
+    
+    def add_obstacle(self, position):
+        """
+        Ajoute un obstacle et met à jour les index d'occupation.
+        
+        Args:
+            position (tuple): Position (x, y) de l'obstacle
+        """
+        self.obstacles.append(Obstacle(position))
+        self.obstacle_positions.add(position)
+        if self.grid is not None:
+            self.grid.set(position, CellState.OBSTACLE)
+    
+    def clear_obstacles(self):
+        """
+        Retire tous les obstacles (sans toucher à la grille partagée).
+        """
+        self.obstacles = []
+        self.obstacle_positions = set()
     
     def check_obstacle_collision(self, position):
         """
@@ -129,19 +163,19 @@ class Level:
         Returns:
             bool: True s'il y a une collision, False sinon
         """
-        return any(obs.position == position for obs in self.obstacles)
+        if self.grid is not None:
+            return self.grid.in_bounds(position) and self.grid.get(position) == CellState.OBSTACLE
+        return position in self.obstacle_positions
     
-    def draw(self, screen):
+    def draw_info(self, screen):
         """
-        Dessine les obstacles et le niveau actuel sur l'écran.
+        Affiche le niveau actuel sur l'écran.
         
         Args:
             screen (pygame.Surface): Surface de l'écran
-        """
-        # Dessiner les obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(screen)
         
-        # Afficher le niveau actuel
-        level_text = self.font.render(f"Niveau: {self.current_level}", True, WHITE)
-        screen.blit(level_text, (WINDOW_WIDTH - 120, 10))
+        Returns:
+            pygame.Rect: Zone occupée par le texte du niveau
+        """
+        level_text = render_text(self.font, f"Niveau: {self.current_level}", True, WHITE)
+        return screen.blit(level_text, (WINDOW_WIDTH - 120, 10))
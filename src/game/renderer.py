@@ -0,0 +1,356 @@
+"""
+Module contenant les outils d'affichage du plateau de jeu.
+"""
+
+from itertools import groupby
+import pygame
+from src.utils.constants import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BLACK
+from src.game.grid import CellState
+
+class DirtyRectTracker:
+    """
+    Liste des zones de l'écran modifiées depuis la frame précédente, pour ne
+    transmettre que celles-ci à pygame.display.update() au lieu de tout
+    l'écran avec pygame.display.flip().
+    
+    Les zones proviennent des cases modifiées de la grille et des éléments
+    superposés (textes du HUD, bannières) dont on retient la position et le
+    contenu d'une frame à l'autre: un élément qui change ou disparaît ajoute
+    son ancienne et sa nouvelle zone.
+    """
+    
+    def __init__(self):
+        """
+        Initialise un suivi vide (la première frame est complète).
+        """
+        self.rects = []
+        self.full = True
+        self.overlays = {}
+        self.seen_overlays = set()
+    
+    def invalidate(self):
+        """
+        Demande une mise à jour de tout l'écran à la prochaine présentation.
+        """
+        self.full = True
+    
+    def add(self, rect):
+        """
+        Ajoute une zone modifiée.
+        
+        Args:
+            rect (pygame.Rect): Zone de l'écran
+        """
+        if not self.full:
+            self.rects.append(rect)
+    
+    def add_cells(self, indices, grid_width):
+        """
+        Ajoute les cases modifiées de la grille.
+        
+        Args:
+            indices (iterable): Indices de cases (y * largeur + x)
+            grid_width (int): Largeur de la grille en cases
+        """
+        if self.full:
+            return
+        for index in indices:
+            self.rects.append(pygame.Rect(
+                index % grid_width * GRID_SIZE,
+                index // grid_width * GRID_SIZE,
+                GRID_SIZE,
+                GRID_SIZE
+            ))
+    
+    def overlay(self, key, rect, content=None):
+        """
+        Signale un élément superposé dessiné pendant la frame.
+        
+        Args:
+            key (str): Identifiant de l'élément
+            rect (pygame.Rect): Zone occupée par l'élément
+            content (optional): Contenu affiché (texte...), pour détecter les changements
+        """
+        self.seen_overlays.add(key)
+        previous = self.overlays.get(key)
+        if previous is not None and previous == (rect, content):
+            return
+        if previous is not None:
+            self.add(previous[0])
+        self.add(rect)
+        self.overlays[key] = (rect, content)
+    
+    def overlay_rects(self):
+        """
+        Renvoie les zones des éléments superposés à la frame précédente, à
+        effacer avant de les redessiner.
+        
+        Returns:
+            list: Zones de l'écran (pygame.Rect)
+        """
+        return [rect for rect, _ in self.overlays.values()]
+    
+    def present(self):
+        """
+        Met à jour l'affichage puis remet le suivi à zéro.
+        
+        Returns:
+            int: Nombre de zones transmises (0 pour une mise à jour complète)
+        """
+        # Les éléments qui n'ont pas été redessinés ont disparu: effacer leur zone
+        for key in list(self.overlays):
+            if key not in self.seen_overlays:
+                self.add(self.overlays.pop(key)[0])
+        self.seen_overlays.clear()
+        
+        if self.full:
+            pygame.display.flip()
+            count = 0
+        else:
+            if self.rects:
+                pygame.display.update(self.rects)
+            count = len(self.rects)
+        
+        self.rects = []
+        self.full = False
+        return count
+
+
+class Camera:
+    """
+    Fenêtre de vue sur le plateau, en cases, qui suit la tête du serpent.
+    
+    Sur un plateau plus grand que la fenêtre, seule la zone visible est
+    dessinée: le coût de l'affichage dépend de la taille de la vue, pas de
+    celle du plateau. Sur un plateau qui tient dans la fenêtre, la vue couvre
+    tout le plateau et ne bouge jamais.
+    """
+    
+    def __init__(self, board_width, board_height, view_width=GRID_WIDTH, view_height=GRID_HEIGHT):
+        """
+        Initialise une vue sur le coin supérieur gauche du plateau.
+        
+        Args:
+            board_width (int): Largeur du plateau en cases
+            board_height (int): Hauteur du plateau en cases
+            view_width (int, optional): Largeur de la vue en cases. Par défaut GRID_WIDTH.
+            view_height (int, optional): Hauteur de la vue en cases. Par défaut GRID_HEIGHT.
+        """
+        self.board_width = board_width
+        self.board_height = board_height
+        self.view_width = min(view_width, board_width)
+        self.view_height = min(view_height, board_height)
+        self.x = 0
+        self.y = 0
+    
+    def follow(self, position):
+        """
+        Centre la vue sur une position, sans sortir du plateau.
+        
+        Args:
+            position (tuple): Position (x, y) à suivre
+        """
+        x, y = position
+        self.x = min(max(x - self.view_width // 2, 0), self.board_width - self.view_width)
+        self.y = min(max(y - self.view_height // 2, 0), self.board_height - self.view_height)
+    
+    def to_view(self, position):
+        """
+        Convertit une position du plateau en position dans la vue.
+        
+        Args:
+            position (tuple): Position (x, y) sur le plateau
+        
+        Returns:
+            tuple or None: Position (x, y) dans la vue, ou None si elle n'est pas visible
+        """
+        x = position[0] - self.x
+        y = position[1] - self.y
+        if 0 <= x < self.view_width and 0 <= y < self.view_height:
+            return (x, y)
+        return None
+
+
+class BoardCanvas:
+    """
+    Image persistante de la zone visible du plateau, hors écran, tenue à jour
+    case par case.
+    
+    À chaque frame, seules les cases visibles modifiées depuis la précédente
+    (signalées par la grille) sont repeintes avec les tuiles de l'atlas, puis
+    l'image est copiée à l'écran: le coût ne dépend ni de la longueur du
+    serpent, ni du nombre d'obstacles, ni de la taille du plateau. Quand la
+    vue se déplace, l'image est décalée et seules les bandes découvertes sont
+    peintes. La vue n'est repeinte entièrement qu'après une remise à zéro
+    (nouvelle partie, restauration d'un état) ou un grand déplacement.
+    """
+    
+    def __init__(self, grid, atlas, camera=None):
+        """
+        Crée l'image de la vue et active le suivi des cases modifiées.
+        
+        Args:
+            grid (Grid): Carte d'occupation à représenter
+            atlas (SpriteAtlas): Tuiles des cases
+            camera (Camera, optional): Vue à représenter. Par défaut tout le plateau.
+        """
+        self.grid = grid
+        self.atlas = atlas
+        self.camera = camera if camera is not None else Camera(grid.width, grid.height, grid.width, grid.height)
+        self.surface = pygame.Surface((
+            self.camera.view_width * atlas.cell_size,
+            self.camera.view_height * atlas.cell_size
+        ))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        
+        # Origine de la vue actuellement peinte
+        self.origin = (self.camera.x, self.camera.y)
+        
+        self.tiles = {
+            CellState.EMPTY: atlas.empty,
+            CellState.BODY: atlas.body,
+            CellState.HEAD: atlas.head,
+            CellState.OBSTACLE: atlas.obstacle
+        }
+        grid.track_changes()
+    
+    def _tile(self, state, food_type):
+        """
+        Renvoie la tuile d'une case selon son état.
+        """
+        if state == CellState.FOOD:
+            return self.atlas.food_tile(food_type)
+        return self.tiles[state]
+    
+    def update(self, food_type):
+        """
+        Suit la vue et repeint les cases visibles modifiées depuis le dernier appel.
+        
+        Args:
+            food_type (FoodType): Type de la nourriture sur le plateau
+        
+        Returns:
+            tuple: (toute la vue a changé, indices dans la vue des cases
+                   repeintes: y * largeur de la vue + x)
+        """
+        all_changed, changed_cells = self.grid.pop_changes()
+        camera = self.camera
+        origin_x, origin_y = self.origin
+        dx = camera.x - origin_x
+        dy = camera.y - origin_y
+        
+        if all_changed or abs(dx) >= camera.view_width or abs(dy) >= camera.view_height:
+            self.repaint(food_type)
+            return True, set()
+        
+        if dx or dy:
+            self._scroll(dx, dy, food_type)
+        
+        # Cases modifiées dans la vue (celles d'une bande découverte sont déjà peintes)
+        width = self.grid.width
+        view_width = camera.view_width
+        view_height = camera.view_height
+        visible = set()
+        for index in changed_cells:
+            x = index % width - camera.x
+            y = index // width - camera.y
+            if 0 <= x < view_width and 0 <= y < view_height:
+                visible.add(y * view_width + x)
+        
+        if visible:
+            cells = self.grid.cells
+            size = self.atlas.cell_size
+            origin = camera.y * width + camera.x
+            self.surface.blits([
+                (self._tile(cells[origin + index // view_width * width + index % view_width], food_type),
+                 (index % view_width * size, index // view_width * size))
+                for index in visible
+            ], False)
+        
+        if dx or dy:
+            return True, set()
+        return False, visible
+    
+    def _scroll(self, dx, dy, food_type):
+        """
+        Décale l'image pour suivre la vue, puis peint les bandes découvertes.
+        
+        Args:
+            dx (int): Déplacement horizontal de la vue en cases
+            dy (int): Déplacement vertical de la vue en cases
+            food_type (FoodType): Type de la nourriture sur le plateau
+        """
+        camera = self.camera
+        size = self.atlas.cell_size
+        self.surface.scroll(-dx * size, -dy * size)
+        self.origin = (camera.x, camera.y)
+        
+        # Colonnes découvertes à droite ou à gauche, puis lignes en haut ou en bas
+        if dx > 0:
+            self._paint_region(camera.view_width - dx, 0, dx, camera.view_height, food_type)
+        elif dx < 0:
+            self._paint_region(0, 0, -dx, camera.view_height, food_type)
+        if dy > 0:
+            self._paint_region(0, camera.view_height - dy, camera.view_width, dy, food_type)
+        elif dy < 0:
+            self._paint_region(0, 0, camera.view_width, -dy, food_type)
+    
+    def _paint_region(self, x, y, width, height, food_type):
+        """
+        Peint une zone rectangulaire de la vue.
+        
+        Args:
+            x (int): Colonne de la zone dans la vue
+            y (int): Ligne de la zone dans la vue
+            width (int): Largeur de la zone en cases
+            height (int): Hauteur de la zone en cases
+            food_type (FoodType): Type de la nourriture sur le plateau
+        """
+        cells = self.grid.cells
+        grid_width = self.grid.width
+        size = self.atlas.cell_size
+        left = self.camera.x + x
+        
+        # Fond vide, puis uniquement les cases occupées, ligne par ligne: une
+        # série de cases identiques (corps horizontal, obstacles) est copiée en une fois
+        self.surface.fill(BLACK, (x * size, y * size, width * size, height * size))
+        tiles = []
+        for row in range(y, y + height):
+            start = (self.camera.y + row) * grid_width + left
+            column = x
+            for state, group in groupby(cells[start:start + width]):
+                length = len(list(group))
+                if state != CellState.EMPTY:
+                    if length == 1:
+                        tiles.append((self._tile(state, food_type), (column * size, row * size)))
+                    else:
+                        tiles.extend(self.atlas.run_blits(self._tile(state, food_type), column, row, length))
+                column += length
+        self.surface.blits(tiles, False)
+    
+    def restore(self, screen, rects):
+        """
+        Recopie des zones de la vue à l'écran (la vue est affichée à
+        l'origine de l'écran).
+        
+        Args:
+            screen (pygame.Surface): Surface de l'écran
+            rects (list): Zones à recopier (pygame.Rect)
+        """
+        # Hors de la vue (plateau plus petit que l'écran), le fond est noir
+        bounds = self.surface.get_rect()
+        for rect in rects:
+            if not bounds.contains(rect):
+                screen.fill(BLACK, rect)
+        screen.blits([(self.surface, rect, rect) for rect in rects], False)
+    
+    def repaint(self, food_type):
+        """
+        Repeint toute la vue.
+        
+        Args:
+            food_type (FoodType): Type de la nourriture sur le plateau
+        """
+        self.origin = (self.camera.x, self.camera.y)
+        self._paint_region(0, 0, self.camera.view_width, self.camera.view_height, food_type)
@@ -0,0 +1,814 @@
+"""
+Module contenant les classes d'enregistrement et de relecture des parties.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from src.game.snake import Direction
+from src.game.food import FoodType
+from src.game.core import GameCore, DeathCause
+
+# Format binaire: en-tête, blocs (image clé + entrées), index et pied de fichier
+BINARY_MAGIC = b"SNKR"
+INDEX_MAGIC = b"SNKI"
+BINARY_VERSION = 1
+BINARY_EXTENSION = ".snkr"
+DEFAULT_KEYFRAME_INTERVAL = 1024
+
+_DIRECTIONS = list(Direction)
+_FOOD_TYPES = list(FoodType)
+_DEATH_CAUSES = (None, DeathCause.OBSTACLE, DeathCause.WALL, DeathCause.SELF, DeathCause.BOARD_FULL)
+_INDEX_ENTRY = struct.Struct('<QQ')     # tick de l'image clé, position du bloc
+_TRAILER = struct.Struct('<QQQ4s')      # position de l'index, nombre de blocs, ticks, signature
+_KEYFRAME_SIZE = struct.Struct('<I')
+_DOUBLE = struct.Struct('<d')
+_RNG_WORDS = struct.Struct('<625I')
+
+class Replay:
+    """
+    Enregistrement compact d'une partie: la graine, les dimensions du plateau,
+    les réglages de difficulté et les changements de direction effectifs,
+    datés au tick près.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, seed, width, height, inputs=None, ticks=0, settings=None):
+        """
+        Initialise un enregistrement.
+        
+        Args:
+            seed (int): Graine de la partie
+            width (int): Largeur du plateau en cases
+            height (int): Hauteur du plateau en cases
+            inputs (list, optional): Liste de (tick, Direction) dans l'ordre de saisie
+            ticks (int, optional): Nombre de ticks joués
+            settings (dict, optional): Réglages de difficulté (GameCore.get_settings()).
+                                       Par défaut les réglages standard.
+        """
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.inputs = inputs if inputs is not None else []
+        self.ticks = ticks
+        self.settings = settings if settings is not None else {}
+    
+    def to_dict(self):
+        """
+        Convertit l'enregistrement en dictionnaire sérialisable en JSON.
+        
+        Returns:
+            dict: Représentation de l'enregistrement
+        """
+        return {
+            "version": self.VERSION,
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+            "ticks": self.ticks,
+            "settings": self.settings,
+            "inputs": [[tick, direction.name] for tick, direction in self.inputs]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Reconstruit un enregistrement à partir d'un dictionnaire.
+        
+        Args:
+            data (dict): Représentation produite par to_dict()
+        
+        Returns:
+            Replay: L'enregistrement
+        """
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Version d'enregistrement non prise en charge: {data.get('version')}")
+        inputs = [(tick, Direction[name]) for tick, name in data["inputs"]]
+        return cls(data["seed"], data["width"], data["height"], inputs, data["ticks"], data.get("settings"))
+    
+    def save(self, filename):
+        """
+        Sauvegarde l'enregistrement dans un fichier JSON.
+        
+        Args:
+            filename (str): Chemin du fichier
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f)
+    
+    @classmethod
+    def load(cls, filename):
+        """
+        Charge un enregistrement depuis un fichier JSON.
+        
+        Args:
+            filename (str): Chemin du fichier
+        
+        Returns:
+            Replay: L'enregistrement
+        """
+        with open(filename, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+class ReplayRecorder:
+    """
+    Enregistreur branché sur un GameCore: il note la graine à chaque nouvelle
+    partie puis les changements de direction effectifs.
+    """
+    
+    def __init__(self, core):
+        """
+        Branche un nouvel enregistreur sur un moteur de jeu.
+        
+        Args:
+            core (GameCore): Moteur de jeu à enregistrer
+        """
+        self.core = core
+        self.replay = None
+        core.recorder = self
+        self.start(core)
+    
+    def start(self, core):
+        """
+        Commence l'enregistrement d'une nouvelle partie (appelé par GameCore.reset).
+        
+        Args:
+            core (GameCore): Moteur de jeu réinitialisé
+        """
+        self.replay = Replay(core.seed, core.grid.width, core.grid.height, settings=core.get_settings())
+    
+    def record(self, tick, direction):
+        """
+        Enregistre un changement de direction.
+        
+        Args:
+            tick (int): Tick avant lequel le changement s'applique
+            direction (Direction): Nouvelle direction
+        """
+        self.replay.inputs.append((tick, direction))
+    
+    def on_tick(self, core):
+        """
+        Appelé par GameCore à la fin de chaque tick.
+        
+        Args:
+            core (GameCore): Moteur de jeu enregistré
+        """
+        pass
+    
+    def finish(self):
+        """
+        Termine l'enregistrement de la partie en cours.
+        
+        Returns:
+            Replay: L'enregistrement complet
+        """
+        self.replay.ticks = self.core.tick
+        return self.replay
+    
+    def save(self, filename):
+        """
+        Termine l'enregistrement et le sauvegarde au format JSON.
+        
+        Args:
+            filename (str): Chemin du fichier
+        """
+        self.finish().save(filename)
+    
+    def close(self):
+        """
+        Abandonne l'enregistrement en cours (rien à libérer au format JSON).
+        """
+        pass
+
+
+class ReplayPlayer:
+    """
+    Relecture d'un enregistrement sur un GameCore, sans affichage et aussi
+    vite que souhaité (tick par tick ou d'une traite).
+    """
+    
+    def __init__(self, replay):
+        """
+        Prépare la relecture d'un enregistrement.
+        
+        Args:
+            replay (Replay): Enregistrement à relire
+        """
+        self.replay = replay
+        self.core = GameCore(replay.width, replay.height, seed=replay.seed, **replay.settings)
+        self.input_index = 0
+    
+    def is_finished(self):
+        """
+        Indique si la relecture est terminée.
+        
+        Returns:
+            bool: True si la partie est finie ou si tous les ticks ont été rejoués
+        """
+        return self.core.game_over or self.core.tick >= self.replay.ticks
+    
+    def step(self):
+        """
+        Rejoue un tick, avec les changements de direction qui le précèdent.
+        
+        Returns:
+            list: Événements (CoreEvent) du tick
+        """
+        inputs = self.replay.inputs
+        while self.input_index < len(inputs) and inputs[self.input_index][0] <= self.core.tick:
+            self.core.change_direction(inputs[self.input_index][1])
+            self.input_index += 1
+        return self.core.step()
+    
+    def play(self, until_tick=None):
+        """
+        Rejoue la partie jusqu'à un tick donné ou jusqu'à la fin.
+        
+        Args:
+            until_tick (int, optional): Tick auquel s'arrêter. Par défaut la fin de l'enregistrement.
+        
+        Returns:
+            GameCore: Le moteur dans l'état atteint
+        """
+        while not self.is_finished() and (until_tick is None or self.core.tick < until_tick):
+            self.step()
+        return self.core
+
+
+class _Encoder:
+    """
+    Écriture d'entiers en varint (LEB128), de flottants et de blocs d'octets.
+    """
+    
+    def __init__(self):
+        """
+        Initialise un tampon vide.
+        """
+        self.buffer = bytearray()
+    
+    def varint(self, value):
+        """
+        Écrit un entier positif sur un nombre variable d'octets.
+        """
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+    
+    def signed(self, value):
+        """
+        Écrit un entier signé (codage zigzag).
+        """
+        self.varint(value * 2 if value >= 0 else -value * 2 - 1)
+    
+    def double(self, value):
+        """
+        Écrit un flottant 64 bits.
+        """
+        self.buffer += _DOUBLE.pack(value)
+    
+    def raw(self, data):
+        """
+        Écrit un bloc d'octets précédé de sa taille.
+        """
+        self.varint(len(data))
+        self.buffer += data
+
+
+class _Decoder:
+    """
+    Lecture des valeurs écrites par _Encoder.
+    """
+    
+    def __init__(self, data, offset=0):
+        """
+        Initialise la lecture d'un tampon à partir d'une position.
+        """
+        self.data = data
+        self.offset = offset
+    
+    def varint(self):
+        """
+        Lit un entier positif.
+        """
+        result = 0
+        shift = 0
+        while True:
+            byte = self.data[self.offset]
+            self.offset += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+    
+    def signed(self):
+        """
+        Lit un entier signé (codage zigzag).
+        """
+        value = self.varint()
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+    
+    def double(self):
+        """
+        Lit un flottant 64 bits.
+        """
+        value = _DOUBLE.unpack_from(self.data, self.offset)[0]
+        self.offset += _DOUBLE.size
+        return value
+    
+    def raw(self):
+        """
+        Lit un bloc d'octets précédé de sa taille.
+        """
+        size = self.varint()
+        data = bytes(self.data[self.offset:self.offset + size])
+        self.offset += size
+        return data
+
+
+def _encode_rng_state(encoder, state):
+    """
+    Écrit l'état d'un random.Random (version, 625 mots, gauss_next).
+    """
+    version, words, gauss_next = state
+    encoder.varint(version)
+    encoder.buffer += _RNG_WORDS.pack(*words)
+    if gauss_next is None:
+        encoder.varint(0)
+    else:
+        encoder.varint(1)
+        encoder.double(gauss_next)
+
+def _decode_rng_state(decoder):
+    """
+    Lit un état de random.Random écrit par _encode_rng_state.
+    """
+    version = decoder.varint()
+    words = _RNG_WORDS.unpack_from(decoder.data, decoder.offset)
+    decoder.offset += _RNG_WORDS.size
+    gauss_next = decoder.double() if decoder.varint() else None
+    return (version, words, gauss_next)
+
+def _encode_keyframe(state, width):
+    """
+    Encode un état de GameCore.get_state() en image clé compressée.
+    
+    Args:
+        state (dict): État de la partie
+        width (int): Largeur du plateau (pour coder les positions en indices)
+    
+    Returns:
+        bytes: Image clé compressée
+    """
+    e = _Encoder()
+    index = lambda position: position[1] * width + position[0]
+    
+    e.varint(state["tick"])
+    e.double(state["time"])
+    e.double(state["speed_multiplier"])
+    e.double(state["speed_effect_end_time"])
+    e.varint(state["game_over"] | state["snake_just_ate"] << 1 | state["snake_alive"] << 2)
+    e.varint(_DEATH_CAUSES.index(state["death_cause"]))
+    if state["death_position"] is None:
+        e.varint(0)
+    else:
+        e.varint(1)
+        e.signed(state["death_position"][0])
+        e.signed(state["death_position"][1])
+    e.varint(0 if state["last_eaten_type"] is None else state["last_eaten_type"].value + 1)
+    _encode_rng_state(e, state["food_rng"])
+    _encode_rng_state(e, state["obstacle_rng"])
+    
+    e.varint(_DIRECTIONS.index(state["snake_direction"]))
+    e.varint(len(state["snake_body"]))
+    for position in state["snake_body"]:
+        e.varint(index(position))
+    
+    e.varint(0 if state["food_position"] is None else index(state["food_position"]) + 1)
+    e.varint(state["food_type"].value)
+    e.varint(state["food_level"])
+    e.double(state["food_creation_time"])
+    e.varint(state["food_active_time"])
+    
+    e.varint(state["level"])
+    e.varint(state["score_for_next_level"])
+    e.double(state["level_multiplier"])
+    e.double(state["base_speed"])
+    e.double(state["current_speed"])
+    e.varint(state["obstacles_per_level"])
+    e.varint(len(state["obstacles"]))
+    for position in state["obstacles"]:
+        e.varint(index(position))
+    
+    e.varint(state["score"])
+    cells, free_cells = state["grid"]
+    free_cells = array('i', free_cells)
+    if sys.byteorder == 'big':
+        free_cells.byteswap()
+    e.raw(cells)
+    e.raw(free_cells.tobytes())
+    
+    return zlib.compress(bytes(e.buffer))
+
+def _decode_keyframe(data, seed, width):
+    """
+    Décode une image clé produite par _encode_keyframe.
+    
+    Args:
+        data (bytes): Image clé compressée
+        seed (int): Graine de la partie
+        width (int): Largeur du plateau
+    
+    Returns:
+        dict: État utilisable par GameCore.set_state()
+    """
+    d = _Decoder(zlib.decompress(data))
+    position = lambda value: (value % width, value // width)
+    state = {"seed": seed}
+    
+    state["tick"] = d.varint()
+    state["time"] = d.double()
+    state["speed_multiplier"] = d.double()
+    state["speed_effect_end_time"] = d.double()
+    flags = d.varint()
+    state["game_over"] = bool(flags & 1)
+    state["snake_just_ate"] = bool(flags & 2)
+    state["snake_alive"] = bool(flags & 4)
+    state["death_cause"] = _DEATH_CAUSES[d.varint()]
+    state["death_position"] = (d.signed(), d.signed()) if d.varint() else None
+    last_eaten_type = d.varint()
+    state["last_eaten_type"] = _FOOD_TYPES[last_eaten_type - 1] if last_eaten_type else None
+    state["food_rng"] = _decode_rng_state(d)
+    state["obstacle_rng"] = _decode_rng_state(d)
+    
+    state["snake_direction"] = _DIRECTIONS[d.varint()]
+    state["snake_body"] = [position(d.varint()) for _ in range(d.varint())]
+    
+    food_position = d.varint()
+    state["food_position"] = position(food_position - 1) if food_position else None
+    state["food_type"] = FoodType(d.varint())
+    state["food_level"] = d.varint()
+    state["food_creation_time"] = d.double()
+    state["food_active_time"] = d.varint()
+    
+    state["level"] = d.varint()
+    state["score_for_next_level"] = d.varint()
+    state["level_multiplier"] = d.double()
+    state["base_speed"] = d.double()
+    state["current_speed"] = d.double()
+    state["obstacles_per_level"] = d.varint()
+    state["obstacles"] = [position(d.varint()) for _ in range(d.varint())]
+    
+    state["score"] = d.varint()
+    cells = d.raw()
+    free_cells = array('i')
+    free_cells.frombytes(d.raw())
+    if sys.byteorder == 'big':
+        free_cells.byteswap()
+    state["grid"] = (cells, free_cells)
+    return state
+
+
+class BinaryReplayWriter(ReplayRecorder):
+    """
+    Enregistreur au format binaire, écrit au fil de l'eau.
+    
+    Le fichier contient un en-tête, puis des blocs commençant chacun par une
+    image clé (état complet compressé) suivie des changements de direction
+    codés en varint delta (écart de ticks et direction dans un même entier),
+    puis un index (tick, position) des images clés et un pied de fichier.
+    
+    La partie en cours est écrite dans un fichier temporaire à côté du
+    fichier de destination, qui ne le remplace qu'une fois terminé: le
+    dernier enregistrement complet reste lisible pendant la partie suivante.
+    Les changements de direction ne sont pas conservés en mémoire.
+    """
+    
+    def __init__(self, core, filename, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Branche un enregistreur binaire sur un moteur de jeu.
+        
+        Args:
+            core (GameCore): Moteur de jeu à enregistrer
+            filename (str): Fichier de destination (remplacé à chaque partie terminée)
+            keyframe_interval (int, optional): Nombre de ticks entre deux images clés.
+        """
+        self.filename = filename
+        self.temp_filename = filename + ".tmp"
+        self.keyframe_interval = keyframe_interval
+        self.file = None
+        ReplayRecorder.__init__(self, core)
+    
+    def start(self, core):
+        """
+        Commence l'enregistrement d'une nouvelle partie (appelé par GameCore.reset).
+        
+        La partie précédente, si elle n'a pas été terminée, est abandonnée.
+        
+        Args:
+            core (GameCore): Moteur de jeu réinitialisé
+        """
+        ReplayRecorder.start(self, core)
+        self.close()
+        
+        self.file = open(self.temp_filename, 'wb')
+        header = _Encoder()
+        header.buffer += BINARY_MAGIC
+        header.varint(BINARY_VERSION)
+        header.varint(core.grid.width)
+        header.varint(core.grid.height)
+        header.varint(core.seed)
+        header.varint(self.keyframe_interval)
+        self.file.write(header.buffer)
+        
+        self.index = []
+        self._start_chunk(core)
+    
+    def _start_chunk(self, core):
+        """
+        Ouvre un nouveau bloc avec une image clé de l'état courant.
+        """
+        self.chunk_tick = core.tick
+        self.chunk_keyframe = _encode_keyframe(core.get_state(), core.grid.width)
+        self.chunk_inputs = _Encoder()
+        self.chunk_input_count = 0
+        self.last_input_tick = core.tick
+    
+    def _flush_chunk(self):
+        """
+        Écrit le bloc en cours dans le fichier.
+        """
+        self.index.append((self.chunk_tick, self.file.tell()))
+        self.file.write(_KEYFRAME_SIZE.pack(len(self.chunk_keyframe)))
+        self.file.write(self.chunk_keyframe)
+        count = _Encoder()
+        count.varint(self.chunk_input_count)
+        self.file.write(count.buffer)
+        self.file.write(self.chunk_inputs.buffer)
+    
+    def record(self, tick, direction):
+        """
+        Enregistre un changement de direction.
+        
+        Args:
+            tick (int): Tick avant lequel le changement s'applique
+            direction (Direction): Nouvelle direction
+        """
+        self.chunk_inputs.varint((tick - self.last_input_tick) << 2 | _DIRECTIONS.index(direction))
+        self.chunk_input_count += 1
+        self.last_input_tick = tick
+    
+    def on_tick(self, core):
+        """
+        Ajoute une image clé tous les keyframe_interval ticks.
+        
+        Args:
+            core (GameCore): Moteur de jeu enregistré
+        """
+        if core.tick - self.chunk_tick >= self.keyframe_interval:
+            self._flush_chunk()
+            self._start_chunk(core)
+    
+    def finish(self):
+        """
+        Termine le fichier (dernier bloc, index et pied de fichier) et le
+        met à la place du fichier de destination.
+        
+        Returns:
+            Replay: Graine, dimensions, réglages et durée de la partie, sans
+            les changements de direction (voir BinaryReplayReader.read_inputs())
+        """
+        replay = ReplayRecorder.finish(self)
+        if self.file is None:
+            return replay
+        
+        self._flush_chunk()
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(_INDEX_ENTRY.pack(*entry))
+        self.file.write(_TRAILER.pack(index_offset, len(self.index), replay.ticks, INDEX_MAGIC))
+        self.file.close()
+        self.file = None
+        os.replace(self.temp_filename, self.filename)
+        return replay
+    
+    def save(self, filename=None):
+        """
+        Termine le fichier binaire (il est écrit au fil de l'eau, puis mis à
+        la place de self.filename).
+        
+        Args:
+            filename (str, optional): Ignoré, présent pour l'interface commune
+        """
+        self.finish()
+    
+    def close(self):
+        """
+        Abandonne la partie en cours: ferme et supprime le fichier temporaire.
+        Le dernier enregistrement terminé est conservé.
+        """
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.remove(self.temp_filename)
+
+
+class BinaryReplayReader:
+    """
+    Lecture d'un enregistrement binaire projeté en mémoire (mmap).
+    
+    seek() retrouve l'image clé la plus proche par recherche dichotomique dans
+    l'index, restaure l'état puis ne rejoue que les quelques ticks restants:
+    le coût d'un accès ne dépend pas de la longueur de la partie.
+    """
+    
+    def __init__(self, filename):
+        """
+        Ouvre un enregistrement binaire.
+        
+        Args:
+            filename (str): Chemin du fichier
+        """
+        self.file = open(filename, 'rb')
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.file.close()
+            raise ValueError(f"{filename}: fichier de replay tronqué")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if self.data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            self.close()
+            raise ValueError(f"{filename} n'est pas un enregistrement binaire")
+        header = _Decoder(self.data, len(BINARY_MAGIC))
+        try:
+            version = header.varint()
+            if version != BINARY_VERSION:
+                self.close()
+                raise ValueError(f"Version d'enregistrement non prise en charge: {version}")
+            self.width = header.varint()
+            self.height = header.varint()
+            self.seed = header.varint()
+            self.keyframe_interval = header.varint()
+        except IndexError:
+            self.close()
+            raise ValueError(f"{filename}: fichier de replay tronqué")
+        
+        # Le pied de fichier et l'index doivent tenir après l'en-tête
+        trailer_offset = len(self.data) - _TRAILER.size
+        if trailer_offset < header.offset:
+            self.close()
+            raise ValueError(f"{filename}: fichier de replay tronqué")
+        self.index_offset, self.chunk_count, self.ticks, magic = _TRAILER.unpack_from(self.data, trailer_offset)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{filename} est incomplet (index manquant)")
+        if (self.chunk_count == 0 or self.index_offset < header.offset
+                or self.index_offset + self.chunk_count * _INDEX_ENTRY.size > trailer_offset):
+            self.close()
+            raise ValueError(f"{filename}: fichier de replay tronqué")
+        
+        # Réglages de difficulté, lus dans la première image clé
+        state = self._read_chunk(0)[0]
+        self.settings = {
+            "base_speed": state["base_speed"],
+            "level_multiplier": state["level_multiplier"],
+            "obstacles_per_level": state["obstacles_per_level"]
+        }
+    
+    def close(self):
+        """
+        Ferme le fichier.
+        """
+        self.data.close()
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _chunk_entry(self, chunk):
+        """
+        Lit une entrée de l'index.
+        
+        Returns:
+            tuple: (tick de l'image clé, position du bloc)
+        """
+        return _INDEX_ENTRY.unpack_from(self.data, self.index_offset + chunk * _INDEX_ENTRY.size)
+    
+    def _find_chunk(self, tick):
+        """
+        Recherche le dernier bloc dont l'image clé précède un tick.
+        """
+        low, high = 0, self.chunk_count - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._chunk_entry(middle)[0] <= tick:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+    
+    def _read_chunk(self, chunk):
+        """
+        Décode un bloc.
+        
+        Returns:
+            tuple: (état de l'image clé, liste de (tick, Direction))
+        """
+        keyframe_tick, offset = self._chunk_entry(chunk)
+        size = _KEYFRAME_SIZE.unpack_from(self.data, offset)[0]
+        offset += _KEYFRAME_SIZE.size
+        state = _decode_keyframe(self.data[offset:offset + size], self.seed, self.width)
+        
+        decoder = _Decoder(self.data, offset + size)
+        inputs = []
+        tick = keyframe_tick
+        for _ in range(decoder.varint()):
+            value = decoder.varint()
+            tick += value >> 2
+            inputs.append((tick, _DIRECTIONS[value & 3]))
+        return state, inputs
+    
+    def read_inputs(self):
+        """
+        Décode tous les changements de direction.
+        
+        Returns:
+            list: Liste de (tick, Direction)
+        """
+        inputs = []
+        for chunk in range(self.chunk_count):
+            inputs.extend(self._read_chunk(chunk)[1])
+        return inputs
+    
+    def to_replay(self):
+        """
+        Convertit l'enregistrement binaire en Replay (format JSON).
+        
+        Returns:
+            Replay: L'enregistrement
+        """
+        return Replay(self.seed, self.width, self.height, self.read_inputs(), self.ticks, self.settings)
+    
+    def seek(self, tick):
+        """
+        Reconstruit l'état de la partie à un tick donné.
+        
+        Args:
+            tick (int): Tick visé (borné à la durée de l'enregistrement)
+        
+        Returns:
+            GameCore: Moteur dans l'état atteint, prêt à continuer
+        """
+        tick = max(0, min(tick, self.ticks))
+        chunk = self._find_chunk(tick)
+        state, inputs = self._read_chunk(chunk)
+        
+        core = GameCore(self.width, self.height, seed=self.seed, **self.settings)
+        core.set_state(state)
+        
+        input_index = 0
+        while core.tick < tick and not core.game_over:
+            while input_index < len(inputs) and inputs[input_index][0] <= core.tick:
+                core.change_direction(inputs[input_index][1])
+                input_index += 1
+            core.step()
+        return core
+
+
+def is_binary_replay(filename):
+    """
+    Indique si un fichier est un enregistrement au format binaire.
+    
+    Args:
+        filename (str): Chemin du fichier
+    
+    Returns:
+        bool: True si le fichier commence par la signature du format binaire
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+def create_recorder(core, filename):
+    """
+    Crée l'enregistreur adapté à l'extension du fichier de destination.
+    
+    Args:
+        core (GameCore): Moteur de jeu à enregistrer
+        filename (str): Fichier de destination (.snkr pour le format binaire)
+    
+    Returns:
+        ReplayRecorder: Enregistreur JSON ou binaire
+    """
+    if filename.endswith(BINARY_EXTENSION):
+        return BinaryReplayWriter(core, filename)
+    return ReplayRecorder(core)
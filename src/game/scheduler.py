@@ -0,0 +1,90 @@
+"""
+Module contenant la classe TickScheduler qui cadence les ticks logiques du jeu.
+"""
+
+import time
+from src.utils.constants import MAX_TICKS_PER_FRAME
+
+class TickScheduler:
+    """
+    Ordonnanceur à pas fixe: accumule le temps réel écoulé et le convertit en
+    ticks logiques, indépendamment de la cadence d'affichage.
+    
+    À chaque frame, advance() ajoute le temps écoulé à l'accumulateur, puis
+    consume() est appelée en boucle tant qu'un tick est dû. Le reliquat est
+    conservé d'une frame à l'autre, de sorte que la vitesse réelle du serpent
+    correspond exactement à sa vitesse nominale, même au-delà du FPS.
+    """
+    
+    def __init__(self, max_ticks_per_frame=MAX_TICKS_PER_FRAME, clock=time.perf_counter):
+        """
+        Initialise un nouvel ordonnanceur.
+        
+        Args:
+            max_ticks_per_frame (int, optional): Nombre maximum de ticks rattrapés par frame.
+                                                 Par défaut MAX_TICKS_PER_FRAME.
+            clock (callable, optional): Horloge en secondes. Par défaut time.perf_counter.
+        """
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = clock
+        
+        # Statistiques: temps abandonné lorsque le plafond de rattrapage est atteint
+        self.dropped_time = 0.0
+        
+        self.reset()
+    
+    def reset(self):
+        """
+        Vide l'accumulateur (nouvelle partie, retour de pause...).
+        """
+        self.accumulator = 0.0
+        self.last_time = None
+        self.frame_ticks = 0
+    
+    def pause(self):
+        """
+        Suspend la mesure du temps: la durée de la pause ne sera pas rattrapée.
+        """
+        self.last_time = None
+    
+    def advance(self, dt=None):
+        """
+        Ajoute le temps écoulé depuis la frame précédente à l'accumulateur.
+        
+        Args:
+            dt (float, optional): Temps écoulé en secondes. Par défaut, il est
+                                  mesuré avec l'horloge de l'ordonnanceur.
+        """
+        if dt is None:
+            now = self.clock()
+            dt = 0.0 if self.last_time is None else now - self.last_time
+            self.last_time = now
+        
+        self.accumulator += dt
+        self.frame_ticks = 0
+    
+    def consume(self, tick_duration):
+        """
+        Consomme un tick si le temps accumulé le permet.
+        
+        Args:
+            tick_duration (float): Durée du prochain tick en secondes (elle peut
+                                   changer d'un tick à l'autre selon la vitesse)
+        
+        Returns:
+            bool: True si un tick doit être exécuté, False sinon
+        """
+        if self.accumulator < tick_duration:
+            return False
+        
+        if self.frame_ticks >= self.max_ticks_per_frame:
+            # Trop de retard: abandonner le temps dû au-delà du plafond
+            # en conservant la phase du tick en cours
+            kept = self.accumulator % tick_duration
+            self.dropped_time += self.accumulator - kept
+            self.accumulator = kept
+            return False
+        
+        self.accumulator -= tick_duration
+        self.frame_ticks += 1
+        return True
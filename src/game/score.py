@@ -2,8 +2,9 @@
 Module contenant la classe Score qui gère le score du joueur.
 """
 
-import pygame
 from src.utils.constants import WHITE
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class Score:
     """
@@ -15,7 +16,17 @@ class Score:
         Initialise un nouveau score à zéro.
         """
         self.value = 0
-        self.font = pygame.font.Font(None, 36)
+    
+    @property
+    def font(self):
+        """
+        Police d'affichage, chargée à la première utilisation pour que la
+        logique du score ne dépende pas de pygame.font.
+        
+        Returns:
+            pygame.font.Font: Police du score
+        """
+        return get_font(36)
     
     def increase(self, points=10):
         """
@@ -40,6 +51,9 @@ class Score:
             screen (pygame.Surface): Surface de l'écran
             x (int, optional): Coordonnée X. Par défaut 10.
             y (int, optional): Coordonnée Y. Par défaut 10.
+        
+        Returns:
+            pygame.Rect: Zone occupée par le texte
         """
-        score_text = self.font.render(f"Score: {self.value}", True, WHITE)
-        screen.blit(score_text, (x, y))
+        score_text = render_text(self.font, f"Score: {self.value}", True, WHITE)
+        return screen.blit(score_text, (x, y))
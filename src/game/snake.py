@@ -2,12 +2,12 @@
 Module contenant la classe Snake qui représente le serpent dans le jeu.
 """
 
-import pygame
 from enum import Enum
 from collections import deque
 from src.utils.constants import (
-    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, GREEN, DARK_GREEN
+    GRID_WIDTH, GRID_HEIGHT
 )
+from src.game.grid import CellState
 
 class Direction(Enum):
     """
@@ -24,16 +24,26 @@ class Snake:
     Classe représentant le serpent contrôlé par le joueur.
     """
     
-    def __init__(self):
+    def __init__(self, grid=None):
         """
         Initialise un nouveau serpent au centre de l'écran.
+        
+        Args:
+            grid (Grid, optional): Carte d'occupation partagée à tenir à jour.
+                                   Ses dimensions remplacent alors celles de l'écran.
         """
+        self.grid = grid
+        self.width = grid.width if grid is not None else GRID_WIDTH
+        self.height = grid.height if grid is not None else GRID_HEIGHT
+        
         # Position initiale au centre de l'écran
-        self.x = GRID_WIDTH // 2
-        self.y = GRID_HEIGHT // 2
+        self.x = self.width // 2
+        self.y = self.height // 2
         
         # Corps du serpent (liste de segments)
-        self.body = deque([(self.x, self.y), (self.x - 1, self.y), (self.x - 2, self.y)])
+        self.body = deque()
+        self.occupied = set()
+        self.set_body([(self.x, self.y), (self.x - 1, self.y), (self.x - 2, self.y)])
         
         # Direction initiale (vers la droite)
         self.direction = Direction.RIGHT
@@ -71,6 +81,15 @@ class Snake:
         dx, dy = self.direction.value
         return (head_x + dx, head_y + dy)
     
+    def is_next_move_self_collision(self):
+        """
+        Indique si le prochain déplacement ferait mordre le serpent lui-même.
+        
+        Returns:
+            bool: True si la prochaine position de la tête est sur le corps
+        """
+        return self.get_next_head_position() in self.occupied
+    
     def move(self):
         """
         Déplace le serpent dans sa direction actuelle.
@@ -85,23 +104,31 @@ class Snake:
         dx, dy = self.direction.value
         new_head = (self.body[0][0] + dx, self.body[0][1] + dy)
         
-        # Vérifier si le serpent se mord lui-même
-        if new_head in list(self.body)[1:]:
+        # Vérifier si le serpent se mord lui-même (la queue compte encore,
+        # même si elle est sur le point de libérer sa case)
+        if new_head in self.occupied:
             self.alive = False
             return False
         
         # Vérifier les collisions avec les murs
         x, y = new_head
-        if x < 0 or x >= GRID_WIDTH or y < 0 or y >= GRID_HEIGHT:
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
             self.alive = False
             return False
         
         # Ajouter la nouvelle tête
+        if self.grid is not None:
+            self.grid.set(self.body[0], CellState.BODY)
+            self.grid.set(new_head, CellState.HEAD)
         self.body.appendleft(new_head)
+        self.occupied.add(new_head)
         
         # Supprimer la queue si le serpent n'a pas mangé
         if not self.just_ate:
-            self.body.pop()
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            if self.grid is not None:
+                self.grid.set(tail, CellState.EMPTY)
         else:
             self.just_ate = False
         
@@ -113,35 +140,44 @@ class Snake:
         """
         self.just_ate = True
     
-    def get_head_position(self):
+    def occupies(self, position):
         """
-        Renvoie la position actuelle de la tête du serpent.
+        Vérifie si une case est occupée par le corps du serpent (tête comprise).
+        
+        Args:
+            position (tuple): Position (x, y) à vérifier
         
         Returns:
-            tuple: (x, y) coordonnées de la tête
+            bool: True si la case fait partie du serpent, False sinon
         """
-        return self.body[0]
+        return position in self.occupied
     
-    def draw(self, screen):
+    def set_body(self, positions):
         """
-        Dessine le serpent sur l'écran.
+        Remplace le corps du serpent et reconstruit l'index d'occupation.
         
         Args:
-            screen (pygame.Surface): Surface de l'écran
-        """
-        # Dessiner chaque segment du corps
-        for i, (x, y) in enumerate(self.body):
-            # Tête en vert foncé, corps en vert
-            color = DARK_GREEN if i == 0 else GREEN
-            
-            # Dessiner un rectangle pour chaque segment
-            rect = pygame.Rect(
-                x * GRID_SIZE, 
-                y * GRID_SIZE, 
-                GRID_SIZE, 
-                GRID_SIZE
-            )
-            pygame.draw.rect(screen, color, rect)
-            
-            # Dessiner un contour plus clair
-            pygame.draw.rect(screen, DARK_GREEN, rect, 1)
+            positions (iterable): Positions (x, y) des segments, tête en premier
+        """
+        if self.grid is not None:
+            for position in self.body:
+                self.grid.set(position, CellState.EMPTY)
+        
+        self.body = deque(positions)
+        self.occupied = set(self.body)
+        
+        if self.grid is not None:
+            for position in self.body:
+                self.grid.set(position, CellState.BODY)
+            if self.body:
+                self.grid.set(self.body[0], CellState.HEAD)
+    
+    def get_head_position(self):
+        """
+        Renvoie la position actuelle de la tête du serpent.
+        
+        Returns:
+            tuple: (x, y) coordonnées de la tête
+        """
+        return self.body[0]
+
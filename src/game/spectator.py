@@ -0,0 +1,101 @@
+"""
+Module contenant la classe Spectator, fenêtre où un bot joue en continu sur
+un plateau de taille quelconque affiché en entier.
+"""
+
+import random
+import pygame
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, GAME_TITLE, BLACK, WHITE
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
+from src.game.core import GameCore
+from src.game.bots import POLICIES
+from src.game.array_renderer import ArrayRenderer
+
+class Spectator:
+    """
+    Spectateur d'une simulation: le plateau entier est affiché à chaque frame
+    par ArrayRenderer (un pixel par case, mis à l'échelle de la fenêtre) et
+    une nouvelle partie commence dès que la précédente est terminée.
+    
+    Touches: flèches haut/bas pour doubler ou diviser par deux le nombre de
+    ticks par frame, Échap pour quitter.
+    """
+    
+    def __init__(self, width, height, policy="cautious", seed=None, ticks_per_frame=1, **settings):
+        """
+        Initialise un nouveau spectateur.
+        
+        Args:
+            width (int): Largeur du plateau en cases
+            height (int): Hauteur du plateau en cases
+            policy (str, optional): Nom de la politique du bot (voir bots.POLICIES). Par défaut "cautious".
+            seed (int, optional): Graine de la première partie (les suivantes en découlent).
+            ticks_per_frame (int, optional): Ticks simulés par frame. Par défaut 1.
+            **settings: Réglages de difficulté transmis à GameCore (base_speed,
+                        level_multiplier, obstacles_per_level).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Politique inconnue: {policy} (disponibles: {', '.join(POLICIES)})")
+        
+        self.policy = POLICIES[policy]
+        self.rng = random.Random(seed)
+        self.core = GameCore(width, height, seed=seed, **settings)
+        self.ticks_per_frame = ticks_per_frame
+        self.games = 1
+    
+    def step(self):
+        """
+        Simule les ticks d'une frame, en recommençant une partie si besoin.
+        """
+        core = self.core
+        for _ in range(self.ticks_per_frame):
+            if core.game_over:
+                core.reset(self.rng.getrandbits(63))
+                self.games += 1
+            direction = self.policy(core, self.rng)
+            if direction is not None:
+                core.change_direction(direction)
+            core.step()
+    
+    def run(self):
+        """
+        Ouvre la fenêtre et affiche la simulation jusqu'à sa fermeture.
+        """
+        pygame.init()
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption(f"{GAME_TITLE} - Spectateur")
+        
+        renderer = ArrayRenderer(self.core.grid)
+        board_rect = renderer.fit(screen.get_rect())
+        font = get_font(24)
+        clock = pygame.time.Clock()
+        
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_UP:
+                        self.ticks_per_frame *= 2
+                    elif event.key == pygame.K_DOWN:
+                        self.ticks_per_frame = max(1, self.ticks_per_frame // 2)
+            
+            self.step()
+            
+            screen.fill(BLACK)
+            renderer.update(self.core.food.type)
+            renderer.draw(screen, board_rect)
+            
+            core = self.core
+            info = (f"Partie {self.games} | Score: {core.score.value} | Niveau: {core.level.current_level}"
+                    f" | Longueur: {len(core.snake.body)} | x{self.ticks_per_frame}")
+            screen.blit(render_text(font, info, True, WHITE), (10, 10))
+            
+            pygame.display.flip()
+            clock.tick(FPS)
+        
+        pygame.quit()
@@ -0,0 +1,159 @@
+"""
+Module contenant la classe SpriteAtlas, tuiles pré-rendues des éléments du plateau.
+"""
+
+import pygame
+from src.utils.constants import (
+    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BLACK, WHITE, GREEN, DARK_GREEN, GRAY, DARK_GRAY
+)
+from src.game.food import FoodType, FOOD_COLORS
+
+class SpriteAtlas:
+    """
+    Tuiles du plateau (tête, corps, obstacle, nourriture) dessinées une seule
+    fois puis converties au format de l'écran: chaque case est ensuite
+    affichée par une simple copie de pixels, sans tracé de primitives.
+    
+    Les images de pulsation de la nourriture spéciale sont précalculées pour
+    chaque rayon intérieur possible (le rayon est un entier, il n'y en a que
+    quelques-uns).
+    
+    Pour les séries de cases identiques (corps du serpent, rangées
+    d'obstacles), des bandes de tuiles répétées sont préparées à la demande:
+    une série est copiée en une seule opération.
+    """
+    
+    def __init__(self, cell_size=GRID_SIZE, strip_length=max(GRID_WIDTH, GRID_HEIGHT)):
+        """
+        Dessine toutes les tuiles.
+        
+        Args:
+            cell_size (int, optional): Taille d'une case en pixels. Par défaut GRID_SIZE.
+            strip_length (int, optional): Nombre de tuiles d'une bande. Par défaut la
+                                          plus grande dimension de la fenêtre en cases.
+        """
+        self.cell_size = cell_size
+        self.strip_length = strip_length
+        self.strips = {}
+        
+        self.head = self._make_cell(DARK_GREEN, DARK_GREEN)
+        self.body = self._make_cell(GREEN, DARK_GREEN)
+        self.obstacle = self._make_cell(GRAY, DARK_GRAY)
+        self.empty = self._make_cell(BLACK)
+        
+        # Centre et rayon du cercle de la nourriture
+        self.food_radius = cell_size // 2 - 2
+        self.food = {}
+        self.food_pulse = {}
+        for food_type, color in FOOD_COLORS.items():
+            self.food[food_type] = self._make_food(color)
+            if food_type != FoodType.NORMAL:
+                self.food_pulse[food_type] = {
+                    inner_radius: self._make_food(color, inner_radius)
+                    for inner_radius in self._pulse_radii()
+                }
+    
+    def _pulse_radii(self):
+        """
+        Renvoie les rayons intérieurs atteints par la pulsation.
+        
+        Returns:
+            range: Rayons possibles, pour une pulsation entre 0 et 1 (avec une
+                   marge pour les arrondis de calcul)
+        """
+        return range(int(self.food_radius * 0.5), int(self.food_radius * 0.7) + 2)
+    
+    def _convert(self, surface):
+        """
+        Convertit une tuile au format de l'écran, s'il existe déjà.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert()
+    
+    def _make_cell(self, color, border_color=None):
+        """
+        Dessine une case pleine avec un contour optionnel.
+        """
+        surface = pygame.Surface((self.cell_size, self.cell_size))
+        surface.fill(color)
+        if border_color is not None:
+            pygame.draw.rect(surface, border_color, surface.get_rect(), 1)
+        return self._convert(surface)
+    
+    def _make_food(self, color, inner_radius=None):
+        """
+        Dessine une nourriture (disque) avec un cercle intérieur optionnel.
+        """
+        surface = pygame.Surface((self.cell_size, self.cell_size))
+        surface.fill(BLACK)
+        center = surface.get_rect().center
+        pygame.draw.circle(surface, color, center, self.food_radius)
+        if inner_radius is not None:
+            pygame.draw.circle(surface, WHITE, center, inner_radius)
+        return self._convert(surface)
+    
+    def food_tile(self, food_type, pulse=None):
+        """
+        Renvoie la tuile d'une nourriture.
+        
+        Args:
+            food_type (FoodType): Type de nourriture
+            pulse (float, optional): Phase de pulsation entre 0 et 1 (nourriture spéciale)
+        
+        Returns:
+            pygame.Surface: Tuile de la nourriture
+        """
+        if pulse is None or food_type not in self.food_pulse:
+            return self.food[food_type]
+        return self.food_pulse[food_type][int(self.food_radius * (0.5 + pulse * 0.2))]
+    
+    def strip(self, tile, vertical=False):
+        """
+        Renvoie une bande de tuiles identiques, créée à la première demande.
+        
+        Args:
+            tile (pygame.Surface): Tuile à répéter
+            vertical (bool, optional): Bande verticale plutôt qu'horizontale
+        
+        Returns:
+            pygame.Surface: Bande de strip_length tuiles
+        """
+        key = (tile, vertical)
+        strip = self.strips.get(key)
+        if strip is None:
+            size = self.cell_size
+            length = self.strip_length * size
+            strip = pygame.Surface((size, length) if vertical else (length, size))
+            for offset in range(0, length, size):
+                strip.blit(tile, (0, offset) if vertical else (offset, 0))
+            strip = self.strips[key] = self._convert(strip)
+        return strip
+    
+    def run_blits(self, tile, x, y, length, vertical=False):
+        """
+        Renvoie les copies qui dessinent une série de cases identiques.
+        
+        Args:
+            tile (pygame.Surface): Tuile des cases
+            x (int): Colonne de la première case (en haut à gauche)
+            y (int): Ligne de la première case
+            length (int): Nombre de cases
+            vertical (bool, optional): Série verticale plutôt qu'horizontale
+        
+        Returns:
+            list: Triplets (surface, position, zone) pour Surface.blits()
+        """
+        strip = self.strip(tile, vertical)
+        size = self.cell_size
+        blits = []
+        while length > 0:
+            count = min(length, self.strip_length)
+            area = (0, 0, size, count * size) if vertical else (0, 0, count * size, size)
+            blits.append((strip, (x * size, y * size), area))
+            if vertical:
+                y += count
+            else:
+                x += count
+            length -= count
+        return blits
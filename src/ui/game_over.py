@@ -8,6 +8,8 @@ from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE,
     GREEN, RED
 )
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class GameOverOption(Enum):
     """
@@ -35,9 +37,9 @@ class GameOverScreen:
         self.selected_option = 0
         
         # Polices
-        self.title_font = pygame.font.Font(None, 72)
-        self.score_font = pygame.font.Font(None, 54)
-        self.option_font = pygame.font.Font(None, 48)
+        self.title_font = get_font(72)
+        self.score_font = get_font(54)
+        self.option_font = get_font(48)
         
         # Couleurs
         self.title_color = RED
@@ -87,19 +89,19 @@ class GameOverScreen:
         screen.fill(BLACK)
         
         # Dessiner le titre
-        title_text = self.title_font.render("GAME OVER", True, self.title_color)
+        title_text = render_text(self.title_font, "GAME OVER", True, self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
         screen.blit(title_text, title_rect)
         
         # Dessiner le score
-        score_text = self.score_font.render(f"Score: {self.score}", True, self.score_color)
+        score_text = render_text(self.score_font, f"Score: {self.score}", True, self.score_color)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3 + 20))
         screen.blit(score_text, score_rect)
         
         # Dessiner les options
         for i, option in enumerate(self.options):
             color = self.selected_color if i == self.selected_option else self.option_color
-            option_text = self.option_font.render(option, True, color)
+            option_text = render_text(self.option_font, option, True, color)
             option_rect = option_text.get_rect(
                 center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50 + i * 60)
             )
@@ -107,7 +109,7 @@ class GameOverScreen:
             
             # Indicateur de sélection (flèche)
             if i == self.selected_option:
-                arrow_text = self.option_font.render(">", True, self.selected_color)
+                arrow_text = render_text(self.option_font, ">", True, self.selected_color)
                 arrow_rect = arrow_text.get_rect(
                     right=option_rect.left - 10,
                     centery=option_rect.centery
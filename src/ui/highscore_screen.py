@@ -7,6 +7,8 @@ from enum import Enum
 from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GREEN, RED
 )
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class HighScoreScreenOption(Enum):
     """
@@ -33,8 +35,8 @@ class HighScoreScreen:
         self.selected_option = 0
         
         # Polices
-        self.title_font = pygame.font.Font(None, 48)
-        self.option_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(48)
+        self.option_font = get_font(36)
         
         # Couleurs
         self.title_color = GREEN
@@ -80,13 +82,13 @@ class HighScoreScreen:
         
         # Option "Retour"
         back_color = self.selected_color if self.selected_option == 0 else self.option_color
-        back_text = self.option_font.render("Retour", True, back_color)
+        back_text = render_text(self.option_font, "Retour", True, back_color)
         back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 3, button_y))
         screen.blit(back_text, back_rect)
         
         # Option "Réinitialiser"
         reset_color = self.reset_color if self.selected_option == 1 else self.option_color
-        reset_text = self.option_font.render("Réinitialiser", True, reset_color)
+        reset_text = render_text(self.option_font, "Réinitialiser", True, reset_color)
         reset_rect = reset_text.get_rect(center=(WINDOW_WIDTH * 2 // 3, button_y))
         screen.blit(reset_text, reset_rect)
         
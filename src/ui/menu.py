@@ -8,6 +8,8 @@ from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE,
     GREEN, DARK_GREEN, GAME_TITLE
 )
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class MenuOption(Enum):
     """
@@ -32,8 +34,8 @@ class Menu:
         self.selected_option = 0
         
         # Polices
-        self.title_font = pygame.font.Font(None, 72)
-        self.option_font = pygame.font.Font(None, 48)
+        self.title_font = get_font(72)
+        self.option_font = get_font(48)
         
         # Couleurs
         self.title_color = GREEN
@@ -88,14 +90,14 @@ class Menu:
         screen.fill(BLACK)
         
         # Dessiner le titre
-        title_text = self.title_font.render(GAME_TITLE, True, self.title_color)
+        title_text = render_text(self.title_font, GAME_TITLE, True, self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
         screen.blit(title_text, title_rect)
         
         # Dessiner les options
         for i, option in enumerate(self.options):
             color = self.selected_color if i == self.selected_option else self.option_color
-            option_text = self.option_font.render(option, True, color)
+            option_text = render_text(self.option_font, option, True, color)
             option_rect = option_text.get_rect(
                 center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 60)
             )
@@ -103,7 +105,7 @@ class Menu:
             
             # Indicateur de sélection (flèche)
             if i == self.selected_option:
-                arrow_text = self.option_font.render(">", True, self.selected_color)
+                arrow_text = render_text(self.option_font, ">", True, self.selected_color)
                 arrow_rect = arrow_text.get_rect(
                     right=option_rect.left - 10,
                     centery=option_rect.centery
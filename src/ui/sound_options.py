@@ -8,6 +8,8 @@ from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GREEN, RED
 )
 from src.utils.sound_manager import SoundEffect
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class SoundOptionAction(Enum):
     """
@@ -37,8 +39,8 @@ class SoundOptions:
         self.sound_manager = sound_manager
         
         # Polices
-        self.title_font = pygame.font.Font(None, 48)
-        self.option_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(48)
+        self.option_font = get_font(36)
         
         # Couleurs
         self.title_color = GREEN
@@ -146,7 +148,7 @@ class SoundOptions:
         screen.fill(BLACK)
         
         # Titre
-        title_text = self.title_font.render("Options Sonores", True, self.title_color)
+        title_text = render_text(self.title_font, "Options Sonores", True, self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
         screen.blit(title_text, title_rect)
         
@@ -165,7 +167,7 @@ class SoundOptions:
                (i == 2 and not self.sound_manager.music_enabled):
                 color = self.disabled_color
             
-            option_text = self.option_font.render(text, True, color)
+            option_text = render_text(self.option_font, text, True, color)
             
             # Positionner les options
             if i == 0:  # Retour (en bas)
@@ -225,7 +227,7 @@ class SoundOptions:
         )
         
         # Afficher la valeur en pourcentage
-        percent_text = self.option_font.render(f"{int(value * 100)}%", True, WHITE)
+        percent_text = render_text(self.option_font, f"{int(value * 100)}%", True, WHITE)
         percent_rect = percent_text.get_rect(
             midleft=(rect.right + 10, rect.centery)
         )
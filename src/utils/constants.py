@@ -14,6 +14,9 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 DARK_GREEN = (0, 100, 0)
 LIGHT_GREEN = (144, 238, 144)
+GOLD = (255, 215, 0)
+GRAY = (100, 100, 100)
+DARK_GRAY = (50, 50, 50)
 
 # Paramètres du jeu
 FPS = 60
@@ -21,6 +24,20 @@ GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 SNAKE_SPEED = 10  # cases par seconde
+MAX_TICKS_PER_FRAME = 8  # ticks logiques rattrapés au maximum par frame
+
+# Affichage
+DIRTY_RECT_UPDATES = True  # ne transmettre à l'écran que les zones modifiées
+SCALED_DISPLAY = False  # fenêtre redimensionnable mise à l'échelle par SDL (F11: plein écran)
+TEXT_CACHE_SIZE = 256  # nombre de textes rendus conservés en cache
+IDLE_WAIT_TIMEOUT = 1000  # attente maximale d'un événement sur un écran statique (ms)
+IDLE_ANIMATION_FPS = 20  # cadence des animations d'un écran statique (pause)
+
+# Son
+PROCEDURAL_AUDIO = True  # générer les sons en mémoire plutôt que de lire assets/sounds et assets/music
+AUDIO_THREAD = True  # commandes sonores exécutées par un fil dédié, hors de la boucle du jeu
+MUSIC_FADE_MS = 500  # durée des fondus enchaînés entre deux morceaux
+MAX_PITCH_SEMITONES = 12  # transposition maximale des effets (longueur du serpent, niveau)
 
 # Titres
 GAME_TITLE = "Snake Game"
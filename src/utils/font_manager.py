@@ -0,0 +1,63 @@
+"""
+Module contenant le registre des polices, partagé par tous les écrans.
+"""
+
+import pygame
+
+class FontManager:
+    """
+    Registre des polices chargées, indexées par (fichier, taille).
+    
+    Charger une police lit et analyse le fichier de la fonte: chaque couple
+    (fichier, taille) n'est chargé qu'une fois, à la première demande, puis
+    partagé par le jeu et les écrans de l'interface (qui peuvent être recréés
+    sans recharger leurs polices, comme l'écran de fin de partie).
+    """
+    
+    def __init__(self):
+        """
+        Initialise un registre vide.
+        """
+        self.fonts = {}
+    
+    def get(self, size, face=None):
+        """
+        Renvoie une police, chargée à la première demande.
+        
+        Args:
+            size (int): Taille de la police en pixels
+            face (str, optional): Chemin du fichier de la fonte. Par défaut la police de pygame.
+        
+        Returns:
+            pygame.font.Font: Police partagée
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(face, size)
+        return font
+    
+    def clear(self):
+        """
+        Oublie les polices chargées (par exemple avant pygame.quit()).
+        """
+        self.fonts.clear()
+
+
+# Registre partagé par le jeu et les écrans de l'interface
+font_manager = FontManager()
+
+def get_font(size, face=None):
+    """
+    Renvoie une police du registre partagé.
+    
+    Args:
+        size (int): Taille de la police en pixels
+        face (str, optional): Chemin du fichier de la fonte. Par défaut la police de pygame.
+    
+    Returns:
+        pygame.font.Font: Police partagée
+    """
+    return font_manager.get(size, face)
@@ -8,6 +8,8 @@ import pygame
 from src.utils.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GREEN
 )
+from src.utils.font_manager import get_font
+from src.utils.text_cache import render_text
 
 class HighScore:
     """
@@ -26,9 +28,9 @@ class HighScore:
         self.max_scores = 10  # Nombre maximum de scores à conserver
         
         # Polices pour l'affichage
-        self.title_font = pygame.font.Font(None, 48)
-        self.score_font = pygame.font.Font(None, 36)
-        self.input_font = pygame.font.Font(None, 32)
+        self.title_font = get_font(48)
+        self.score_font = get_font(36)
+        self.input_font = get_font(32)
         
         # État pour la saisie du nom
         self.input_active = False
@@ -161,14 +163,14 @@ class HighScore:
         screen.fill(BLACK)
         
         # Titre
-        title_text = self.title_font.render("Meilleurs Scores", True, WHITE)
+        title_text = render_text(self.title_font, "Meilleurs Scores", True, WHITE)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
         screen.blit(title_text, title_rect)
         
         # Dessiner les scores
         if not self.scores:
             # Pas de scores enregistrés
-            no_score_text = self.score_font.render("Aucun score enregistré", True, WHITE)
+            no_score_text = render_text(self.score_font, "Aucun score enregistré", True, WHITE)
             no_score_rect = no_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             screen.blit(no_score_text, no_score_rect)
         else:
@@ -177,20 +179,20 @@ class HighScore:
                 y_pos = 120 + i * 40
                 
                 # Afficher le rang
-                rank_text = self.score_font.render(f"{i+1}.", True, WHITE)
+                rank_text = render_text(self.score_font, f"{i+1}.", True, WHITE)
                 screen.blit(rank_text, (WINDOW_WIDTH // 4, y_pos))
                 
                 # Afficher le nom
-                name_text = self.score_font.render(entry["name"], True, WHITE)
+                name_text = render_text(self.score_font, entry["name"], True, WHITE)
                 screen.blit(name_text, (WINDOW_WIDTH // 4 + 50, y_pos))
                 
                 # Afficher le score
-                score_text = self.score_font.render(str(entry["score"]), True, WHITE)
+                score_text = render_text(self.score_font, str(entry["score"]), True, WHITE)
                 score_rect = score_text.get_rect(right=WINDOW_WIDTH * 3 // 4)
                 screen.blit(score_text, (score_rect.x, y_pos))
         
         # Instructions
-        instruction_text = self.score_font.render("Appuyez sur ECHAP pour revenir", True, WHITE)
+        instruction_text = render_text(self.score_font, "Appuyez sur ECHAP pour revenir", True, WHITE)
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
         screen.blit(instruction_text, instruction_rect)
     
@@ -208,26 +210,26 @@ class HighScore:
         screen.fill(BLACK)
         
         # Titre
-        title_text = self.title_font.render("Nouveau Meilleur Score!", True, GREEN)
+        title_text = render_text(self.title_font, "Nouveau Meilleur Score!", True, GREEN)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
         screen.blit(title_text, title_rect)
         
         # Score
-        score_text = self.score_font.render(f"Score: {self.current_score}", True, WHITE)
+        score_text = render_text(self.score_font, f"Score: {self.current_score}", True, WHITE)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3 + 50))
         screen.blit(score_text, score_rect)
         
         # Instruction
-        instruction_text = self.score_font.render("Entrez votre nom:", True, WHITE)
+        instruction_text = render_text(self.score_font, "Entrez votre nom:", True, WHITE)
         instruction_rect = instruction_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         screen.blit(instruction_text, instruction_rect)
         
         # Champ de saisie
         pygame.draw.rect(screen, WHITE, self.input_rect, 2)
-        text_surface = self.input_font.render(self.current_name, True, WHITE)
+        text_surface = render_text(self.input_font, self.current_name, True, WHITE)
         screen.blit(text_surface, (self.input_rect.x + 5, self.input_rect.y + 5))
         
         # Instruction de validation
-        enter_text = self.input_font.render("Appuyez sur ENTRÉE pour valider", True, WHITE)
+        enter_text = render_text(self.input_font, "Appuyez sur ENTRÉE pour valider", True, WHITE)
         enter_rect = enter_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
         screen.blit(enter_text, enter_rect)
@@ -2,8 +2,126 @@
 Module contenant la classe SoundManager qui gère les sons et la musique du jeu.
 """
 
+import hashlib
+import io
+import json
 import os
+import sys
+import tempfile
+import threading
+import time
+import wave
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import pygame
+from src.utils.constants import PROCEDURAL_AUDIO, MUSIC_FADE_MS
+from src.utils.synth import Synthesizer, Waveform, SAMPLE_RATE
+
+# Version de la synthèse des sons de test, à incrémenter quand les formes
+# d'onde changent pour que les fichiers déjà générés soient recréés
+PLACEHOLDER_VERSION = 2
+
+# Fichier (dans assets/) qui associe chaque son de test à sa recette et au
+# hachage du fichier écrit
+PLACEHOLDER_MANIFEST = ".placeholders.json"
+
+def _recipe_key(notes):
+    """
+    Identifie la recette d'un son de test (notes et version de la synthèse).
+    """
+    recipe = json.dumps([PLACEHOLDER_VERSION, SAMPLE_RATE, notes], sort_keys=True)
+    return hashlib.sha256(recipe.encode()).hexdigest()
+
+def _file_hash(path):
+    """
+    Renvoie le hachage SHA-256 du contenu d'un fichier.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _wav_hash(frames):
+    """
+    Renvoie le hachage SHA-256 du fichier WAV que produiraient des échantillons.
+    """
+    buffer = io.BytesIO()
+    _write_wav(buffer, frames)
+    return hashlib.sha256(buffer.getvalue()).hexdigest()
+
+def _write_atomic(path, write):
+    """
+    Écrit un fichier via un fichier temporaire du même dossier renommé à la
+    fin: un lecteur (ou un lancement interrompu) ne voit jamais de fichier
+    à moitié écrit.
+    
+    Le fichier garde les droits du fichier remplacé, ou ceux d'un fichier
+    créé normalement (mkstemp ne les donne qu'au propriétaire).
+    
+    Args:
+        path (str): Chemin du fichier
+        write (callable): Fonction qui écrit le contenu dans le fichier binaire ouvert
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def _write_wav(f, frames):
+    """
+    Écrit des échantillons 16 bits mono dans un fichier WAV ouvert.
+    """
+    with wave.open(f, "wb") as wav:
+        wav.setnchannels(1)  # Mono
+        wav.setsampwidth(2)  # 16 bits
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(frames)
+
+def _little_endian(frames):
+    """
+    Renvoie des échantillons 16 bits natifs dans l'ordre little-endian des WAV.
+    """
+    if sys.byteorder == "big":
+        samples = array('h', frames)
+        samples.byteswap()
+        frames = samples.tobytes()
+    return frames
+
+def _melody(base_frequency, steps, note_duration, **params):
+    """
+    Construit une suite de notes de même durée.
+    
+    Args:
+        base_frequency (float): Fréquence de référence en Hz
+        steps (list): Hauteur de chaque note en demi-tons au-dessus de la
+                      référence (None pour un silence)
+        note_duration (float): Durée d'une note en secondes
+        **params: Autres paramètres des notes (voir Synthesizer.note)
+    
+    Returns:
+        list: Paramètres des notes
+    """
+    notes = []
+    for step in steps:
+        note = dict(params, frequency=base_frequency * 2 ** ((step or 0) / 12), duration=note_duration)
+        if step is None:
+            note["volume"] = 0.0
+        notes.append(note)
+    return notes
 
 class SoundEffect:
     """
@@ -17,36 +135,242 @@ class SoundEffect:
     MENU_NAVIGATE = "menu_navigate"
 
 
+class SoundGroup:
+    """
+    Énumération des groupes de canaux réservés aux effets sonores.
+    """
+    MOVEMENT = "movement"
+    GAMEPLAY = "gameplay"
+    INTERFACE = "interface"
+
+
+class StealPolicy:
+    """
+    Énumération des comportements d'un groupe dont tous les canaux sont occupés.
+    """
+    OLDEST = "oldest"  # interrompre l'effet lancé le plus tôt
+    DROP = "drop"  # ignorer le nouvel effet
+
+
+class PlayResult:
+    """
+    Énumération des issues d'une demande d'effet sonore (clés des compteurs).
+    """
+    PLAYED = "played"  # joué sur un canal libre
+    STOLEN = "stolen"  # joué en interrompant un autre effet du groupe
+    DROPPED = "dropped"  # ignoré: tous les canaux du groupe sont occupés
+    COALESCED = "coalesced"  # ignoré: le même effet vient d'être lancé
+
+
+# Groupes de canaux: nombre de canaux et comportement quand ils sont tous occupés
+SOUND_GROUPS = {
+    SoundGroup.MOVEMENT: (1, StealPolicy.DROP),
+    SoundGroup.GAMEPLAY: (3, StealPolicy.OLDEST),
+    SoundGroup.INTERFACE: (2, StealPolicy.OLDEST)
+}
+
+# Effets: groupe de canaux et intervalle minimal entre deux déclenchements (s)
+EFFECT_ROUTING = {
+    SoundEffect.MOVE: (SoundGroup.MOVEMENT, 0.05),
+    SoundEffect.EAT: (SoundGroup.GAMEPLAY, 0.03),
+    SoundEffect.GAME_OVER: (SoundGroup.GAMEPLAY, 0.5),
+    SoundEffect.LEVEL_UP: (SoundGroup.GAMEPLAY, 0.2),
+    SoundEffect.MENU_SELECT: (SoundGroup.INTERFACE, 0.05),
+    SoundEffect.MENU_NAVIGATE: (SoundGroup.INTERFACE, 0.03)
+}
+
+# Effets générés: suite de notes (paramètres de Synthesizer.note) par effet
+EFFECT_PRESETS = {
+    SoundEffect.MOVE: [
+        {"frequency": 300, "duration": 0.04, "volume": 0.2, "sustain": 0.3}
+    ],
+    SoundEffect.EAT: [
+        {"frequency": 600, "end_frequency": 900, "duration": 0.08, "volume": 0.35, "sustain": 0.5}
+    ],
+    SoundEffect.GAME_OVER: [
+        {"frequency": 400, "end_frequency": 100, "duration": 0.7, "waveform": Waveform.SAWTOOTH,
+         "volume": 0.35, "sustain": 0.2, "release": 0.1}
+    ],
+    SoundEffect.LEVEL_UP: _melody(523.25, [0, 4, 7, 12], 0.07, waveform=Waveform.TRIANGLE, volume=0.5),
+    SoundEffect.MENU_SELECT: _melody(500, [0, 7], 0.06, volume=0.3, sustain=0.6),
+    SoundEffect.MENU_NAVIGATE: [
+        {"frequency": 500, "duration": 0.03, "volume": 0.25, "sustain": 0.4}
+    ]
+}
+
+# Boucles musicales générées, par nom de morceau (sans extension)
+MUSIC_PRESETS = {
+    "background": _melody(
+        130.81, [0, 7, 12, 7, 4, 7, 12, 7, 5, 9, 12, 9, 7, 11, 14, 11], 0.25,
+        waveform=Waveform.TRIANGLE, volume=0.25, sustain=0.6, release=0.03
+    ),
+    "game_background": _melody(
+        130.81, [0, 12, 7, 12, 3, 12, 7, None, 5, 12, 8, 12, 7, 11, 14, None] * 2, 0.125,
+        volume=0.12, sustain=0.4
+    )
+}
+
+# Extensions essayées, dans l'ordre, quand le fichier de musique demandé n'existe pas
+MUSIC_EXTENSIONS = (".mp3", ".ogg", ".wav")
+
+# Sons de test écrits dans assets/ en mode fichiers: (dossier, fichier) -> notes
+PLACEHOLDER_SOUNDS = {("sounds", f"{name}.wav"): notes for name, notes in EFFECT_PRESETS.items()}
+PLACEHOLDER_SOUNDS.update({("music", f"{name}.wav"): notes for name, notes in MUSIC_PRESETS.items()})
+
+
+class ChannelGroup:
+    """
+    Canaux du mixeur réservés à une catégorie d'effets.
+    
+    Un effet est joué sur un canal libre du groupe. Quand ils sont tous
+    occupés, la politique du groupe décide d'interrompre l'effet le plus
+    ancien ou d'ignorer le nouveau: le nombre de voix simultanées reste
+    borné quel que soit le rythme des demandes.
+    """
+    
+    def __init__(self, channels, policy):
+        """
+        Initialise un groupe.
+        
+        Args:
+            channels (list): Canaux du groupe (pygame.mixer.Channel)
+            policy (str): Comportement quand tous les canaux sont occupés (StealPolicy)
+        """
+        self.channels = channels
+        self.policy = policy
+        self.started = [0.0] * len(channels)  # Instant du dernier effet lancé sur chaque canal
+    
+    def play(self, sound, now):
+        """
+        Joue un son sur un canal du groupe.
+        
+        Args:
+            sound (pygame.mixer.Sound): Son à jouer
+            now (float): Instant de la demande en secondes
+        
+        Returns:
+            str: Issue de la demande (PlayResult)
+        """
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                channel.play(sound)
+                self.started[index] = now
+                return PlayResult.PLAYED
+        
+        if self.policy == StealPolicy.DROP:
+            return PlayResult.DROPPED
+        
+        index = self.started.index(min(self.started))
+        self.channels[index].play(sound)
+        self.started[index] = now
+        return PlayResult.STOLEN
+    
+    def stop(self):
+        """
+        Arrête tous les effets du groupe.
+        """
+        for channel in self.channels:
+            channel.stop()
+
+
 class SoundManager:
     """
     Classe gérant les sons et la musique du jeu.
+    
+    En mode procédural, les effets et les boucles musicales sont générés en
+    mémoire à partir des préréglages (EFFECT_PRESETS, MUSIC_PRESETS) et
+    passés directement au mixeur, sans aucun accès aux fichiers. Chaque son
+    n'est généré qu'une fois, à sa première utilisation, puis conservé. Les
+    effets peuvent être transposés (par exemple selon la longueur du serpent
+    ou le niveau).
+    
+    En mode fichiers, les sons sont chargés depuis assets/ (ce qui permet de
+    les personnaliser).
+    
+    Chaque effet est joué sur les canaux réservés de son groupe
+    (EFFECT_ROUTING, SOUND_GROUPS), et un effet redemandé avant son
+    intervalle minimal est ignoré: des appuis de touches rapides ou un bot
+    ne saturent pas le mixeur. Les compteurs de get_stats() indiquent les
+    effets joués, interrompus ou ignorés.
+    
+    Dans les deux modes, les morceaux de musique sont générés ou décodés
+    par un fil d'exécution dédié, une seule fois (un fichier introuvable
+    aussi n'est cherché qu'une fois), et joués sur deux canaux réservés du
+    mixeur. Un changement de morceau est un fondu enchaîné géré par le
+    mixeur: play_music() rend la main immédiatement et le nouveau morceau
+    démarre dès qu'il est prêt.
     """
     
-    def __init__(self):
+    def __init__(self, procedural=PROCEDURAL_AUDIO):
         """
         Initialise un nouveau gestionnaire de sons.
+        
+        Args:
+            procedural (bool, optional): Générer les sons en mémoire plutôt que de lire
+                                         les fichiers de assets/. Par défaut PROCEDURAL_AUDIO.
         """
         # Initialiser le module de son de Pygame
         pygame.mixer.init()
         
-        # Créer les dossiers de sons s'ils n'existent pas
         self.sound_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "sounds")
         self.music_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "music")
+        self.procedural = procedural
         
-        os.makedirs(self.sound_dir, exist_ok=True)
-        os.makedirs(self.music_dir, exist_ok=True)
-        
-        # Dictionnaire pour stocker les sons
+        # Dictionnaire pour stocker les sons chargés depuis les fichiers
         self.sounds = {}
         
+        # Sons générés: (effet, transposition en demi-tons) -> pygame.mixer.Sound
+        self.generated = {}
+        
+        if procedural:
+            # Synthèse directement dans le format du mixeur
+            frequency, size, channels = pygame.mixer.get_init()
+            self.synth = Synthesizer(frequency, size, channels)
+        else:
+            self.synth = None
+            
+            # Créer les dossiers de sons s'ils n'existent pas
+            os.makedirs(self.sound_dir, exist_ok=True)
+            os.makedirs(self.music_dir, exist_ok=True)
+        
         # Paramètres
         self.sound_volume = 0.7  # 70% du volume max
         self.music_volume = 0.5  # 50% du volume max
         self.sound_enabled = True
         self.music_enabled = True
         
+        # Canaux du mixeur tous réservés: deux pour les fondus enchaînés de
+        # la musique, puis ceux de chaque groupe d'effets
+        num_channels = 2 + sum(count for count, _ in SOUND_GROUPS.values())
+        pygame.mixer.set_num_channels(num_channels)
+        pygame.mixer.set_reserved(num_channels)
+        self.music_channels = [pygame.mixer.Channel(0), pygame.mixer.Channel(1)]
+        self.music = self.music_channels[0]
+        
+        self.channel_groups = {}
+        first = 2
+        for group, (count, policy) in SOUND_GROUPS.items():
+            self.channel_groups[group] = ChannelGroup(
+                [pygame.mixer.Channel(index) for index in range(first, first + count)], policy
+            )
+            first += count
+        
+        # Instant du dernier déclenchement de chaque effet, et issues des demandes par effet
+        self.last_played = {}
+        self.effect_stats = {}
+        self.current_track = None
+        self.track_pending = False  # Démarrage de current_track en attente de son chargement
+        self.music_lock = threading.Lock()
+        
+        # Morceaux: nom (sans extension) -> Future du son (None s'il est introuvable)
+        self.tracks = {}
+        self.loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        
         # Chargez les sons (s'ils existent)
-        self._load_sounds()
+        if not procedural:
+            self._load_sounds()
+        else:
+            self.preload_music(*MUSIC_PRESETS)
     
     def _load_sounds(self):
         """
@@ -80,22 +404,164 @@ class SoundManager:
             else:
                 print(f"Fichier son non trouvé: {file_path}")
     
-    def play_sound(self, sound_name):
+    def _generate(self, notes, semitones=0):
         """
-        Joue un effet sonore.
+        Génère un son dans le format du mixeur.
+        
+        Args:
+            notes (list): Paramètres des notes (voir Synthesizer.note)
+            semitones (int, optional): Transposition en demi-tons. Par défaut 0.
+        
+        Returns:
+            pygame.mixer.Sound: Son généré
+        """
+        return pygame.mixer.Sound(buffer=self.synth.render(notes, semitones))
+    
+    def _effect_sound(self, sound_name, semitones):
+        """
+        Renvoie le son d'un effet (généré à la première demande en mode procédural).
+        
+        Returns:
+            pygame.mixer.Sound or None: Son de l'effet, ou None s'il n'existe pas
+        """
+        if not self.procedural:
+            return self.sounds.get(sound_name)
+        
+        key = (sound_name, semitones)
+        sound = self.generated.get(key)
+        if sound is None and sound_name in EFFECT_PRESETS:
+            sound = self.generated[key] = self._generate(EFFECT_PRESETS[sound_name], semitones)
+            sound.set_volume(self.sound_volume)
+        return sound
+    
+    def play_sound(self, sound_name, semitones=0):
+        """
+        Joue un effet sonore sur les canaux de son groupe, sauf s'il vient
+        d'être joué (intervalle minimal de EFFECT_ROUTING).
         
         Args:
             sound_name (SoundEffect): Nom de l'effet sonore à jouer
+            semitones (int, optional): Transposition en demi-tons (sons générés
+                                       uniquement). Par défaut 0.
+        
+        Returns:
+            str or None: Issue de la demande (PlayResult), ou None si l'effet
+                         n'a pas été demandé (sons désactivés, effet inconnu)
         """
-        if not self.sound_enabled:
-            return
+        if not self.sound_enabled or sound_name not in EFFECT_ROUTING:
+            return None
         
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        sound = self._effect_sound(sound_name, semitones)
+        if sound is None:
+            return None
+        
+        group, min_interval = EFFECT_ROUTING[sound_name]
+        now = time.perf_counter()
+        last = self.last_played.get(sound_name)
+        if last is not None and now - last < min_interval:
+            result = PlayResult.COALESCED
+        else:
+            result = self.channel_groups[group].play(sound, now)
+            if result != PlayResult.DROPPED:
+                self.last_played[sound_name] = now
+        
+        stats = self.effect_stats.get(sound_name)
+        if stats is None:
+            stats = self.effect_stats[sound_name] = Counter()
+        stats[result] += 1
+        return result
+    
+    def get_stats(self):
+        """
+        Renvoie les compteurs des demandes d'effets sonores.
+        
+        Returns:
+            dict: Nombre total de demandes par issue (PlayResult), et détail
+                  par effet sous la clé "effects"
+        """
+        totals = Counter()
+        for stats in self.effect_stats.values():
+            totals.update(stats)
+        result = {key: totals[key] for key in (
+            PlayResult.PLAYED, PlayResult.STOLEN, PlayResult.DROPPED, PlayResult.COALESCED
+        )}
+        result["effects"] = {name: dict(stats) for name, stats in self.effect_stats.items()}
+        return result
+    
+    def _find_music_file(self, music_name):
+        """
+        Cherche le fichier d'un morceau, sous son nom ou avec une autre extension.
+        
+        Args:
+            music_name (str): Nom du fichier de musique
+        
+        Returns:
+            str or None: Chemin du fichier, ou None s'il n'existe pas
+        """
+        stem = os.path.splitext(music_name)[0]
+        for file_name in (music_name,) + tuple(stem + extension for extension in MUSIC_EXTENSIONS):
+            path = os.path.join(self.music_dir, file_name)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _load_track(self, music_name):
+        """
+        Génère ou décode un morceau (appelé par le fil de chargement).
+        
+        Args:
+            music_name (str): Nom du fichier de musique
+        
+        Returns:
+            pygame.mixer.Sound or None: Morceau, ou None s'il est introuvable
+        """
+        if self.procedural:
+            notes = MUSIC_PRESETS.get(os.path.splitext(music_name)[0])
+            return None if notes is None else self._generate(notes)
+        
+        music_path = self._find_music_file(music_name)
+        if music_path is None:
+            print(f"Fichier de musique non trouvé: {os.path.join(self.music_dir, music_name)}")
+            return None
+        try:
+            return pygame.mixer.Sound(music_path)
+        except pygame.error as e:
+            print(f"Erreur lors du chargement de la musique {music_name}: {e}")
+            return None
+    
+    def _request_track(self, music_name):
+        """
+        Renvoie le chargement d'un morceau, en le lançant à la première demande.
+        
+        Args:
+            music_name (str): Nom du fichier de musique
+        
+        Returns:
+            concurrent.futures.Future: Chargement du morceau
+        """
+        track = os.path.splitext(music_name)[0]
+        future = self.tracks.get(track)
+        if future is None:
+            future = self.tracks[track] = self.loader.submit(self._load_track, music_name)
+        return future
+    
+    def preload_music(self, *music_names):
+        """
+        Lance en arrière-plan le chargement de morceaux qui seront joués plus tard.
+        
+        Args:
+            *music_names (str): Noms des fichiers de musique
+        """
+        for music_name in music_names:
+            self._request_track(music_name)
     
     def play_music(self, music_name="background.mp3", loop=True):
         """
-        Joue de la musique en arrière-plan.
+        Joue de la musique en arrière-plan, en fondu enchaîné avec le morceau
+        en cours. L'appel ne bloque pas: si le morceau n'est pas encore
+        chargé, il démarre dès qu'il est prêt. Un morceau déjà en cours
+        continue sans reprendre au début, de même qu'un morceau dont le
+        démarrage est déjà prévu.
         
         Args:
             music_name (str, optional): Nom du fichier de musique. Par défaut "background.mp3".
@@ -104,26 +570,65 @@ class SoundManager:
         if not self.music_enabled:
             return
         
-        # Arrêter la musique en cours
-        pygame.mixer.music.stop()
-        
-        # Charger et jouer la nouvelle musique
-        music_path = os.path.join(self.music_dir, music_name)
-        if os.path.exists(music_path):
-            try:
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1 if loop else 0)
-            except pygame.error as e:
-                print(f"Erreur lors du chargement de la musique {music_name}: {e}")
-        else:
-            print(f"Fichier de musique non trouvé: {music_path}")
+        track = os.path.splitext(music_name)[0]
+        with self.music_lock:
+            if track == self.current_track and (self.music.get_busy() or self.track_pending):
+                return
+            self.current_track = track
+            self.track_pending = True
+        
+        def start(future):
+            if not future.cancelled():
+                self._start_track(track, future.result(), loop)
+        
+        # Exécuté tout de suite si le morceau est déjà chargé, sinon par le fil de chargement
+        self._request_track(music_name).add_done_callback(start)
+    
+    def _start_track(self, track, sound, loop):
+        """
+        Passe au morceau demandé: le morceau en cours s'éteint pendant que le
+        nouveau monte, sur l'autre canal.
+        
+        Args:
+            track (str): Nom du morceau
+            sound (pygame.mixer.Sound or None): Morceau chargé (None: silence)
+            loop (bool): Jouer le morceau en boucle
+        """
+        with self.music_lock:
+            # Un autre morceau a été demandé pendant le chargement
+            if track != self.current_track:
+                return
+            self.track_pending = False
+            
+            if self.music.get_busy():
+                self.music.fadeout(MUSIC_FADE_MS)
+            if sound is None:
+                return
+            
+            channel = self.music_channels[1] if self.music is self.music_channels[0] else self.music_channels[0]
+            channel.stop()
+            channel.set_volume(self.music_volume)
+            channel.play(sound, -1 if loop else 0, fade_ms=MUSIC_FADE_MS)
+            self.music = channel
     
     def stop_music(self):
         """
         Arrête la musique en cours.
         """
-        pygame.mixer.music.stop()
+        with self.music_lock:
+            self.current_track = None
+            self.track_pending = False
+            for channel in self.music_channels:
+                channel.stop()
+    
+    def close(self):
+        """
+        Abandonne les chargements de musique en attente (à appeler avant de quitter pygame).
+        """
+        # Équivalent de shutdown(cancel_futures=True), absent avant Python 3.9
+        for future in self.tracks.values():
+            future.cancel()
+        self.loader.shutdown(wait=True)
     
     def toggle_sound(self):
         """
@@ -144,13 +649,14 @@ class SoundManager:
         """
         self.music_enabled = not self.music_enabled
         
-        if self.music_enabled:
-            # Reprendre la musique
-            pygame.mixer.music.unpause()
-        else:
-            # Mettre en pause la musique
-            pygame.mixer.music.pause()
-            
+        for channel in self.music_channels:
+            if self.music_enabled:
+                # Reprendre la musique
+                channel.unpause()
+            else:
+                # Mettre en pause la musique
+                channel.pause()
+        
         return self.music_enabled
     
     def set_sound_volume(self, volume):
@@ -164,7 +670,7 @@ class SoundManager:
         self.sound_volume = max(0.0, min(1.0, volume))
         
         # Mettre à jour le volume de tous les sons
-        for sound in self.sounds.values():
+        for sound in list(self.sounds.values()) + list(self.generated.values()):
             sound.set_volume(self.sound_volume)
     
     def set_music_volume(self, volume):
@@ -178,80 +684,67 @@ class SoundManager:
         self.music_volume = max(0.0, min(1.0, volume))
         
         # Mettre à jour le volume de la musique
-        pygame.mixer.music.set_volume(self.music_volume)
+        for channel in self.music_channels:
+            channel.set_volume(self.music_volume)
     
     def create_placeholder_sounds(self):
         """
-        Crée des fichiers sons vides pour les tests.
-        Cette méthode est utile pour le développement.
-        """
-        import wave
-        import struct
+        Crée les sons de test manquants en mode fichiers, à partir des mêmes
+        préréglages que le mode procédural (utile pour le développement et
+        comme modèles de sons personnalisés).
         
-        # S'assurer que les dossiers existent
-        os.makedirs(self.sound_dir, exist_ok=True)
-        os.makedirs(self.music_dir, exist_ok=True)
+        Un manifeste dans assets/ retient, pour chaque son généré, sa recette
+        et le hachage du fichier écrit. Au lancement suivant, un fichier dont
+        le hachage correspond à une recette inchangée est conservé sans rien
+        recalculer, et un fichier remplacé par l'utilisateur (son
+        personnalisé) n'est jamais écrasé.
         
-        # Créer un son simple pour chaque effet
-        for sound_name in [
-            "move.wav", "eat.wav", "game_over.wav", 
-            "level_up.wav", "menu_select.wav", "menu_navigate.wav"
-        ]:
-            file_path = os.path.join(self.sound_dir, sound_name)
-            
-            # Créer un fichier WAV vide
-            with wave.open(file_path, "w") as f:
-                f.setnchannels(1)  # Mono
-                f.setsampwidth(2)  # 16 bits
-                f.setframerate(44100)  # 44.1 kHz
-                
-                # Générer un bip court
-                duration = 0.2  # secondes
-                frequency = 440  # Hz (note A4)
-                
-                # Différentes fréquences pour différents sons
-                if "move" in sound_name:
-                    frequency = 300
-                elif "eat" in sound_name:
-                    frequency = 600
-                elif "game_over" in sound_name:
-                    frequency = 200
-                elif "level_up" in sound_name:
-                    frequency = 800
-                elif "menu" in sound_name:
-                    frequency = 500
-                
-                # Générer les données audio
-                num_frames = int(duration * 44100)
-                data = []
-                for i in range(num_frames):
-                    t = float(i) / 44100  # Temps en secondes
-                    value = int(32767 * 0.5 * (
-                        1 if i < num_frames // 2 else 0
-                    ) * (1 - t / duration))
-                    data.append(struct.pack('<h', value))
-                
-                f.writeframes(b''.join(data))
-        
-        # Créer un fichier de musique simple (utiliser un WAV pour la simplicité)
-        music_path = os.path.join(self.music_dir, "background.wav")
-        with wave.open(music_path, "w") as f:
-            f.setnchannels(1)  # Mono
-            f.setsampwidth(2)  # 16 bits
-            f.setframerate(44100)  # 44.1 kHz
-            
-            # Générer une boucle simple
-            duration = 5.0  # secondes
-            frequency = 260  # Hz (note C4)
+        Returns:
+            list: Chemins des fichiers (re)générés
+        """
+        assets_dir = os.path.dirname(self.sound_dir)
+        manifest_path = os.path.join(assets_dir, PLACEHOLDER_MANIFEST)
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        
+        dirs = {"sounds": self.sound_dir, "music": self.music_dir}
+        created = []
+        updated = {}
+        synth = Synthesizer(SAMPLE_RATE, -16, 1)
+        for (folder, file_name), notes in PLACEHOLDER_SOUNDS.items():
+            key = f"{folder}/{file_name}"
+            path = os.path.join(dirs[folder], file_name)
+            recipe = _recipe_key(notes)
+            entry = manifest.get(key)
             
-            # Générer les données audio
-            num_frames = int(duration * 44100)
-            data = []
-            for i in range(num_frames):
-                t = float(i) / 44100  # Temps en secondes
-                value = int(16384 * 0.5 * (
-                    0.5 + 0.5 * ((t * frequency) % 1 > 0.5)
-                ))
-                data.append(struct.pack('<h', value))
+            if os.path.exists(path):
+                digest = _file_hash(path)
+                if entry is not None and digest == entry["sha256"]:
+                    # Son de test à jour, ou son personnalisé déjà reconnu
+                    if entry["recipe"] in (recipe, None):
+                        updated[key] = entry
+                        continue
+                else:
+                    # Fichier inconnu du manifeste: son de test identique
+                    # (écrit par une version précédente) ou son personnalisé
+                    frames = _little_endian(synth.render(notes))
+                    is_placeholder = digest == _wav_hash(frames)
+                    updated[key] = {"recipe": recipe if is_placeholder else None, "sha256": digest}
+                    continue
             
-            f.writeframes(b''.join(data))
+            frames = _little_endian(synth.render(notes))
+            os.makedirs(dirs[folder], exist_ok=True)
+            _write_atomic(path, lambda f: _write_wav(f, frames))
+            updated[key] = {"recipe": recipe, "sha256": _file_hash(path)}
+            created.append(path)
+        
+        if updated != manifest:
+            _write_atomic(manifest_path, lambda f: f.write(json.dumps(updated, indent=2, sort_keys=True).encode()))
+        
+        # Charger les sons qui viennent d'être créés
+        if created:
+            self._load_sounds()
+        return created
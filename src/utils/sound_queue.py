@@ -0,0 +1,295 @@
+"""
+Module contenant les interfaces de son utilisées par le jeu: une file de
+commandes traitée par un fil d'exécution dédié au mixeur, et un récepteur
+muet quand il n'y a pas de sortie audio.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future
+import pygame
+from src.utils.constants import AUDIO_THREAD
+from src.utils.sound_manager import SoundManager, PlayResult
+
+class SoundSink:
+    """
+    Interface de SoundManager sans aucun son (audio factice ou absent).
+    
+    Les réglages (activation, volumes) sont conservés pour l'écran des
+    options, mais toutes les commandes sont ignorées sans aucun travail.
+    """
+    
+    def __init__(self):
+        """
+        Initialise des réglages par défaut.
+        """
+        self.sound_volume = 0.7  # 70% du volume max
+        self.music_volume = 0.5  # 50% du volume max
+        self.sound_enabled = True
+        self.music_enabled = True
+    
+    def play_sound(self, sound_name, semitones=0):
+        """
+        Ignore un effet sonore.
+        """
+        return None
+    
+    def play_music(self, music_name="background.mp3", loop=True):
+        """
+        Ignore une demande de musique.
+        """
+    
+    def preload_music(self, *music_names):
+        """
+        Ignore un préchargement de musique.
+        """
+    
+    def stop_music(self):
+        """
+        Ignore un arrêt de la musique.
+        """
+    
+    def toggle_sound(self):
+        """
+        Active/désactive les effets sonores.
+        
+        Returns:
+            bool: Nouvel état des effets sonores
+        """
+        self.sound_enabled = not self.sound_enabled
+        return self.sound_enabled
+    
+    def toggle_music(self):
+        """
+        Active/désactive la musique.
+        
+        Returns:
+            bool: Nouvel état de la musique
+        """
+        self.music_enabled = not self.music_enabled
+        return self.music_enabled
+    
+    def set_sound_volume(self, volume):
+        """
+        Règle le volume des effets sonores.
+        
+        Args:
+            volume (float): Nouveau volume (0.0 à 1.0)
+        """
+        self.sound_volume = max(0.0, min(1.0, volume))
+    
+    def set_music_volume(self, volume):
+        """
+        Règle le volume de la musique.
+        
+        Args:
+            volume (float): Nouveau volume (0.0 à 1.0)
+        """
+        self.music_volume = max(0.0, min(1.0, volume))
+    
+    def get_stats(self):
+        """
+        Renvoie des compteurs d'effets sonores vides.
+        
+        Returns:
+            dict: Même forme que SoundManager.get_stats()
+        """
+        result = {key: 0 for key in (
+            PlayResult.PLAYED, PlayResult.STOLEN, PlayResult.DROPPED, PlayResult.COALESCED
+        )}
+        result["effects"] = {}
+        return result
+    
+    def close(self):
+        """
+        Rien à libérer.
+        """
+
+
+class SoundQueue(SoundSink):
+    """
+    Interface de SoundManager qui ne touche jamais au mixeur depuis le fil
+    du jeu.
+    
+    Chaque appel dépose une commande (nom de méthode et arguments) dans une
+    file, et un fil d'exécution dédié les exécute dans l'ordre sur le
+    SoundManager: une latence du mixeur ou un blocage du pilote audio ne
+    rallonge jamais un tick. Les réglages sont tenus à jour immédiatement
+    ici, pour que l'écran des options affiche le nouvel état sans attendre.
+    """
+    
+    def __init__(self, manager):
+        """
+        Démarre le fil audio.
+        
+        Args:
+            manager (SoundManager): Gestionnaire de sons, utilisé uniquement par le fil audio
+        """
+        super().__init__()
+        self.manager = manager
+        self.sound_volume = manager.sound_volume
+        self.music_volume = manager.music_volume
+        self.sound_enabled = manager.sound_enabled
+        self.music_enabled = manager.music_enabled
+        
+        self.commands = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        """
+        Boucle du fil audio: exécute les commandes jusqu'à la commande d'arrêt (None).
+        """
+        while True:
+            command = self.commands.get()
+            if command is None:
+                return
+            name, args, future = command
+            try:
+                result = getattr(self.manager, name)(*args)
+            except Exception as e:
+                if future is None:
+                    print(f"Erreur de la commande sonore {name}: {e}")
+                else:
+                    future.set_exception(e)
+            else:
+                if future is not None:
+                    future.set_result(result)
+    
+    def _send(self, name, *args):
+        """
+        Dépose une commande sans attendre son exécution.
+        """
+        self.commands.put((name, args, None))
+    
+    def _call(self, name, *args):
+        """
+        Dépose une commande et attend son résultat.
+        """
+        future = Future()
+        self.commands.put((name, args, future))
+        return future.result()
+    
+    def play_sound(self, sound_name, semitones=0):
+        """
+        Demande un effet sonore.
+        
+        Args:
+            sound_name (SoundEffect): Nom de l'effet sonore à jouer
+            semitones (int, optional): Transposition en demi-tons. Par défaut 0.
+        
+        Returns:
+            None: L'issue (PlayResult) n'est connue que du fil audio
+        """
+        if self.sound_enabled:
+            self.commands.put(("play_sound", (sound_name, semitones), None))
+        return None
+    
+    def play_music(self, music_name="background.mp3", loop=True):
+        """
+        Demande un morceau de musique (voir SoundManager.play_music).
+        """
+        if self.music_enabled:
+            self._send("play_music", music_name, loop)
+    
+    def preload_music(self, *music_names):
+        """
+        Demande le préchargement de morceaux de musique.
+        """
+        self._send("preload_music", *music_names)
+    
+    def stop_music(self):
+        """
+        Demande l'arrêt de la musique.
+        """
+        self._send("stop_music")
+    
+    def toggle_sound(self):
+        """
+        Active/désactive les effets sonores.
+        
+        Returns:
+            bool: Nouvel état des effets sonores
+        """
+        self._send("toggle_sound")
+        return super().toggle_sound()
+    
+    def toggle_music(self):
+        """
+        Active/désactive la musique.
+        
+        Returns:
+            bool: Nouvel état de la musique
+        """
+        self._send("toggle_music")
+        return super().toggle_music()
+    
+    def set_sound_volume(self, volume):
+        """
+        Règle le volume des effets sonores.
+        
+        Args:
+            volume (float): Nouveau volume (0.0 à 1.0)
+        """
+        super().set_sound_volume(volume)
+        self._send("set_sound_volume", self.sound_volume)
+    
+    def set_music_volume(self, volume):
+        """
+        Règle le volume de la musique.
+        
+        Args:
+            volume (float): Nouveau volume (0.0 à 1.0)
+        """
+        super().set_music_volume(volume)
+        self._send("set_music_volume", self.music_volume)
+    
+    def get_stats(self):
+        """
+        Renvoie les compteurs des effets sonores, lus par le fil audio après
+        les commandes déjà déposées.
+        
+        Returns:
+            dict: Voir SoundManager.get_stats()
+        """
+        return self._call("get_stats")
+    
+    def close(self):
+        """
+        Exécute les commandes en attente, arrête le fil audio puis le gestionnaire.
+        """
+        if self.thread.is_alive():
+            self.commands.put(None)
+            self.thread.join()
+        self.manager.close()
+
+
+def create_sound_manager(threaded=AUDIO_THREAD):
+    """
+    Crée l'interface de son du jeu.
+    
+    Args:
+        threaded (bool, optional): Passer par une file de commandes et un fil audio.
+                                   Par défaut AUDIO_THREAD.
+    
+    Returns:
+        SoundSink, SoundQueue or SoundManager: Récepteur muet si l'audio est
+        factice ou indisponible, sinon le gestionnaire de sons (derrière sa
+        file de commandes si threaded)
+    """
+    if os.environ.get("SDL_AUDIODRIVER") == "dummy":
+        return SoundSink()
+    
+    try:
+        manager = SoundManager()
+    except pygame.error as e:
+        print(f"Son désactivé, aucune sortie audio: {e}")
+        return SoundSink()
+    
+    # Pour les tests, créer des sons placeholders (les sons générés en
+    # mémoire n'utilisent pas de fichiers)
+    if not manager.procedural:
+        manager.create_placeholder_sounds()
+    
+    return SoundQueue(manager) if threaded else manager
@@ -0,0 +1,204 @@
+"""
+Module contenant la synthèse procédurale des sons: notes paramétrées (forme
+d'onde, glissement de fréquence, enveloppe) rendues directement dans le
+format du mixeur, sans passer par des fichiers.
+"""
+
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: la synthèse se rabat sur le module array
+    np = None
+
+# Fréquence d'échantillonnage par défaut
+SAMPLE_RATE = 44100
+
+class Waveform:
+    """
+    Énumération des formes d'onde disponibles.
+    """
+    SINE = "sine"
+    SQUARE = "square"
+    TRIANGLE = "triangle"
+    SAWTOOTH = "sawtooth"
+
+
+# Codage des échantillons par format du mixeur (taille renvoyée par
+# pygame.mixer.get_init()): (type du module array, amplitude, décalage)
+SAMPLE_FORMATS = {
+    -8: ('b', 127, 0),
+    8: ('B', 127, 128),
+    -16: ('h', 32767, 0),
+    16: ('H', 32767, 32768),
+    32: ('f', 1.0, 0)
+}
+
+def _wave_array(waveform, phase):
+    """
+    Renvoie les valeurs (entre -1 et 1) d'une forme d'onde pour un tableau
+    NumPy de positions dans la période (entre 0 et 1).
+    """
+    if waveform == Waveform.SQUARE:
+        return np.where(phase < 0.5, 1.0, -1.0)
+    if waveform == Waveform.TRIANGLE:
+        return 4.0 * np.abs(phase - 0.5) - 1.0
+    if waveform == Waveform.SAWTOOTH:
+        return 2.0 * phase - 1.0
+    return np.sin(2 * np.pi * phase)
+
+
+class Synthesizer:
+    """
+    Générateur de sons dans un format d'échantillons donné (celui du mixeur).
+    
+    Un son est une suite de notes, chacune décrite par un dictionnaire de
+    paramètres de note() (voir les préréglages de SoundManager). Les
+    échantillons sont calculés en flottants par NumPy, ou par des
+    compréhensions de listes et le module array s'il n'est pas installé,
+    puis codés dans le format demandé et dupliqués sur chaque canal.
+    """
+    
+    def __init__(self, sample_rate=SAMPLE_RATE, size=-16, channels=1):
+        """
+        Initialise un générateur.
+        
+        Args:
+            sample_rate (int, optional): Fréquence d'échantillonnage en Hz. Par défaut SAMPLE_RATE.
+            size (int, optional): Format des échantillons (voir SAMPLE_FORMATS). Par défaut -16
+                                  (16 bits signés).
+            channels (int, optional): Nombre de canaux. Par défaut 1 (mono).
+        """
+        if size not in SAMPLE_FORMATS:
+            raise ValueError(f"Format d'échantillons non pris en charge: {size}")
+        self.sample_rate = sample_rate
+        self.size = size
+        self.channels = channels
+    
+    def note(self, frequency, duration, waveform=Waveform.SQUARE, volume=0.5, end_frequency=None,
+             attack=0.005, sustain=1.0, release=0.01):
+        """
+        Calcule les échantillons d'une note.
+        
+        Args:
+            frequency (float): Fréquence de départ en Hz
+            duration (float): Durée en secondes
+            waveform (str, optional): Forme d'onde (Waveform). Par défaut carrée.
+            volume (float, optional): Amplitude maximale (0.0 à 1.0, 0.0 pour un silence).
+                                      Par défaut 0.5.
+            end_frequency (float, optional): Fréquence d'arrivée d'un glissement linéaire.
+                                             Par défaut la fréquence de départ.
+            attack (float, optional): Durée de la montée en secondes. Par défaut 5 ms.
+            sustain (float, optional): Amplitude relative en fin de note, atteinte
+                                       linéairement (1.0 pour une note tenue, 0.0 pour
+                                       une note qui s'éteint). Par défaut 1.0.
+            release (float, optional): Durée de l'extinction finale en secondes. Par défaut 10 ms.
+        
+        Returns:
+            numpy.ndarray or array.array: Échantillons flottants entre -1 et 1
+        """
+        rate = self.sample_rate
+        num_frames = int(duration * rate)
+        if end_frequency is None:
+            end_frequency = frequency
+        # Position dans la période: intégrale de la fréquence instantanée
+        glide = (end_frequency - frequency) / (2 * duration)
+        attack_frames = max(int(attack * rate), 1)
+        release_frames = max(int(release * rate), 1)
+        
+        if np is not None:
+            t = np.arange(num_frames) / rate
+            phase = np.mod(t * (frequency + glide * t), 1.0)
+            envelope = volume * (1.0 - (1.0 - sustain) * t / duration)
+            envelope *= np.minimum(np.minimum(np.arange(num_frames) / attack_frames, 1.0),
+                                   np.minimum((num_frames - np.arange(num_frames)) / release_frames, 1.0))
+            return _wave_array(waveform, phase) * envelope
+        
+        if volume == 0:
+            return array('d', bytes(8 * num_frames))
+        
+        # Sans NumPy: une compréhension de liste par forme d'onde, sans appel
+        # de fonction par échantillon; la montée et l'extinction ne touchent
+        # que leurs quelques échantillons
+        times = [i / rate for i in range(num_frames)]
+        levels = [volume * (1.0 - (1.0 - sustain) * t / duration) for t in times]
+        edges = set(range(min(attack_frames, num_frames)))
+        edges.update(range(max(num_frames - release_frames, 0), num_frames))
+        for i in edges:
+            levels[i] *= min(i / attack_frames, 1.0, (num_frames - i) / release_frames)
+        
+        if waveform == Waveform.SQUARE:
+            samples = [level if (t * (frequency + glide * t)) % 1.0 < 0.5 else -level
+                       for t, level in zip(times, levels)]
+        elif waveform == Waveform.TRIANGLE:
+            samples = [(4.0 * abs((t * (frequency + glide * t)) % 1.0 - 0.5) - 1.0) * level
+                       for t, level in zip(times, levels)]
+        elif waveform == Waveform.SAWTOOTH:
+            samples = [(2.0 * ((t * (frequency + glide * t)) % 1.0) - 1.0) * level
+                       for t, level in zip(times, levels)]
+        else:
+            sin, turn = math.sin, 2 * math.pi
+            samples = [sin(turn * ((t * (frequency + glide * t)) % 1.0)) * level
+                       for t, level in zip(times, levels)]
+        return array('d', samples)
+    
+    def render(self, notes, semitones=0):
+        """
+        Génère un son complet dans le format du générateur.
+        
+        Args:
+            notes (list): Paramètres de chaque note (dictionnaires pour note())
+            semitones (float, optional): Transposition en demi-tons. Par défaut 0.
+        
+        Returns:
+            bytes: Échantillons codés, entrelacés par canal, pour pygame.mixer.Sound(buffer=...)
+        """
+        ratio = 2 ** (semitones / 12)
+        # Les notes répétées (mélodies) ne sont calculées et codées qu'une fois
+        rendered = {}
+        chunks = []
+        for params in notes:
+            key = tuple(sorted(params.items()))
+            if key not in rendered:
+                params = dict(params)
+                params["frequency"] *= ratio
+                if params.get("end_frequency") is not None:
+                    params["end_frequency"] *= ratio
+                rendered[key] = self.encode([self.note(**params)])
+            chunks.append(rendered[key])
+        return b"".join(chunks)
+    
+    def encode(self, parts):
+        """
+        Code des échantillons flottants dans le format du générateur.
+        
+        Args:
+            parts (list): Suites d'échantillons flottants à mettre bout à bout
+        
+        Returns:
+            bytes: Échantillons codés, entrelacés par canal
+        """
+        typecode, amplitude, offset = SAMPLE_FORMATS[self.size]
+        if np is not None:
+            samples = np.concatenate(parts) if parts else np.zeros(0)
+            values = samples * amplitude + offset
+            if typecode != 'f':
+                values = values.astype(np.int64)
+            values = np.repeat(values, self.channels)
+            return values.astype(np.dtype(typecode)).tobytes()
+        
+        mono = array(typecode)
+        for samples in parts:
+            if typecode == 'f':
+                mono.fromlist([sample * amplitude + offset for sample in samples])
+            else:
+                mono.fromlist([int(sample * amplitude + offset) for sample in samples])
+        if self.channels == 1:
+            return mono.tobytes()
+        
+        # Entrelacement par tranches: un canal entier par affectation
+        encoded = array(typecode, bytes(mono.itemsize * len(mono) * self.channels))
+        for channel in range(self.channels):
+            encoded[channel::self.channels] = mono
+        return encoded.tobytes()
@@ -0,0 +1,103 @@
+"""
+Module contenant le cache des textes rendus, partagé par tous les écrans.
+"""
+
+from collections import OrderedDict
+import pygame
+from src.utils.constants import TEXT_CACHE_SIZE
+
+class TextCache:
+    """
+    Cache LRU des surfaces produites par pygame.font.Font.render().
+    
+    La plupart des textes affichés (titres, options, score, niveau) ne
+    changent presque jamais d'une frame à l'autre: ils ne sont rendus qu'une
+    fois puis réutilisés. Les surfaces renvoyées sont partagées et ne doivent
+    pas être modifiées, seulement copiées à l'écran.
+    """
+    
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Initialise un cache vide.
+        
+        Args:
+            max_size (int, optional): Nombre maximum de textes conservés. Par défaut TEXT_CACHE_SIZE.
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Renvoie le rendu d'un texte, depuis le cache si possible.
+        
+        Args:
+            font (pygame.font.Font): Police
+            text (str): Texte à rendre
+            antialias (bool): Lissage des caractères
+            color (tuple): Couleur RGB du texte
+            background (tuple, optional): Couleur RGB du fond. Par défaut transparent.
+        
+        Returns:
+            pygame.Surface: Surface du texte (à ne pas modifier)
+        """
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        if pygame.display.get_surface() is not None:
+            # Format de l'écran: la copie ne convertit plus les pixels à chaque frame
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """
+        Vide le cache et remet les compteurs à zéro.
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self):
+        """
+        Renvoie les statistiques d'utilisation du cache.
+        
+        Returns:
+            dict: Succès, échecs, taux de succès et nombre de textes en cache
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self.surfaces)
+        }
+
+
+# Cache partagé par le jeu et les écrans de l'interface
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """
+    Rend un texte en passant par le cache partagé.
+    
+    Args:
+        font (pygame.font.Font): Police
+        text (str): Texte à rendre
+        antialias (bool): Lissage des caractères
+        color (tuple): Couleur RGB du texte
+        background (tuple, optional): Couleur RGB du fond. Par défaut transparent.
+    
+    Returns:
+        pygame.Surface: Surface du texte (à ne pas modifier)
+    """
+    return text_cache.render(font, text, antialias, color, background)
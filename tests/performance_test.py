@@ -5,6 +5,7 @@ Script pour tester les performances du jeu.
 import sys
 import os
 import time
+import random
 import cProfile
 import pstats
 
@@ -15,6 +16,9 @@ import pygame
 from src.game.snake import Snake, Direction
 from src.game.food import Food
 from src.game.level import Level
+from src.game.grid import Grid, CellState
+from src.game.core import GameCore
+from src.utils.text_cache import text_cache
 from src.utils.logger import Logger
 
 # Initialisation du logger
@@ -59,12 +63,16 @@ def test_snake_move(iterations=1000):
     
     return elapsed_time
 
-def test_food_respawn(iterations=1000):
+def test_food_respawn(iterations=1000, fill_ratios=(0.01, 0.25, 0.5, 0.75, 0.9, 0.99)):
     """
     Teste les performances de la méthode respawn() de Food.
     
+    Le coût est mesuré pour plusieurs taux de remplissage du plateau afin de
+    vérifier qu'il reste constant grâce à l'index des cases libres.
+    
     Args:
         iterations (int): Nombre d'itérations à exécuter
+        fill_ratios (tuple): Taux de remplissage du plateau à mesurer
     """
     logger.info(f"Test de Food.respawn() avec {iterations} itérations")
     
@@ -83,6 +91,26 @@ def test_food_respawn(iterations=1000):
     logger.info(f"Temps d'exécution: {elapsed_time:.6f} secondes")
     logger.info(f"Moyenne par itération: {(elapsed_time / iterations) * 1000:.6f} ms")
     
+    # Mesurer le coût selon le remplissage du plateau
+    for fill_ratio in fill_ratios:
+        grid = Grid()
+        cells = [(x, y) for y in range(grid.height) for x in range(grid.width)]
+        random.shuffle(cells)
+        for position in cells[:int(len(cells) * fill_ratio)]:
+            grid.set(position, CellState.OBSTACLE)
+        
+        food = Food(level=1, grid=grid)
+        
+        fill_start_time = time.time()
+        for _ in range(iterations):
+            food.respawn(None)
+        fill_elapsed_time = time.time() - fill_start_time
+        
+        logger.info(
+            f"Remplissage {fill_ratio * 100:.0f}%: "
+            f"{(fill_elapsed_time / iterations) * 1000:.6f} ms par itération"
+        )
+    
     return elapsed_time
 
 def test_obstacle_generation(iterations=100):
@@ -111,11 +139,138 @@ def test_obstacle_generation(iterations=100):
     
     return elapsed_time
 
+def test_core_step(iterations=10000):
+    """
+    Teste les performances de la simulation sans affichage (GameCore.step()).
+    
+    Args:
+        iterations (int): Nombre de ticks à simuler
+    """
+    logger.info(f"Test de GameCore.step() avec {iterations} itérations")
+    
+    core = GameCore()
+    directions = list(Direction)
+    
+    # Mesurer le temps d'exécution
+    start_time = time.time()
+    
+    for i in range(iterations):
+        core.step(directions[(i // 7) % 4])
+        if core.game_over:
+            core.reset()
+    
+    elapsed_time = time.time() - start_time
+    
+    logger.info(f"Temps d'exécution: {elapsed_time:.6f} secondes")
+    logger.info(f"Ticks par seconde: {iterations / elapsed_time:.0f}")
+    
+    return elapsed_time
+
+def test_env_step(iterations=10000):
+    """
+    Teste le coût d'un pas de l'environnement d'apprentissage (SnakeEnv.step()).
+    
+    Args:
+        iterations (int): Nombre de pas à simuler
+    """
+    from src.game.env import SnakeEnv, np
+    if np is None:
+        logger.info("NumPy n'est pas installé, test de SnakeEnv ignoré")
+        return 0.0
+    
+    logger.info(f"Test de SnakeEnv.step() avec {iterations} itérations")
+    
+    env = SnakeEnv()
+    env.reset(seed=0)
+    
+    # Mesurer le temps d'exécution
+    start_time = time.time()
+    
+    for i in range(iterations):
+        _, _, terminated, truncated, _ = env.step((i // 7) % 4)
+        if terminated or truncated:
+            env.reset()
+    
+    elapsed_time = time.time() - start_time
+    
+    logger.info(f"Temps d'exécution: {elapsed_time:.6f} secondes")
+    logger.info(f"Pas par seconde: {iterations / elapsed_time:.0f}")
+    
+    return elapsed_time
+
+def test_board_render(iterations=500, board_sizes=((40, 30), (1000, 1000))):
+    """
+    Teste le coût de l'affichage du plateau (BoardCanvas.update()) selon la
+    taille du plateau: la vue suit la tête et défile à chaque tick.
+    
+    Args:
+        iterations (int): Nombre de ticks à simuler par taille de plateau
+        board_sizes (tuple): Tailles (largeur, hauteur) des plateaux testés
+    """
+    from src.game.renderer import BoardCanvas, Camera
+    from src.game.sprites import SpriteAtlas
+    
+    atlas = SpriteAtlas()
+    directions = list(Direction)
+    results = {}
+    for width, height in board_sizes:
+        core = GameCore(width, height, seed=0)
+        camera = Camera(width, height)
+        canvas = BoardCanvas(core.grid, atlas, camera)
+        
+        # Mesurer le temps d'affichage uniquement
+        elapsed_time = 0.0
+        for i in range(iterations):
+            core.step(directions[(i // 7) % 4])
+            if core.game_over:
+                core.reset()
+            start_time = time.time()
+            camera.follow(core.snake.get_head_position())
+            canvas.update(core.food.type)
+            elapsed_time += time.time() - start_time
+        
+        results[(width, height)] = elapsed_time
+        logger.info(f"Plateau {width}x{height}: {elapsed_time / iterations * 1e6:.0f} µs par tick")
+    
+    return results
+
+def test_array_render(iterations=50, board_sizes=((400, 300), (1000, 1000), (2000, 2000))):
+    """
+    Teste le coût de l'affichage du plateau entier par ArrayRenderer, mis à
+    l'échelle de la fenêtre.
+    
+    Args:
+        iterations (int): Nombre de frames par taille de plateau
+        board_sizes (tuple): Tailles (largeur, hauteur) des plateaux testés
+    """
+    from src.game.array_renderer import ArrayRenderer, np
+    if np is None:
+        logger.info("NumPy n'est pas installé, test d'ArrayRenderer ignoré")
+        return {}
+    
+    screen = pygame.Surface((800, 600))
+    results = {}
+    for width, height in board_sizes:
+        core = GameCore(width, height, seed=0)
+        renderer = ArrayRenderer(core.grid)
+        rect = renderer.fit(screen.get_rect())
+        
+        start_time = time.time()
+        for _ in range(iterations):
+            renderer.update(core.food.type)
+            renderer.draw(screen, rect)
+        elapsed_time = time.time() - start_time
+        
+        results[(width, height)] = elapsed_time
+        logger.info(f"Plateau entier {width}x{height}: {elapsed_time / iterations * 1000:.2f} ms par frame")
+    
+    return results
+
 def profile_game_update():
     """
-    Profile la méthode update() du jeu pour identifier les goulots d'étranglement.
+    Profile les méthodes update() et render() du jeu pour identifier les goulots d'étranglement.
     """
-    logger.info("Profiling de Game.update()")
+    logger.info("Profiling de Game.update() et Game.render()")
     
     # Importer Game ici pour éviter les imports circulaires
     from src.game.game import Game
@@ -128,9 +283,10 @@ def profile_game_update():
     profiler = cProfile.Profile()
     profiler.enable()
     
-    # Simuler plusieurs mises à jour
+    # Simuler plusieurs frames
     for _ in range(1000):
         game.update()
+        game.render()
     
     profiler.disable()
     
@@ -140,10 +296,10 @@ def profile_game_update():
     stats.dump_stats(os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "profile_results.prof"))
     
     with open(stats_file, 'w') as f:
-        stats_stream = pstats.Stream(f)
-        stats.print_stats(100, stats_stream)  # Afficher les 100 premières entrées
+        pstats.Stats(profiler, stream=f).sort_stats('cumtime').print_stats(100)  # Afficher les 100 premières entrées
     
     logger.info(f"Résultats du profiling enregistrés dans {stats_file}")
+    logger.info(f"Cache des textes: {text_cache.get_stats()}")
 
 if __name__ == '__main__':
     logger.info("Début des tests de performance")
@@ -152,6 +308,10 @@ if __name__ == '__main__':
     test_snake_move()
     test_food_respawn()
     test_obstacle_generation()
+    test_core_step()
+    test_env_step()
+    test_board_render()
+    test_array_render()
     
     # Profiler le jeu
     profile_game_update()
@@ -0,0 +1,93 @@
+"""
+Tests unitaires pour l'affichage vectorisé du plateau entier.
+"""
+
+import unittest
+import sys
+import os
+
+# Affichage factice: les tests n'ouvrent pas de fenêtre
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.array_renderer import ArrayRenderer, np
+from src.game.core import GameCore
+from src.game.food import FoodType, FOOD_COLORS
+from src.game.grid import CellState
+from src.utils.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, GREEN, DARK_GREEN, GRAY
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestArrayRenderer(unittest.TestCase):
+    """
+    Tests pour la classe ArrayRenderer.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Création d'un écran pour toute la classe de tests.
+        """
+        pygame.display.init()
+        cls.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    
+    def _color(self, surface, position):
+        """
+        Renvoie la couleur RGB d'un pixel.
+        """
+        return tuple(surface.get_at(position))[:3]
+    
+    def test_cell_colors(self):
+        """
+        Test de la couleur de chaque case, pour des largeurs avec et sans remplissage de ligne.
+        """
+        for width, height in ((40, 30), (37, 23)):
+            core = GameCore(width, height, seed=1)
+            core.level.add_obstacle((2, 2))
+            renderer = ArrayRenderer(core.grid)
+            surface = renderer.update(core.food.type)
+            
+            self.assertEqual(surface.get_size(), (width, height))
+            self.assertEqual(self._color(surface, core.snake.body[0]), DARK_GREEN)
+            self.assertEqual(self._color(surface, core.snake.body[1]), GREEN)
+            self.assertEqual(self._color(surface, (2, 2)), GRAY)
+            self.assertEqual(self._color(surface, core.food.position), FOOD_COLORS[core.food.type])
+            self.assertEqual(self._color(surface, (0, 0)), BLACK)
+    
+    def test_follows_grid(self):
+        """
+        Test de l'image recalculée après les déplacements et le type de nourriture.
+        """
+        core = GameCore(40, 30, seed=2)
+        renderer = ArrayRenderer(core.grid)
+        renderer.update(core.food.type)
+        
+        tail = core.snake.body[-1]
+        core.step()
+        surface = renderer.update(FoodType.BONUS)
+        self.assertEqual(self._color(surface, tail), BLACK)
+        self.assertEqual(self._color(surface, core.snake.body[0]), DARK_GREEN)
+        self.assertEqual(self._color(surface, core.food.position), FOOD_COLORS[FoodType.BONUS])
+        self.assertEqual(core.grid.get(core.food.position), CellState.FOOD)
+    
+    def test_scaled_draw(self):
+        """
+        Test de l'affichage mis à l'échelle dans une zone de même proportion.
+        """
+        core = GameCore(400, 400, seed=3)
+        renderer = ArrayRenderer(core.grid)
+        renderer.update(core.food.type)
+        
+        rect = renderer.fit(self.screen.get_rect())
+        self.assertEqual(rect, pygame.Rect(100, 0, 600, 600))
+        self.assertEqual(renderer.draw(self.screen, rect), rect)
+        
+        # 1,5 pixel par case
+        head_x, head_y = core.snake.body[0]
+        self.assertEqual(self._color(self.screen, (100 + head_x * 3 // 2, head_y * 3 // 2)), DARK_GREEN)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour la classe BatchSnakeEnv.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.batch_env import BatchSnakeEnv, DEATH_CAUSES, NO_ACTION, np
+from src.game.core import DeathCause
+from src.game.grid import CellState
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestBatchSnakeEnv(unittest.TestCase):
+    """
+    Tests pour l'environnement vectorisé.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.env = BatchSnakeEnv(8, width=20, height=15, seed=0)
+    
+    def _check_invariants(self):
+        """
+        Vérifie la cohérence des plateaux avec les corps et la nourriture.
+        """
+        for row in range(self.env.num_games):
+            board = self.env.boards[row]
+            self.assertEqual((board == CellState.HEAD).sum(), 1)
+            self.assertEqual((board == CellState.BODY).sum() + 1, self.env.lengths[row])
+            self.assertEqual((board == CellState.FOOD).sum(), 1)
+            self.assertEqual(board[self.env.food_pos[row]], CellState.FOOD)
+    
+    def test_step_moves_all_games(self):
+        """
+        Test d'un tick sans action: tous les serpents avancent vers la droite.
+        """
+        heads = self.env.head_positions().copy()
+        rewards, dones, _ = self.env.step()
+        
+        self.assertTrue((self.env.head_positions() == heads + 1).all())
+        self.assertFalse(dones.any())
+        self.assertEqual(rewards.sum(), 0)
+        self._check_invariants()
+    
+    def test_reverse_is_ignored(self):
+        """
+        Test du refus des demi-tours, comme Snake.change_direction.
+        """
+        actions = np.full(self.env.num_games, 2)  # LEFT
+        actions[0] = NO_ACTION
+        actions[1] = 0  # UP
+        self.env.step(actions)
+        
+        self.assertTrue((self.env.directions[2:] == 3).all())
+        self.assertEqual(self.env.directions[0], 3)
+        self.assertEqual(self.env.directions[1], 0)
+    
+    def test_eat_and_grow(self):
+        """
+        Test de la consommation de nourriture sur la case de la tête.
+        """
+        head = self.env.head_positions()[0]
+        self.env.boards[0, self.env.food_pos[0]] = CellState.EMPTY
+        self.env.food_pos[0] = head + 1
+        self.env.boards[0, head + 1] = CellState.FOOD
+        
+        self.env.step()
+        rewards, _, _ = self.env.step()
+        self.assertEqual(rewards[0], 10)
+        self.assertEqual(self.env.scores[0], 10)
+        self.assertEqual(self.env.lengths[0], 4)
+        self._check_invariants()
+    
+    def test_wall_death_and_auto_reset(self):
+        """
+        Test de la mort contre un mur et de la relance automatique.
+        """
+        for _ in range(self.env.width):
+            rewards, dones, info = self.env.step()
+            if dones.any():
+                break
+        
+        self.assertTrue(dones.all())
+        self.assertEqual(DEATH_CAUSES[info["death_cause"][0]], DeathCause.WALL)
+        self.assertEqual(self.env.episodes, self.env.num_games)
+        self.assertTrue((self.env.lengths == 3).all())
+        self._check_invariants()
+    
+    def test_random_play_keeps_invariants(self):
+        """
+        Test de la cohérence de l'état sur une longue partie aléatoire.
+        """
+        rng = np.random.default_rng(1)
+        for _ in range(500):
+            self.env.step(rng.integers(0, 4, size=self.env.num_games))
+        self._check_invariants()
+
+if __name__ == '__main__':
+    unittest.main()
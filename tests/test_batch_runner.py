@@ -0,0 +1,114 @@
+"""
+Tests unitaires pour le lanceur de simulations en lot.
+"""
+
+import unittest
+import sys
+import os
+import json
+import random
+import statistics
+import tempfile
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.core import GameCore
+from src.game.bots import POLICIES, greedy_policy
+from src.game.batch_runner import BatchRunner, BatchStats, RunningStat, make_jobs, run_game
+
+class TestBatchRunner(unittest.TestCase):
+    """
+    Tests pour les simulations en lot.
+    """
+    
+    def test_make_jobs(self):
+        """
+        Test du produit cartésien des réglages.
+        """
+        jobs = list(make_jobs(range(3), policies=["greedy", "random"], level_multipliers=(1.5, 2.0)))
+        self.assertEqual(len(jobs), 12)
+        self.assertEqual(len({(job["seed"], job["policy"], job["level_multiplier"]) for job in jobs}), 12)
+        
+        with self.assertRaises(ValueError):
+            list(make_jobs(range(3), policies=["inconnue"]))
+    
+    def test_run_game_is_reproducible(self):
+        """
+        Test d'une partie simulée: mêmes réglages, même résultat qu'un GameCore dédié.
+        """
+        job = next(make_jobs([4], base_speeds=(12,), obstacles_per_level=(5,), max_ticks=2000))
+        result = run_game(job)
+        self.assertEqual(run_game(job), result)
+        
+        core = GameCore(seed=4, base_speed=12, obstacles_per_level=5)
+        rng = random.Random(4)
+        while not core.game_over and core.tick < 2000:
+            direction = greedy_policy(core, rng)
+            if direction is not None:
+                core.change_direction(direction)
+            core.step()
+        self.assertEqual(result["score"], core.score.value)
+        self.assertEqual(result["ticks"], core.tick)
+        self.assertEqual(result["death_cause"], core.death_cause)
+    
+    def test_policies_avoid_immediate_death(self):
+        """
+        Test des politiques: aucune ne meurt dès les premiers ticks.
+        """
+        for name, policy in POLICIES.items():
+            core = GameCore(seed=1)
+            rng = random.Random(1)
+            for _ in range(20):
+                direction = policy(core, rng)
+                if direction is not None:
+                    core.change_direction(direction)
+                core.step()
+            self.assertFalse(core.game_over, name)
+    
+    def test_running_stat(self):
+        """
+        Test des statistiques calculées au fil de l'eau.
+        """
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        stat = RunningStat()
+        for value in values:
+            stat.add(value)
+        self.assertAlmostEqual(stat.mean, statistics.mean(values))
+        self.assertAlmostEqual(stat.stdev(), statistics.stdev(values))
+        self.assertEqual((stat.min, stat.max), (1, 9))
+    
+    def test_batch_stats(self):
+        """
+        Test de l'agrégation des résultats.
+        """
+        stats = BatchStats()
+        stats.add({"score": 120, "level": 2, "ticks": 300, "death_cause": "wall"})
+        stats.add({"score": 30, "level": 1, "ticks": 100, "death_cause": None})
+        summary = stats.to_dict()
+        
+        self.assertEqual(summary["games"], 2)
+        self.assertEqual(summary["score_histogram"], {0: 1, 100: 1})
+        self.assertEqual(summary["levels"], {1: 1, 2: 1})
+        self.assertEqual(summary["death_causes"], {"wall": 1, "max_ticks": 1})
+        self.assertEqual(summary["ticks"]["mean"], 200)
+    
+    def test_pool_matches_sequential(self):
+        """
+        Test du pool de processus: mêmes résultats qu'en séquentiel, écrits en JSONL.
+        """
+        jobs = list(make_jobs(range(6), policies=["greedy", "random"], max_ticks=500))
+        sequential = BatchRunner(workers=1).iter_results(jobs)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, "results.jsonl")
+            stats = BatchRunner(workers=2, chunk_size=2).run(jobs, output=output)
+            with open(output) as f:
+                written = [json.loads(line) for line in f]
+        
+        key = lambda result: (result["seed"], result["policy"])
+        self.assertEqual(stats.games, len(jobs))
+        self.assertEqual(sorted(written, key=key), sorted(sequential, key=key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests unitaires pour la classe GameCore.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.core import GameCore, CoreEvent, DeathCause
+from src.game.food import FoodType
+from src.game.grid import CellState
+from src.game.snake import Direction
+
+class TestGameCore(unittest.TestCase):
+    """
+    Tests pour le moteur de règles sans affichage.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.core = GameCore()
+    
+    def _place_food(self, position, food_type=FoodType.NORMAL):
+        """
+        Place la nourriture à une position donnée.
+        """
+        self.core.food._place(position)
+        self.core.food.type = food_type
+        self.core.food.creation_time = self.core.time
+    
+    def test_step_moves_snake(self):
+        """
+        Test d'un tick simple.
+        """
+        head_x, head_y = self.core.snake.get_head_position()
+        events = self.core.step()
+        
+        self.assertEqual(events, [])
+        self.assertEqual(self.core.snake.get_head_position(), (head_x + 1, head_y))
+        self.assertEqual(self.core.tick, 1)
+        self.assertAlmostEqual(self.core.time, 100.0)
+    
+    def test_eat(self):
+        """
+        Test de la consommation de nourriture (sur la case de la tête).
+        """
+        self._place_food(self.core.snake.get_next_head_position())
+        self.core.step()
+        events = self.core.step()
+        
+        self.assertIn(CoreEvent.ATE, events)
+        self.assertEqual(self.core.score.value, 10)
+        self.assertEqual(len(self.core.snake.body), 4)
+        self.assertEqual(self.core.grid.get(self.core.food.position), CellState.FOOD)
+    
+    def test_speed_effect(self):
+        """
+        Test de la durée exacte d'un effet de vitesse en temps de jeu.
+        """
+        self._place_food(self.core.snake.get_head_position(), FoodType.SPEED)
+        self.core.step()
+        self.assertEqual(self.core.get_current_speed(), 15)
+        
+        # L'effet dure 5000 ms de jeu, soit 75 ticks rapides à 15 cases/s
+        # (celui de la consommation compris); il prend fin au 75e tick suivant
+        directions = [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT]
+        ticks = 0
+        while self.core.is_speed_effect_active() and not self.core.game_over:
+            # Tourner en rond pour rester sur le plateau
+            events = self.core.step(directions[(ticks // 5) % 4])
+            ticks += 1
+        self.assertFalse(self.core.game_over)
+        self.assertIn(CoreEvent.SPEED_EFFECT_END, events)
+        self.assertEqual(ticks, 75)
+    
+    def test_death_causes(self):
+        """
+        Test des causes de fin de partie.
+        """
+        self.core.snake.set_body([(self.core.grid.width - 1, 5)])
+        events = self.core.step()
+        self.assertIn(CoreEvent.DIED, events)
+        self.assertEqual(self.core.death_cause, DeathCause.WALL)
+        self.assertEqual(self.core.step(), [])
+        
+        self.core.reset()
+        self.core.level.add_obstacle(self.core.snake.get_next_head_position())
+        self.core.step()
+        self.assertEqual(self.core.death_cause, DeathCause.OBSTACLE)
+    
+    def test_level_up(self):
+        """
+        Test du passage au niveau suivant.
+        """
+        self.core.score.increase(100)
+        events = self.core.step()
+        self.assertIn(CoreEvent.LEVEL_UP, events)
+        self.assertEqual(self.core.level.current_level, 2)
+        self.assertEqual(self.core.get_current_speed(), 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests unitaires pour la classe SnakeEnv.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.env import SnakeEnv, ACTIONS, np
+from src.game.batch_env import NO_ACTION
+from src.game.core import DeathCause
+from src.game.food import FoodType
+from src.game.grid import CellState
+from src.game.snake import Direction
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestSnakeEnv(unittest.TestCase):
+    """
+    Tests pour l'environnement à une partie.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.env = SnakeEnv(width=20, height=15)
+    
+    def test_observation_is_a_view(self):
+        """
+        Test de l'observation: même tableau à chaque pas, mis à jour en place.
+        """
+        observation, info = self.env.reset(seed=1)
+        self.assertEqual(observation.shape, (15, 20))
+        self.assertFalse(observation.flags.owndata)
+        
+        head_x, head_y = self.env.core.snake.get_head_position()
+        next_observation, _, _, _, _ = self.env.step(NO_ACTION)
+        self.assertIs(next_observation, observation)
+        self.assertEqual(observation[head_y, head_x + 1], CellState.HEAD)
+        self.assertEqual(observation[head_y, head_x], CellState.BODY)
+        
+        # La vue survit aux nouvelles parties
+        self.env.reset(seed=2)
+        self.assertEqual((observation == CellState.HEAD).sum(), 1)
+        self.assertEqual(observation.tobytes(), bytes(self.env.core.grid.cells))
+    
+    def test_actions(self):
+        """
+        Test des actions: changement de direction, demi-tour ignoré.
+        """
+        self.env.reset(seed=1)
+        self.env.step(ACTIONS.index(Direction.UP))
+        self.assertEqual(self.env.core.snake.direction, Direction.UP)
+        self.env.step(ACTIONS.index(Direction.DOWN))
+        self.assertEqual(self.env.core.snake.direction, Direction.UP)
+    
+    def test_reward_for_food(self):
+        """
+        Test de la récompense: points de la nourriture mangée.
+        """
+        self.env.reset(seed=1)
+        core = self.env.core
+        core.food._place(core.snake.get_head_position())
+        core.food.type = FoodType.BONUS
+        
+        _, reward, terminated, _, info = self.env.step(NO_ACTION)
+        self.assertEqual(reward, 30)
+        self.assertFalse(terminated)
+        self.assertEqual(info["score"], 30)
+    
+    def test_termination_and_truncation(self):
+        """
+        Test de la fin de partie (mur) et de la troncature.
+        """
+        self.env.reset(seed=1)
+        terminated = False
+        while not terminated:
+            _, reward, terminated, truncated, info = self.env.step(NO_ACTION)
+        self.assertEqual(reward, -10.0)
+        self.assertFalse(truncated)
+        self.assertEqual(info["death_cause"], DeathCause.WALL)
+        with self.assertRaises(RuntimeError):
+            self.env.step(NO_ACTION)
+        
+        env = SnakeEnv(width=20, height=15, max_steps=3)
+        env.reset(seed=1)
+        results = [env.step(NO_ACTION)[3] for _ in range(3)]
+        self.assertEqual(results, [False, False, True])
+    
+    def test_same_seed_same_episode(self):
+        """
+        Test du déterminisme de reset(seed).
+        """
+        boards = []
+        for _ in range(2):
+            observation, _ = self.env.reset(seed=7)
+            for action in (0, 2, 1, 3, 3, 0):
+                self.env.step(action)
+            boards.append(observation.copy())
+        self.assertTrue((boards[0] == boards[1]).all())
+
+if __name__ == '__main__':
+    unittest.main()
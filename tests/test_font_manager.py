@@ -0,0 +1,46 @@
+"""
+Tests unitaires pour le registre des polices.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.font_manager import FontManager, get_font
+from src.game.score import Score
+from src.ui.game_over import GameOverScreen
+
+class TestFontManager(unittest.TestCase):
+    """
+    Tests pour la classe FontManager.
+    """
+    
+    def test_font_loaded_once(self):
+        """
+        Teste qu'une police n'est chargée qu'une fois par taille.
+        """
+        manager = FontManager()
+        font = manager.get(36)
+        
+        self.assertIs(manager.get(36), font)
+        self.assertIsNot(manager.get(48), font)
+        self.assertEqual(len(manager.fonts), 2)
+        
+        manager.clear()
+        self.assertEqual(manager.fonts, {})
+    
+    def test_fonts_shared_between_screens(self):
+        """
+        Teste que les écrans et le HUD partagent les polices du registre.
+        """
+        first = GameOverScreen(10)
+        second = GameOverScreen(20)
+        
+        self.assertIs(first.title_font, second.title_font)
+        self.assertIs(Score().font, get_font(36))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import unittest
 import sys
 import os
 import pygame
+from unittest import mock
 
 # Ajouter le répertoire parent au chemin de recherche pour importer le module src
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -134,6 +135,22 @@ class TestFood(unittest.TestCase):
         self.food.type = FoodType.BONUS
         self.food.creation_time = pygame.time.get_ticks() - self.food.active_time - 1
         self.assertTrue(self.food.should_expire())
+    
+    def test_pulse_follows_clock(self):
+        """
+        Test que la pulsation suit l'horloge du jeu et non l'horloge murale.
+        """
+        now = [1000]
+        food = Food(self.snake_body, clock=lambda: now[0])
+        food.type = FoodType.BONUS
+        atlas = mock.Mock(cell_size=20)
+        atlas.food_tile.return_value = pygame.Surface((20, 20))
+        screen = pygame.Surface((100, 100))
+        
+        now[0] = 1250
+        food.draw(screen, atlas)
+        food.draw(screen, atlas)
+        self.assertEqual(atlas.food_tile.call_args_list, [mock.call(FoodType.BONUS, 0.5)] * 2)
 
 if __name__ == '__main__':
     unittest.main()
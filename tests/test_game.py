@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour la boucle principale du jeu.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Affichage et audio factices: les tests n'ouvrent ni fenêtre ni périphérique de son
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from src.game.game import Game, GameState
+from src.game.food import FoodType
+from src.utils.constants import IDLE_ANIMATION_FPS
+from src.utils.sound_queue import SoundQueue
+
+class SlowSoundManager:
+    """
+    Gestionnaire de sons factice dont chaque commande prend du temps.
+    """
+    
+    def __init__(self, delay):
+        """
+        Initialise des réglages par défaut.
+        
+        Args:
+            delay (float): Durée de chaque commande en secondes
+        """
+        self.sound_volume = 0.7
+        self.music_volume = 0.5
+        self.sound_enabled = True
+        self.music_enabled = True
+        self.delay = delay
+    
+    def __getattr__(self, name):
+        """
+        Renvoie une méthode qui attend avant de rendre la main.
+        """
+        def method(*args):
+            time.sleep(self.delay)
+            return {}
+        return method
+
+
+class TestIdleLoop(unittest.TestCase):
+    """
+    Tests pour l'attente des événements sur les écrans statiques.
+    """
+    
+    def setUp(self):
+        """
+        Création d'un jeu sur le menu principal.
+        """
+        self.game = Game()
+        pygame.event.clear()
+    
+    def test_static_states(self):
+        """
+        Test des écrans considérés comme statiques.
+        """
+        for state in (GameState.MENU, GameState.GAME_OVER, GameState.OPTIONS,
+                      GameState.HIGHSCORES, GameState.NAME_INPUT, GameState.SOUND_OPTIONS):
+            self.game.state = state
+            self.assertTrue(self.game.is_static())
+        
+        self.game.state = GameState.PLAYING
+        self.assertFalse(self.game.is_static())
+        self.game.paused = True
+        self.assertTrue(self.game.is_static())
+        
+        # En mode débogage, le FPS affiché change à chaque frame
+        self.game.debug_mode = True
+        self.assertFalse(self.game.is_static())
+    
+    def test_animation_interval(self):
+        """
+        Test de l'animation de la nourriture spéciale en partie, figée en pause.
+        """
+        self.assertIsNone(self.game.get_animation_interval())
+        
+        self.game.state = GameState.PLAYING
+        self.game.food.type = FoodType.NORMAL
+        self.assertIsNone(self.game.get_animation_interval())
+        
+        self.game.food.type = FoodType.BONUS
+        self.assertEqual(self.game.get_animation_interval(), 1000 // IDLE_ANIMATION_FPS)
+        self.game.paused = True
+        self.assertIsNone(self.game.get_animation_interval())
+        
+        # Hors de la partie, la nourriture n'est pas affichée
+        self.game.state = GameState.GAME_OVER
+        self.assertIsNone(self.game.get_animation_interval())
+    
+    def test_wait_timeout(self):
+        """
+        Test de l'attente sans événement: rien n'est renvoyé à l'échéance.
+        """
+        start = time.perf_counter()
+        self.assertEqual(self.game.wait_events(50), [])
+        elapsed = time.perf_counter() - start
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertLess(elapsed, 1.0)
+    
+    def test_wait_returns_queued_events(self):
+        """
+        Test que les événements en attente sont tous renvoyés immédiatement.
+        """
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=1))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=2))
+        start = time.perf_counter()
+        events = self.game.wait_events(5000)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual([event.code for event in events if event.type == pygame.USEREVENT], [1, 2])
+
+
+class TestGameOver(unittest.TestCase):
+    """
+    Tests pour la fin de partie.
+    """
+    
+    def setUp(self):
+        """
+        Création d'un jeu dont le son passe par un gestionnaire lent.
+        """
+        self.game = Game()
+        self.game.sound_manager = SoundQueue(SlowSoundManager(0.1))
+    
+    def tearDown(self):
+        """
+        Arrêt du fil audio.
+        """
+        self.game.sound_manager.close()
+    
+    def test_game_over_does_not_wait_for_audio(self):
+        """
+        Test que la fin de partie n'attend pas le fil audio hors mode débogage.
+        """
+        start = time.perf_counter()
+        self.game._handle_game_over()
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
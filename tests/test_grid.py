@@ -0,0 +1,156 @@
+"""
+Tests unitaires pour la classe Grid.
+"""
+
+import unittest
+import sys
+import os
+import pygame
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.grid import Grid, CellState
+from src.game.snake import Snake, Direction
+from src.game.food import Food
+from src.game.level import Level
+
+# Initialisation de Pygame pour les tests
+pygame.init()
+
+class TestGrid(unittest.TestCase):
+    """
+    Tests pour la classe Grid et sa mise à jour par les objets du jeu.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.grid = Grid(20, 15)
+        self.snake = Snake(grid=self.grid)
+        self.level = Level(grid=self.grid)
+        self.food = Food(self.snake.body, grid=self.grid)
+    
+    def _snake_cells(self):
+        """
+        Renvoie l'ensemble des cases marquées comme serpent dans la grille.
+        """
+        return {
+            (x, y)
+            for y in range(self.grid.height)
+            for x in range(self.grid.width)
+            if self.grid.get((x, y)) in (CellState.BODY, CellState.HEAD)
+        }
+    
+    def test_init(self):
+        """
+        Test du marquage initial du serpent et de la nourriture.
+        """
+        self.assertEqual(self.grid.get(self.snake.get_head_position()), CellState.HEAD)
+        self.assertEqual(self._snake_cells(), set(self.snake.body))
+        self.assertEqual(self.grid.get(self.food.position), CellState.FOOD)
+    
+    def test_snake_move_updates_grid(self):
+        """
+        Test de la mise à jour incrémentale de la grille par le serpent.
+        """
+        tail = self.snake.body[-1]
+        self.snake.move()
+        self.snake.change_direction(Direction.UP)
+        self.snake.grow()
+        self.snake.move()
+        
+        self.assertEqual(self.grid.get(tail), CellState.EMPTY)
+        self.assertEqual(self.grid.get(self.snake.get_head_position()), CellState.HEAD)
+        self.assertEqual(self._snake_cells(), set(self.snake.body))
+    
+    def test_obstacles(self):
+        """
+        Test de l'ajout d'obstacles et des collisions associées.
+        """
+        self.level.add_obstacle((3, 3))
+        self.assertTrue(self.level.check_obstacle_collision((3, 3)))
+        self.assertFalse(self.level.check_obstacle_collision((4, 3)))
+        self.assertFalse(self.level.check_obstacle_collision((-1, 3)))
+        self.assertTrue(self.grid.is_blocked((3, 3)))
+        
+        # Les obstacles générés ne recouvrent jamais une case occupée
+        self.level.current_level = 5
+        for _ in range(20):
+            self.level.generate_obstacles()
+        for obstacle in self.level.obstacles:
+            self.assertEqual(self.grid.get(obstacle.position), CellState.OBSTACLE)
+            self.assertNotIn(obstacle.position, self.snake.body)
+    
+    def test_food_respawn_updates_grid(self):
+        """
+        Test du déplacement de la nourriture dans la grille.
+        """
+        for _ in range(50):
+            old_position = self.food.position
+            self.food.respawn(self.snake.body)
+            self.assertEqual(self.grid.get(self.food.position), CellState.FOOD)
+            if old_position != self.food.position:
+                self.assertEqual(self.grid.get(old_position), CellState.EMPTY)
+            self.assertNotIn(self.food.position, self.snake.body)
+    
+    def test_free_cell_index(self):
+        """
+        Test de la cohérence de l'index des cases libres.
+        """
+        free = {
+            (x, y)
+            for y in range(self.grid.height)
+            for x in range(self.grid.width)
+            if self.grid.is_free((x, y))
+        }
+        self.assertEqual(self.grid.free_count(), len(free))
+        
+        # Le tirage ne renvoie que des cases libres
+        for _ in range(100):
+            self.assertIn(self.grid.random_free_cell(), free)
+    
+    def test_board_full(self):
+        """
+        Test du signalement explicite d'un plateau plein.
+        """
+        grid = Grid(3, 2)
+        food = Food(level=1, grid=grid)
+        for y in range(grid.height):
+            for x in range(grid.width):
+                if (x, y) != food.position:
+                    grid.set((x, y), CellState.OBSTACLE)
+        
+        self.assertEqual(grid.free_count(), 0)
+        self.assertIsNone(grid.random_free_cell())
+        self.assertFalse(food.respawn(None))
+        self.assertIsNone(food.position)
+        
+        # Sans grille, le tirage se termine aussi sur un plateau plein
+        food = Food(level=1)
+        body = [(x, y) for y in range(food.height) for x in range(food.width)]
+        self.assertFalse(food.respawn(body))
+    
+    def test_change_tracking(self):
+        """
+        Test du suivi des cases modifiées pour l'affichage.
+        """
+        grid = Grid(10, 10)
+        grid.set((1, 1), CellState.BODY)
+        self.assertEqual(grid.pop_changes(), (True, set()))
+        
+        grid.track_changes()
+        self.assertTrue(grid.pop_changes()[0])
+        grid.set((2, 3), CellState.HEAD)
+        grid.set((2, 3), CellState.HEAD)
+        grid.set((4, 0), CellState.FOOD)
+        grid.set((4, 0), CellState.EMPTY)
+        self.assertEqual(grid.pop_changes(), (False, {32, 4}))
+        self.assertEqual(grid.pop_changes(), (False, set()))
+        
+        grid.clear()
+        self.assertTrue(grid.pop_changes()[0])
+
+if __name__ == '__main__':
+    unittest.main()
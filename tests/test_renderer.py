@@ -0,0 +1,288 @@
+"""
+Tests unitaires pour les outils d'affichage du plateau.
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Affichage factice: les tests n'ouvrent pas de fenêtre
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.renderer import DirtyRectTracker, BoardCanvas, Camera
+from src.game.core import GameCore
+from src.game.bots import cautious_policy
+from src.game.sprites import SpriteAtlas
+from src.game.food import FoodType, FOOD_COLORS
+from src.utils.constants import GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GREEN, DARK_GREEN
+
+class TestDirtyRectTracker(unittest.TestCase):
+    """
+    Tests pour le suivi des zones modifiées de l'écran.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Création d'un écran pour toute la classe de tests.
+        """
+        pygame.display.init()
+        pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.tracker = DirtyRectTracker()
+        self.assertEqual(self.tracker.present(), 0)
+    
+    def test_cells(self):
+        """
+        Test de la conversion des cases modifiées en zones de l'écran.
+        """
+        self.tracker.add_cells([0, 41], 40)
+        self.assertEqual(self.tracker.rects, [
+            pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE),
+            pygame.Rect(GRID_SIZE, GRID_SIZE, GRID_SIZE, GRID_SIZE)
+        ])
+        self.assertEqual(self.tracker.present(), 2)
+        self.assertEqual(self.tracker.rects, [])
+    
+    def test_overlays(self):
+        """
+        Test des éléments superposés: seuls les changements sont transmis.
+        """
+        rect = pygame.Rect(10, 10, 100, 20)
+        self.tracker.overlay("score", rect, 0)
+        self.assertEqual(self.tracker.present(), 1)
+        
+        # Contenu inchangé: rien à transmettre
+        self.tracker.overlay("score", rect, 0)
+        self.assertEqual(self.tracker.present(), 0)
+        
+        # Nouveau contenu: ancienne et nouvelle zones
+        self.tracker.overlay("score", pygame.Rect(10, 10, 120, 20), 10)
+        self.assertEqual(self.tracker.present(), 2)
+        
+        # Élément disparu: sa zone est effacée
+        self.assertEqual(self.tracker.present(), 1)
+        self.assertEqual(self.tracker.overlays, {})
+    
+    def test_overlay_rects(self):
+        """
+        Test des zones des éléments superposés à la frame précédente.
+        """
+        rect = pygame.Rect(10, 10, 100, 20)
+        self.tracker.overlay("score", rect, 0)
+        self.tracker.present()
+        self.assertEqual(self.tracker.overlay_rects(), [rect])
+    
+    def test_invalidate(self):
+        """
+        Test de la mise à jour complète.
+        """
+        self.tracker.invalidate()
+        self.tracker.add(pygame.Rect(0, 0, 10, 10))
+        self.assertEqual(self.tracker.rects, [])
+        self.assertEqual(self.tracker.present(), 0)
+
+class TestCamera(unittest.TestCase):
+    """
+    Tests pour la vue qui suit la tête du serpent.
+    """
+    
+    def test_follow(self):
+        """
+        Test du centrage de la vue, bornée par les bords du plateau.
+        """
+        camera = Camera(1000, 1000, 40, 30)
+        camera.follow((500, 500))
+        self.assertEqual((camera.x, camera.y), (480, 485))
+        self.assertEqual(camera.to_view((500, 500)), (20, 15))
+        self.assertIsNone(camera.to_view((479, 500)))
+        
+        camera.follow((2, 999))
+        self.assertEqual((camera.x, camera.y), (0, 970))
+    
+    def test_small_board(self):
+        """
+        Test d'un plateau plus petit que la vue: la vue ne bouge pas.
+        """
+        camera = Camera(20, 15, 40, 30)
+        camera.follow((19, 14))
+        self.assertEqual((camera.view_width, camera.view_height), (20, 15))
+        self.assertEqual((camera.x, camera.y), (0, 0))
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    """
+    Tests pour les tuiles pré-rendues.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Création d'un écran et des tuiles pour toute la classe de tests.
+        """
+        pygame.display.init()
+        cls.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        cls.atlas = SpriteAtlas()
+    
+    def _reference(self, draw):
+        """
+        Dessine une case de référence avec les primitives de pygame.
+        """
+        surface = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        surface.fill(BLACK)
+        draw(surface, surface.get_rect())
+        return pygame.image.tobytes(surface, 'RGB')
+    
+    def test_display_format(self):
+        """
+        Test de la conversion des tuiles au format de l'écran.
+        """
+        for tile in (self.atlas.head, self.atlas.body, self.atlas.obstacle, self.atlas.food[FoodType.NORMAL]):
+            self.assertEqual(tile.get_bitsize(), self.screen.get_bitsize())
+            self.assertEqual(tile.get_size(), (GRID_SIZE, GRID_SIZE))
+    
+    def test_tiles_match_primitives(self):
+        """
+        Test de l'apparence des tuiles: identique au tracé des primitives.
+        """
+        def body(surface, rect):
+            pygame.draw.rect(surface, GREEN, rect)
+            pygame.draw.rect(surface, DARK_GREEN, rect, 1)
+        self.assertEqual(pygame.image.tobytes(self.atlas.body, 'RGB'), self._reference(body))
+        
+        radius = GRID_SIZE // 2 - 2
+        for food_type, color in FOOD_COLORS.items():
+            def food(surface, rect):
+                pygame.draw.circle(surface, color, rect.center, radius)
+            self.assertEqual(pygame.image.tobytes(self.atlas.food_tile(food_type), 'RGB'), self._reference(food))
+    
+    def test_pulse_frames(self):
+        """
+        Test des images de pulsation: toute phase a son image précalculée.
+        """
+        radius = GRID_SIZE // 2 - 2
+        for step in range(101):
+            pulse = step / 100
+            tile = self.atlas.food_tile(FoodType.BONUS, pulse)
+            def food(surface, rect):
+                pygame.draw.circle(surface, FOOD_COLORS[FoodType.BONUS], rect.center, radius)
+                pygame.draw.circle(surface, WHITE, rect.center, int(radius * (0.5 + pulse * 0.2)))
+            self.assertEqual(pygame.image.tobytes(tile, 'RGB'), self._reference(food))
+
+class TestBoardCanvas(unittest.TestCase):
+    """
+    Tests pour l'image persistante du plateau.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Création d'un écran et des tuiles pour toute la classe de tests.
+        """
+        pygame.display.init()
+        pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        cls.atlas = SpriteAtlas()
+    
+    def _repainted(self, core, camera=None):
+        """
+        Renvoie les pixels d'un plateau repeint entièrement.
+        """
+        canvas = BoardCanvas(core.grid, self.atlas, camera)
+        canvas.repaint(core.food.type)
+        return pygame.image.tobytes(canvas.surface, 'RGB')
+    
+    def test_incremental_matches_full_repaint(self):
+        """
+        Test du plateau repeint case par case: identique à un rendu complet.
+        """
+        core = GameCore(seed=3)
+        canvas = BoardCanvas(core.grid, self.atlas)
+        self.assertTrue(canvas.update(core.food.type)[0])
+        
+        rng = random.Random(3)
+        for tick in range(1, 600):
+            if core.game_over:
+                break
+            direction = cautious_policy(core, rng)
+            if direction is not None:
+                core.change_direction(direction)
+            core.step()
+            all_changed, changed_cells = canvas.update(core.food.type)
+            self.assertFalse(all_changed)
+            
+            # Un déplacement ne repeint que quelques cases
+            self.assertLessEqual(len(changed_cells), 6 + core.level.obstacles_per_level)
+            if tick % 50 == 0:
+                self.assertEqual(pygame.image.tobytes(canvas.surface, 'RGB'), self._repainted(core))
+        
+        self.assertGreater(core.level.current_level, 2)
+        self.assertEqual(pygame.image.tobytes(canvas.surface, 'RGB'), self._repainted(core))
+    
+    def test_reset_repaints_everything(self):
+        """
+        Test du rendu complet après une nouvelle partie.
+        """
+        core = GameCore(seed=1)
+        canvas = BoardCanvas(core.grid, self.atlas)
+        canvas.update(core.food.type)
+        core.reset(seed=2)
+        self.assertTrue(canvas.update(core.food.type)[0])
+        self.assertEqual(pygame.image.tobytes(canvas.surface, 'RGB'), self._repainted(core))
+    
+    def test_scrolling_matches_full_repaint(self):
+        """
+        Test de la vue qui défile sur un grand plateau: identique à un rendu complet.
+        """
+        core = GameCore(300, 200, seed=4)
+        camera = Camera(300, 200, 40, 30)
+        canvas = BoardCanvas(core.grid, self.atlas, camera)
+        canvas.update(core.food.type)
+        
+        rng = random.Random(4)
+        scrolled = 0
+        for tick in range(1, 400):
+            if core.game_over:
+                break
+            direction = cautious_policy(core, rng)
+            if direction is not None:
+                core.change_direction(direction)
+            core.step()
+            camera.follow(core.snake.get_head_position())
+            scrolled += canvas.update(core.food.type)[0]
+            if tick % 20 == 0:
+                reference = Camera(300, 200, 40, 30)
+                reference.x, reference.y = camera.x, camera.y
+                self.assertEqual(pygame.image.tobytes(canvas.surface, 'RGB'), self._repainted(core, reference))
+        
+        self.assertEqual(canvas.surface.get_size(), (40 * GRID_SIZE, 30 * GRID_SIZE))
+        self.assertGreater(scrolled, 50)
+    
+    def test_restore(self):
+        """
+        Test de la recopie partielle du plateau à l'écran.
+        """
+        core = GameCore(seed=1)
+        canvas = BoardCanvas(core.grid, self.atlas)
+        canvas.update(core.food.type)
+        
+        screen = pygame.Surface(canvas.surface.get_size())
+        screen.fill(WHITE)
+        head_x, head_y = core.snake.get_head_position()
+        rect = pygame.Rect(head_x * GRID_SIZE, head_y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+        canvas.restore(screen, [rect])
+        
+        self.assertEqual(screen.get_at(rect.center), canvas.surface.get_at(rect.center))
+        self.assertEqual(screen.get_at((rect.right, rect.top)), WHITE)
+
+if __name__ == '__main__':
+    unittest.main()
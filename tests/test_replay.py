@@ -0,0 +1,279 @@
+"""
+Tests unitaires pour l'enregistrement et la relecture des parties.
+"""
+
+import unittest
+import sys
+import os
+import random
+import tempfile
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.core import GameCore
+from src.game.snake import Direction
+from src.game.replay import (
+    Replay, ReplayRecorder, ReplayPlayer, BinaryReplayWriter, BinaryReplayReader, is_binary_replay
+)
+
+def _choose_direction(core, rng):
+    """
+    Choisit une direction qui rapproche de la nourriture sans collision immédiate.
+    """
+    head_x, head_y = core.snake.get_head_position()
+    food = core.food.position or (head_x, head_y)
+    candidates = []
+    for direction in Direction:
+        dx, dy = direction.value
+        target = (head_x + dx, head_y + dy)
+        if core.grid.is_blocked(target):
+            continue
+        distance = abs(target[0] - food[0]) + abs(target[1] - food[1])
+        candidates.append((distance, rng.random(), direction))
+    return min(candidates)[2] if candidates else None
+
+def _snapshot(core):
+    """
+    Résume l'état d'un moteur pour comparer deux parties.
+    """
+    return (
+        core.tick, core.time, list(core.snake.body), core.food.position, core.food.type,
+        core.score.value, core.level.current_level, sorted(core.level.obstacle_positions),
+        bytes(core.grid.cells), core.death_cause
+    )
+
+def _play(seed, max_ticks=3000, recorder_factory=ReplayRecorder):
+    """
+    Joue une partie enregistrée avec une politique gourmande.
+    """
+    core = GameCore(seed=seed)
+    recorder = recorder_factory(core)
+    rng = random.Random(seed)
+    while not core.game_over and core.tick < max_ticks:
+        direction = _choose_direction(core, rng)
+        if direction is not None:
+            core.change_direction(direction)
+        core.step()
+    return core, recorder.finish()
+
+class TestReplay(unittest.TestCase):
+    """
+    Tests pour la reproductibilité des parties.
+    """
+    
+    def test_same_seed_same_game(self):
+        """
+        Test du déterminisme: même graine et mêmes entrées, même partie.
+        """
+        core, replay = _play(seed=42)
+        self.assertGreater(core.level.current_level, 2)
+        
+        replayed = ReplayPlayer(replay).play()
+        self.assertEqual(_snapshot(replayed), _snapshot(core))
+    
+    def test_replay_is_compact(self):
+        """
+        Test de l'enregistrement des seuls changements effectifs de direction.
+        """
+        core, replay = _play(seed=7)
+        self.assertLess(len(replay.inputs), core.tick)
+        for (tick, _), (next_tick, _) in zip(replay.inputs, replay.inputs[1:]):
+            self.assertLessEqual(tick, next_tick)
+    
+    def test_save_and_load(self):
+        """
+        Test de la sauvegarde et du chargement d'un enregistrement.
+        """
+        core, replay = _play(seed=3)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "replay.json")
+            replay.save(filename)
+            loaded = Replay.load(filename)
+        
+        self.assertEqual(loaded.seed, replay.seed)
+        self.assertEqual(loaded.inputs, replay.inputs)
+        self.assertEqual(_snapshot(ReplayPlayer(loaded).play()), _snapshot(core))
+    
+    def test_settings_are_recorded(self):
+        """
+        Test de l'enregistrement des réglages de difficulté.
+        """
+        core = GameCore(seed=8, base_speed=14, level_multiplier=1.2, obstacles_per_level=6)
+        recorder = ReplayRecorder(core)
+        rng = random.Random(8)
+        while not core.game_over and core.tick < 3000:
+            direction = _choose_direction(core, rng)
+            if direction is not None:
+                core.change_direction(direction)
+            core.step()
+        replay = Replay.from_dict(recorder.finish().to_dict())
+        
+        self.assertEqual(replay.settings["base_speed"], 14)
+        self.assertEqual(_snapshot(ReplayPlayer(replay).play()), _snapshot(core))
+    
+    def test_partial_replay(self):
+        """
+        Test de la relecture jusqu'à un tick donné.
+        """
+        core, replay = _play(seed=5)
+        player = ReplayPlayer(replay)
+        player.play(until_tick=core.tick // 2)
+        self.assertEqual(player.core.tick, core.tick // 2)
+        player.play()
+        self.assertEqual(_snapshot(player.core), _snapshot(core))
+
+class TestBinaryReplay(unittest.TestCase):
+    """
+    Tests pour le format binaire à images clés.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "replay.snkr")
+    
+    def tearDown(self):
+        """
+        Nettoyage après chaque test.
+        """
+        self.tmp_dir.cleanup()
+    
+    def _record(self, seed, keyframe_interval=64):
+        """
+        Enregistre une partie au format binaire.
+        
+        Returns:
+            tuple: (moteur en fin de partie, même partie enregistrée au format JSON)
+        """
+        factory = lambda core: BinaryReplayWriter(core, self.filename, keyframe_interval)
+        core = _play(seed, recorder_factory=factory)[0]
+        return core, _play(seed)[1]
+    
+    def test_full_replay(self):
+        """
+        Test de la relecture complète et de la conversion en Replay.
+        """
+        core, replay = self._record(seed=42)
+        self.assertTrue(is_binary_replay(self.filename))
+        
+        with BinaryReplayReader(self.filename) as reader:
+            self.assertEqual(reader.seed, 42)
+            self.assertEqual(reader.ticks, core.tick)
+            self.assertGreater(reader.chunk_count, 1)
+            self.assertEqual(reader.read_inputs(), replay.inputs)
+            self.assertEqual(_snapshot(reader.seek(reader.ticks)), _snapshot(core))
+            self.assertEqual(_snapshot(ReplayPlayer(reader.to_replay()).play()), _snapshot(core))
+    
+    def test_seek(self):
+        """
+        Test de l'accès direct: même état qu'une relecture depuis le début.
+        """
+        core, replay = self._record(seed=5)
+        
+        with BinaryReplayReader(self.filename) as reader:
+            for tick in (0, 1, 63, 64, 65, 200, core.tick - 1, core.tick):
+                expected = ReplayPlayer(replay).play(until_tick=tick)
+                self.assertEqual(_snapshot(reader.seek(tick)), _snapshot(expected))
+    
+    def test_seek_then_continue(self):
+        """
+        Test de la reprise de la simulation après un accès direct.
+        """
+        core, replay = self._record(seed=9)
+        
+        with BinaryReplayReader(self.filename) as reader:
+            sought = reader.seek(core.tick // 2)
+        
+        # Les générateurs aléatoires sont restaurés: la suite est identique
+        expected = ReplayPlayer(replay).play(until_tick=core.tick // 2)
+        for _ in range(20):
+            if expected.game_over:
+                break
+            self.assertEqual(sought.step(), expected.step())
+        self.assertEqual(_snapshot(sought), _snapshot(expected))
+    
+    def test_new_game_rewrites_file(self):
+        """
+        Test de la réécriture du fichier à chaque nouvelle partie.
+        """
+        core = GameCore(seed=1)
+        recorder = BinaryReplayWriter(core, self.filename)
+        for _ in range(10):
+            core.step()
+        core.reset(seed=2)
+        core.step()
+        recorder.finish()
+        
+        with BinaryReplayReader(self.filename) as reader:
+            self.assertEqual(reader.seed, 2)
+            self.assertEqual(reader.ticks, 1)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["replay.snkr"])
+    
+    def test_saved_file_survives_next_game(self):
+        """
+        Test de la conservation du fichier terminé pendant la partie suivante.
+        """
+        core = GameCore(seed=3)
+        recorder = BinaryReplayWriter(core, self.filename)
+        for _ in range(10):
+            core.step()
+        recorder.save()
+        
+        core.reset(seed=4)
+        for _ in range(5):
+            core.step()
+        with BinaryReplayReader(self.filename) as reader:
+            self.assertEqual(reader.seed, 3)
+            self.assertEqual(reader.ticks, 10)
+        
+        # Partie abandonnée: le fichier temporaire disparaît
+        recorder.close()
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["replay.snkr"])
+    
+    def test_unfinished_game_leaves_no_file(self):
+        """
+        Test de l'absence de fichier pour une partie jamais terminée.
+        """
+        core = GameCore(seed=1)
+        recorder = BinaryReplayWriter(core, self.filename)
+        core.step()
+        core.reset()
+        core.step()
+        recorder.close()
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+    
+    def test_truncated_file(self):
+        """
+        Test du refus d'un fichier tronqué, quelle que soit la longueur restante.
+        """
+        self._record(seed=42)
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        
+        for size in (0, 4, 10, 40, len(data) // 2, len(data) - 1):
+            with open(self.filename, 'wb') as f:
+                f.write(data[:size])
+            with self.assertRaises(ValueError):
+                BinaryReplayReader(self.filename)
+        
+        # Pied de fichier (28 octets) intact mais index coupé
+        with open(self.filename, 'wb') as f:
+            f.write(data[:40] + data[-28:])
+        with self.assertRaises(ValueError):
+            BinaryReplayReader(self.filename)
+    
+    def test_invalid_file(self):
+        """
+        Test du refus d'un fichier qui n'est pas un enregistrement binaire.
+        """
+        with open(self.filename, 'wb') as f:
+            f.write(b'{"version": 1}')
+        self.assertFalse(is_binary_replay(self.filename))
+        with self.assertRaises(ValueError):
+            BinaryReplayReader(self.filename)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests unitaires pour la classe TickScheduler.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game.scheduler import TickScheduler
+
+class TestTickScheduler(unittest.TestCase):
+    """
+    Tests pour l'ordonnanceur à pas fixe.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation avant chaque test.
+        """
+        self.scheduler = TickScheduler(max_ticks_per_frame=4)
+    
+    def _run_frame(self, dt, tick_duration):
+        """
+        Simule une frame et renvoie le nombre de ticks exécutés.
+        """
+        self.scheduler.advance(dt)
+        ticks = 0
+        while self.scheduler.consume(tick_duration):
+            ticks += 1
+        return ticks
+    
+    def test_leftover_time_is_kept(self):
+        """
+        Test de la conservation du reliquat entre les frames.
+        """
+        # 64 frames de 1/64 s avec des ticks de 3/64 s: 21 ticks, reste 1/64 s
+        total = sum(self._run_frame(1.0 / 64, 3.0 / 64) for _ in range(64))
+        self.assertEqual(total, 21)
+        self.assertEqual(self.scheduler.accumulator, 1.0 / 64)
+    
+    def test_several_ticks_per_frame(self):
+        """
+        Test d'une vitesse supérieure au FPS.
+        """
+        # 120 ticks par seconde à 60 FPS: deux ticks par frame
+        ticks = [self._run_frame(1.0 / 60, 1.0 / 120 - 1e-9) for _ in range(10)]
+        self.assertEqual(ticks, [2] * 10)
+    
+    def test_catch_up_cap(self):
+        """
+        Test du plafond de rattrapage après un blocage.
+        """
+        self.assertEqual(self._run_frame(1.0, 0.1), 4)
+        self.assertAlmostEqual(self.scheduler.dropped_time, 0.6)
+        self.assertLess(self.scheduler.accumulator, 0.1)
+    
+    def test_pause(self):
+        """
+        Test de la suspension de la mesure du temps.
+        """
+        now = [0.0]
+        scheduler = TickScheduler(clock=lambda: now[0])
+        scheduler.advance()
+        now[0] = 0.05
+        scheduler.advance()
+        self.assertAlmostEqual(scheduler.accumulator, 0.05)
+        
+        scheduler.pause()
+        now[0] = 10.0
+        scheduler.advance()
+        self.assertAlmostEqual(scheduler.accumulator, 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
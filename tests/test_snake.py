@@ -145,6 +145,41 @@ class TestSnake(unittest.TestCase):
         # Le serpent devrait être mort
         self.assertFalse(result)
         self.assertFalse(self.snake.alive)
+    
+    def test_occupancy_index(self):
+        """
+        Test de la cohérence de l'index d'occupation avec le corps.
+        """
+        self.assertEqual(self.snake.occupied, set(self.snake.body))
+        
+        # Après des déplacements et une croissance, l'index suit le corps
+        self.snake.move()
+        self.snake.grow()
+        self.snake.move()
+        self.snake.change_direction(Direction.UP)
+        self.snake.move()
+        self.assertEqual(self.snake.occupied, set(self.snake.body))
+        self.assertTrue(self.snake.occupies(self.snake.get_head_position()))
+        
+        # La case libérée par la queue n'est plus occupée
+        tail = self.snake.body[-1]
+        self.snake.move()
+        self.assertFalse(self.snake.occupies(tail))
+    
+    def test_move_into_tail_cell(self):
+        """
+        Test d'un déplacement vers la case que la queue s'apprête à quitter.
+        """
+        # Serpent en carré: la tête est juste au-dessus de la queue
+        self.snake.set_body([(5, 5), (6, 5), (6, 6), (5, 6)])
+        self.snake.direction = Direction.LEFT
+        self.snake.change_direction(Direction.DOWN)
+        
+        self.assertTrue(self.snake.is_next_move_self_collision())
+        
+        # Comme avant, la queue compte encore comme une partie du corps
+        self.assertFalse(self.snake.move())
+        self.assertFalse(self.snake.alive)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,403 @@
+"""
+Tests unitaires pour la classe SoundManager.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from unittest import mock
+
+# Audio factice: les tests n'ouvrent pas de périphérique de son
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import sound_manager
+from src.utils.sound_manager import (
+    SoundManager, SoundEffect, SoundGroup, ChannelGroup, StealPolicy, PlayResult, PLACEHOLDER_SOUNDS, EFFECT_PRESETS,
+    SOUND_GROUPS, PLACEHOLDER_MANIFEST
+)
+from src.utils.synth import Synthesizer
+
+class TestPlaceholderSounds(unittest.TestCase):
+    """
+    Tests pour la génération des sons de test.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation d'un gestionnaire en mode fichiers dont les dossiers de
+        sons sont temporaires.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SoundManager(procedural=False)
+        self.manager.sound_dir = os.path.join(self.temp_dir.name, "sounds")
+        self.manager.music_dir = os.path.join(self.temp_dir.name, "music")
+    
+    def tearDown(self):
+        """
+        Suppression des dossiers temporaires.
+        """
+        self.temp_dir.cleanup()
+    
+    def _path(self, folder, file_name):
+        """
+        Renvoie le chemin d'un son de test.
+        """
+        return os.path.join(self.temp_dir.name, folder, file_name)
+    
+    def test_generated_once(self):
+        """
+        Test que les sons sont générés au premier appel puis conservés.
+        """
+        created = self.manager.create_placeholder_sounds()
+        self.assertEqual(len(created), len(PLACEHOLDER_SOUNDS))
+        for folder, file_name in PLACEHOLDER_SOUNDS:
+            self.assertTrue(os.path.exists(self._path(folder, file_name)))
+        # Aucun fichier temporaire ne reste après l'écriture
+        self.assertFalse([name for name in os.listdir(self.manager.sound_dir) if name.startswith(".tmp")])
+        
+        mtime = os.stat(self._path("music", "background.wav")).st_mtime_ns
+        with mock.patch.object(Synthesizer, "render", side_effect=AssertionError):
+            self.assertEqual(self.manager.create_placeholder_sounds(), [])
+        self.assertEqual(os.stat(self._path("music", "background.wav")).st_mtime_ns, mtime)
+    
+    def test_file_mode(self):
+        """
+        Test que les fichiers écrits ont les droits habituels (selon l'umask).
+        """
+        umask = os.umask(0o022)
+        try:
+            self.manager.create_placeholder_sounds()
+        finally:
+            os.umask(umask)
+        for path in (self._path("sounds", "eat.wav"), os.path.join(self.temp_dir.name, PLACEHOLDER_MANIFEST)):
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+    
+    def test_custom_sound_kept(self):
+        """
+        Test qu'un son remplacé par l'utilisateur n'est pas écrasé.
+        """
+        self.manager.create_placeholder_sounds()
+        path = self._path("sounds", "eat.wav")
+        with open(path, "wb") as f:
+            f.write(b"custom")
+        
+        self.assertEqual(self.manager.create_placeholder_sounds(), [])
+        self.assertEqual(self.manager.create_placeholder_sounds(), [])
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"custom")
+    
+    def test_recipe_change(self):
+        """
+        Test que les sons de test sont recréés quand la synthèse change.
+        """
+        self.manager.create_placeholder_sounds()
+        os.remove(self._path("sounds", "move.wav"))
+        self.assertEqual(self.manager.create_placeholder_sounds(), [self._path("sounds", "move.wav")])
+        
+        with mock.patch.object(sound_manager, "PLACEHOLDER_VERSION", sound_manager.PLACEHOLDER_VERSION + 1):
+            self.assertEqual(len(self.manager.create_placeholder_sounds()), len(PLACEHOLDER_SOUNDS))
+    
+    def test_loaded_after_creation(self):
+        """
+        Test que les sons créés sont chargés sans attendre le lancement suivant.
+        """
+        self.manager.create_placeholder_sounds()
+        self.assertEqual(set(self.manager.sounds), set(EFFECT_PRESETS))
+
+
+class TestProceduralSounds(unittest.TestCase):
+    """
+    Tests pour les sons générés en mémoire.
+    """
+    
+    def test_no_file_access(self):
+        """
+        Test que les sons et la musique sont générés sans accéder aux fichiers.
+        """
+        with mock.patch("os.path.exists", side_effect=AssertionError), \
+             mock.patch("os.makedirs", side_effect=AssertionError):
+            manager = SoundManager(procedural=True)
+            manager.play_sound(SoundEffect.EAT)
+            manager.play_music()
+            manager.play_music("game_background.wav")
+            for future in manager.tracks.values():
+                self.assertIsNotNone(future.result())
+        manager.close()
+        self.assertIn((SoundEffect.EAT, 0), manager.generated)
+        self.assertEqual(set(manager.tracks), {"background", "game_background"})
+    
+    def test_generated_once(self):
+        """
+        Test que chaque son (et chaque transposition) n'est généré qu'une fois.
+        """
+        manager = SoundManager(procedural=True)
+        manager.play_sound(SoundEffect.EAT)
+        sound = manager.generated[(SoundEffect.EAT, 0)]
+        with mock.patch.object(Synthesizer, "render", side_effect=AssertionError):
+            manager.play_sound(SoundEffect.EAT)
+        self.assertIs(manager.generated[(SoundEffect.EAT, 0)], sound)
+        
+        manager.play_sound(SoundEffect.EAT, 5)
+        self.assertEqual(len(manager.generated), 2)
+        
+        # Les effets inconnus sont ignorés
+        manager.play_sound("unknown")
+        self.assertEqual(len(manager.generated), 2)
+    
+    def test_volume(self):
+        """
+        Test que le volume s'applique aux sons déjà générés.
+        """
+        manager = SoundManager(procedural=True)
+        manager.play_sound(SoundEffect.MOVE)
+        manager.set_sound_volume(0.25)
+        self.assertAlmostEqual(manager.generated[(SoundEffect.MOVE, 0)].get_volume(), 0.25, places=2)
+
+
+class FakeChannel:
+    """
+    Canal factice qui reste occupé jusqu'à son arrêt.
+    """
+    
+    def __init__(self):
+        """
+        Initialise un canal libre.
+        """
+        self.sound = None
+    
+    def get_busy(self):
+        """
+        Indique si un son est en cours.
+        """
+        return self.sound is not None
+    
+    def play(self, sound):
+        """
+        Joue un son (en interrompant le son en cours).
+        """
+        self.sound = sound
+    
+    def stop(self):
+        """
+        Arrête le son en cours.
+        """
+        self.sound = None
+
+
+class TestChannelGroup(unittest.TestCase):
+    """
+    Tests pour les groupes de canaux des effets.
+    """
+    
+    def test_steal_oldest(self):
+        """
+        Test qu'un groupe plein interrompt l'effet le plus ancien.
+        """
+        group = ChannelGroup([FakeChannel(), FakeChannel()], StealPolicy.OLDEST)
+        self.assertEqual(group.play("a", 1.0), PlayResult.PLAYED)
+        self.assertEqual(group.play("b", 2.0), PlayResult.PLAYED)
+        self.assertEqual(group.play("c", 3.0), PlayResult.STOLEN)
+        self.assertEqual([channel.sound for channel in group.channels], ["c", "b"])
+        self.assertEqual(group.play("d", 4.0), PlayResult.STOLEN)
+        self.assertEqual([channel.sound for channel in group.channels], ["c", "d"])
+        
+        # Un canal libéré est réutilisé sans interruption
+        group.channels[0].stop()
+        self.assertEqual(group.play("e", 5.0), PlayResult.PLAYED)
+        self.assertEqual([channel.sound for channel in group.channels], ["e", "d"])
+    
+    def test_drop(self):
+        """
+        Test qu'un groupe plein ignore le nouvel effet.
+        """
+        group = ChannelGroup([FakeChannel()], StealPolicy.DROP)
+        self.assertEqual(group.play("a", 1.0), PlayResult.PLAYED)
+        self.assertEqual(group.play("b", 2.0), PlayResult.DROPPED)
+        self.assertEqual(group.channels[0].sound, "a")
+
+
+class TestEffects(unittest.TestCase):
+    """
+    Tests pour la limitation des effets sonores.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation d'un gestionnaire dont l'horloge est contrôlée.
+        """
+        self.manager = SoundManager(procedural=True)
+        patcher = mock.patch.object(sound_manager, "time")
+        self.clock = patcher.start().perf_counter
+        self.clock.return_value = 100.0
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """
+        Arrêt des effets et du fil de chargement.
+        """
+        for group in self.manager.channel_groups.values():
+            group.stop()
+        self.manager.close()
+    
+    def test_channels_reserved(self):
+        """
+        Test que chaque groupe a ses propres canaux, distincts de ceux de la musique.
+        """
+        channels = list(self.manager.music_channels)
+        for group, (count, _) in SOUND_GROUPS.items():
+            self.assertEqual(len(self.manager.channel_groups[group].channels), count)
+            channels.extend(self.manager.channel_groups[group].channels)
+        self.assertEqual(len(channels), len(set(channels)))
+    
+    def test_coalesced(self):
+        """
+        Test qu'un effet redemandé avant son intervalle minimal est ignoré.
+        """
+        manager = self.manager
+        self.assertEqual(manager.play_sound(SoundEffect.EAT), PlayResult.PLAYED)
+        for _ in range(1000):
+            self.assertEqual(manager.play_sound(SoundEffect.EAT, 3), PlayResult.COALESCED)
+        
+        # Les autres effets ne sont pas concernés
+        self.assertEqual(manager.play_sound(SoundEffect.LEVEL_UP), PlayResult.PLAYED)
+        
+        self.clock.return_value = 101.0
+        self.assertNotEqual(manager.play_sound(SoundEffect.EAT), PlayResult.COALESCED)
+        
+        stats = manager.get_stats()
+        self.assertEqual(stats[PlayResult.COALESCED], 1000)
+        self.assertEqual(stats[PlayResult.PLAYED] + stats[PlayResult.STOLEN], 3)
+        self.assertEqual(stats["effects"][SoundEffect.EAT][PlayResult.COALESCED], 1000)
+    
+    def test_dropped(self):
+        """
+        Test qu'un effet ignoré faute de canal libre est compté.
+        """
+        manager = self.manager
+        group = manager.channel_groups[SoundGroup.MOVEMENT]
+        group.channels = [FakeChannel()]
+        group.started = [0.0]
+        self.assertEqual(manager.play_sound(SoundEffect.MOVE), PlayResult.PLAYED)
+        self.clock.return_value = 101.0
+        self.assertEqual(manager.play_sound(SoundEffect.MOVE), PlayResult.DROPPED)
+        self.assertEqual(manager.get_stats()[PlayResult.DROPPED], 1)
+    
+    def test_disabled(self):
+        """
+        Test que les effets désactivés ou inconnus ne sont pas demandés.
+        """
+        manager = self.manager
+        self.assertIsNone(manager.play_sound("unknown"))
+        manager.toggle_sound()
+        self.assertIsNone(manager.play_sound(SoundEffect.EAT))
+        self.assertEqual(manager.get_stats()["effects"], {})
+
+
+class TestMusic(unittest.TestCase):
+    """
+    Tests pour le chargement et l'enchaînement des morceaux.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation d'un gestionnaire dont les morceaux sont chargés.
+        """
+        self.manager = SoundManager(procedural=True)
+        for future in self.manager.tracks.values():
+            future.result()
+    
+    def tearDown(self):
+        """
+        Arrêt du fil de chargement.
+        """
+        self.manager.stop_music()
+        self.manager.close()
+    
+    def test_crossfade(self):
+        """
+        Test qu'un changement de morceau passe sur l'autre canal réservé.
+        """
+        manager = self.manager
+        manager.play_music()
+        first = manager.music
+        self.assertIs(first.get_sound(), manager.tracks["background"].result())
+        
+        manager.play_music("game_background.wav")
+        self.assertIsNot(manager.music, first)
+        self.assertEqual(manager.current_track, "game_background")
+        self.assertIs(manager.music.get_sound(), manager.tracks["game_background"].result())
+        
+        # Le morceau en cours continue
+        manager.play_music("game_background.mp3")
+        self.assertIsNot(manager.music, first)
+    
+    def test_missing_track_cached(self):
+        """
+        Test qu'un morceau introuvable n'est cherché qu'une fois et coupe la musique.
+        """
+        manager = self.manager
+        manager.play_music()
+        with mock.patch.object(manager, "_load_track", wraps=manager._load_track) as load_track:
+            manager.play_music("unknown.wav")
+            manager.tracks["unknown"].result()
+            manager.play_music("unknown.wav")
+            manager.play_music()
+            manager.play_music("unknown.wav")
+        self.assertEqual(load_track.call_count, 1)
+        self.assertIsNone(manager.tracks["unknown"].result())
+        self.assertEqual(manager.current_track, "unknown")
+    
+    def test_repeated_request_while_loading(self):
+        """
+        Test qu'un morceau redemandé pendant son chargement ne démarre qu'une fois.
+        """
+        manager = self.manager
+        gate = threading.Event()
+        manager.loader.submit(gate.wait)
+        with mock.patch.object(manager, "_load_track", return_value=manager.tracks["background"].result()):
+            with mock.patch.object(manager, "_start_track", wraps=manager._start_track) as start_track:
+                for _ in range(3):
+                    manager.play_music("other.wav")
+                gate.set()
+                manager.tracks["other"].result()
+                manager.loader.submit(lambda: None).result()
+                manager.play_music("other.wav")
+        self.assertEqual(start_track.call_count, 1)
+        self.assertEqual(manager.current_track, "other")
+        self.assertFalse(manager.track_pending)
+    
+    def test_close_cancels_pending_loads(self):
+        """
+        Test que les chargements pas encore commencés sont abandonnés à l'arrêt.
+        """
+        manager = self.manager
+        # Occuper le fil de chargement pour que le morceau reste en attente
+        gate = threading.Event()
+        manager.loader.submit(gate.wait)
+        future = manager._request_track("unknown.wav")
+        threading.Timer(0.05, gate.set).start()
+        manager.close()
+        self.assertTrue(future.cancelled())
+    
+    def test_pending_track(self):
+        """
+        Test qu'un morceau demandé pendant son chargement ne démarre que
+        s'il est toujours le dernier demandé.
+        """
+        manager = self.manager
+        with mock.patch.object(manager, "_start_track") as start_track:
+            manager.play_music()
+        start_track.assert_called_once()
+        
+        manager.current_track = "game_background"
+        manager._start_track("background", manager.tracks["background"].result(), True)
+        self.assertFalse(any(channel.get_busy() for channel in manager.music_channels))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Tests unitaires pour la file de commandes sonores.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Audio factice: les tests n'ouvrent pas de périphérique de son
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.sound_queue import SoundQueue, SoundSink, create_sound_manager
+from src.utils.sound_manager import SoundEffect
+
+class RecordingManager:
+    """
+    Gestionnaire factice qui note les commandes reçues et le fil qui les exécute.
+    """
+    
+    def __init__(self):
+        """
+        Initialise des réglages par défaut.
+        """
+        self.sound_volume = 0.7
+        self.music_volume = 0.5
+        self.sound_enabled = True
+        self.music_enabled = True
+        self.calls = []
+        self.threads = set()
+        self.closed = False
+        self.delay = 0
+    
+    def __getattr__(self, name):
+        """
+        Renvoie une méthode qui enregistre son appel.
+        """
+        def method(*args):
+            time.sleep(self.delay)
+            self.calls.append((name, args))
+            self.threads.add(threading.current_thread().name)
+            if name == "get_stats":
+                return {"played": len(self.calls)}
+            if name == "fail":
+                raise ValueError("échec")
+            return None
+        return method
+    
+    def close(self):
+        """
+        Note l'arrêt du gestionnaire.
+        """
+        self.closed = True
+
+
+class TestSoundQueue(unittest.TestCase):
+    """
+    Tests pour la classe SoundQueue.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation d'une file sur un gestionnaire factice.
+        """
+        self.manager = RecordingManager()
+        self.queue = SoundQueue(self.manager)
+    
+    def tearDown(self):
+        """
+        Arrêt du fil audio.
+        """
+        self.queue.close()
+    
+    def test_commands_in_order(self):
+        """
+        Test que les commandes sont exécutées dans l'ordre par le fil audio.
+        """
+        self.queue.play_music()
+        self.queue.play_sound(SoundEffect.EAT, 3)
+        self.queue.preload_music("game_background.wav")
+        self.queue.stop_music()
+        self.queue.close()
+        
+        self.assertEqual(self.manager.calls, [
+            ("play_music", ("background.mp3", True)),
+            ("play_sound", (SoundEffect.EAT, 3)),
+            ("preload_music", ("game_background.wav",)),
+            ("stop_music", ())
+        ])
+        self.assertEqual(self.manager.threads, {"audio"})
+        self.assertTrue(self.manager.closed)
+        self.assertFalse(self.queue.thread.is_alive())
+    
+    def test_settings(self):
+        """
+        Test que les réglages sont à jour immédiatement et transmis au gestionnaire.
+        """
+        self.assertFalse(self.queue.toggle_sound())
+        self.assertFalse(self.queue.sound_enabled)
+        
+        # Effets désactivés: aucune commande
+        self.queue.play_sound(SoundEffect.MOVE)
+        self.queue.set_music_volume(1.5)
+        self.assertEqual(self.queue.music_volume, 1.0)
+        self.assertFalse(self.queue.toggle_music())
+        self.queue.play_music()
+        
+        self.assertEqual(self.queue.get_stats(), {"played": 4})
+        self.assertEqual(self.manager.calls[:3], [
+            ("toggle_sound", ()),
+            ("set_music_volume", (1.0,)),
+            ("toggle_music", ())
+        ])
+    
+    def test_slow_manager_does_not_block(self):
+        """
+        Test qu'un gestionnaire lent ne ralentit pas le fil du jeu.
+        """
+        self.manager.delay = 0.1
+        start = time.perf_counter()
+        for _ in range(3):
+            self.queue.play_sound(SoundEffect.EAT)
+        self.queue.play_music()
+        self.assertLess(time.perf_counter() - start, 0.05)
+        
+        # Les commandes sont toutes exécutées avant l'arrêt
+        self.queue.close()
+        self.assertEqual(len(self.manager.calls), 4)
+    
+    def test_errors(self):
+        """
+        Test qu'une commande en erreur n'arrête pas le fil audio.
+        """
+        self.queue._send("fail")
+        with self.assertRaises(ValueError):
+            self.queue._call("fail")
+        self.queue.play_sound(SoundEffect.EAT)
+        self.assertEqual(self.queue.get_stats(), {"played": 4})
+
+
+class TestSoundSink(unittest.TestCase):
+    """
+    Tests pour le récepteur muet.
+    """
+    
+    def test_dummy_audio(self):
+        """
+        Test qu'avec l'audio factice le jeu reçoit un récepteur muet.
+        """
+        self.assertIsInstance(create_sound_manager(), SoundSink)
+        self.assertNotIsInstance(create_sound_manager(), SoundQueue)
+    
+    def test_settings(self):
+        """
+        Test que les réglages sont conservés et les commandes ignorées.
+        """
+        sink = SoundSink()
+        self.assertIsNone(sink.play_sound(SoundEffect.EAT))
+        sink.play_music()
+        self.assertFalse(sink.toggle_music())
+        sink.set_sound_volume(-1)
+        self.assertEqual(sink.sound_volume, 0.0)
+        self.assertEqual(sink.get_stats()["played"], 0)
+        sink.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
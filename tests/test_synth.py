@@ -0,0 +1,122 @@
+"""
+Tests unitaires pour la synthèse procédurale des sons.
+"""
+
+import unittest
+import sys
+import os
+from array import array
+from unittest import mock
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import synth
+from src.utils.synth import Synthesizer, Waveform, SAMPLE_FORMATS
+
+class TestSynthesizer(unittest.TestCase):
+    """
+    Tests pour la classe Synthesizer.
+    """
+    
+    def setUp(self):
+        """
+        Initialisation d'un générateur 16 bits mono.
+        """
+        self.synth = Synthesizer(8000, -16, 1)
+    
+    def _crossings(self, frames):
+        """
+        Compte les passages de négatif à positif d'un son 16 bits mono.
+        """
+        samples = array('h', frames)
+        return sum(1 for a, b in zip(samples, samples[1:]) if a < 0 <= b)
+    
+    def test_length(self):
+        """
+        Test que la durée des notes et le nombre de canaux sont respectés.
+        """
+        notes = [{"frequency": 440, "duration": 0.1}, {"frequency": 660, "duration": 0.05}]
+        self.assertEqual(len(self.synth.render(notes)), 2 * 1200)
+        self.assertEqual(len(Synthesizer(8000, -16, 2).render(notes)), 2 * 2 * 1200)
+    
+    def test_transposition(self):
+        """
+        Test qu'une transposition d'une octave double la fréquence.
+        """
+        notes = [{"frequency": 100, "duration": 1.0, "waveform": Waveform.SINE}]
+        self.assertAlmostEqual(self._crossings(self.synth.render(notes)), 100, delta=1)
+        self.assertAlmostEqual(self._crossings(self.synth.render(notes, 12)), 200, delta=1)
+    
+    def test_envelope(self):
+        """
+        Test que l'enveloppe commence et finit en silence et respecte le volume.
+        """
+        frames = self.synth.render([{"frequency": 200, "duration": 0.2, "volume": 0.5, "sustain": 0.0}])
+        samples = array('h', frames)
+        self.assertEqual(samples[0], 0)
+        self.assertEqual(samples[-1], 0)
+        self.assertLessEqual(max(abs(value) for value in samples), 32767 * 0.5)
+        self.assertEqual(self.synth.render([{"frequency": 200, "duration": 0.1, "volume": 0.0}]), bytes(1600))
+    
+    def test_formats(self):
+        """
+        Test le codage dans chaque format du mixeur.
+        """
+        notes = [{"frequency": 200, "duration": 0.01, "volume": 0.0}]
+        for size, (typecode, _, offset) in SAMPLE_FORMATS.items():
+            samples = array(typecode, Synthesizer(8000, size, 1).render(notes))
+            self.assertEqual(len(samples), 80)
+            self.assertEqual(set(samples), {offset})
+        with self.assertRaises(ValueError):
+            Synthesizer(8000, 24, 1)
+    
+    def test_without_numpy(self):
+        """
+        Test que la synthèse sans NumPy produit les mêmes échantillons.
+        """
+        if synth.np is None:
+            self.skipTest("NumPy n'est pas installé")
+        
+        notes = [
+            {"frequency": 300, "end_frequency": 600, "duration": 0.05, "waveform": waveform, "sustain": 0.3}
+            for waveform in (Waveform.SINE, Waveform.SQUARE, Waveform.TRIANGLE, Waveform.SAWTOOTH)
+        ]
+        expected = array('h', self.synth.render(notes, 2))
+        with mock.patch.object(synth, "np", None):
+            samples = array('h', self.synth.render(notes, 2))
+        self.assertEqual(len(samples), len(expected))
+        self.assertLessEqual(max(abs(a - b) for a, b in zip(samples, expected)), 1)
+    
+    def test_without_numpy_formats(self):
+        """
+        Test que la synthèse sans NumPy code et entrelace chaque format comme NumPy.
+        """
+        if synth.np is None:
+            self.skipTest("NumPy n'est pas installé")
+        
+        note = {"frequency": 440, "duration": 0.02, "waveform": Waveform.TRIANGLE}
+        notes = [note, {"frequency": 440, "duration": 0.01, "volume": 0.0}, note]
+        for size, (typecode, _, _) in SAMPLE_FORMATS.items():
+            generator = Synthesizer(8000, size, 2)
+            expected = array(typecode, generator.render(notes))
+            with mock.patch.object(synth, "np", None):
+                samples = array(typecode, generator.render(notes))
+            self.assertEqual(len(samples), 2 * 400)
+            self.assertEqual(samples[0::2], samples[1::2])
+            tolerance = 1e-6 if typecode == 'f' else 1
+            self.assertLessEqual(max(abs(a - b) for a, b in zip(samples, expected)), tolerance)
+    
+    def test_repeated_notes_computed_once(self):
+        """
+        Test que les notes identiques d'une mélodie ne sont calculées qu'une fois.
+        """
+        notes = [{"frequency": 200, "duration": 0.05}, {"frequency": 300, "duration": 0.05}] * 4
+        with mock.patch.object(Synthesizer, "note", wraps=self.synth.note) as note:
+            frames = self.synth.render(notes)
+        self.assertEqual(note.call_count, 2)
+        self.assertEqual(frames, self.synth.render(notes[:2]) * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests unitaires pour le cache des textes rendus.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au chemin de recherche pour importer le module src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from src.utils.text_cache import TextCache
+
+class TestTextCache(unittest.TestCase):
+    """
+    Tests pour la classe TextCache.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialise le module de polices de pygame.
+        """
+        pygame.font.init()
+        cls.font = pygame.font.Font(None, 24)
+    
+    def test_hit_returns_same_surface(self):
+        """
+        Teste qu'un texte déjà rendu est réutilisé.
+        """
+        cache = TextCache()
+        first = cache.render(self.font, "Score: 10", True, (255, 255, 255))
+        second = cache.render(self.font, "Score: 10", True, [255, 255, 255])
+        
+        self.assertIs(first, second)
+        self.assertEqual(cache.get_stats()["hits"], 1)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+    
+    def test_key_includes_style(self):
+        """
+        Teste que la couleur et le fond font partie de la clé.
+        """
+        cache = TextCache()
+        white = cache.render(self.font, "Menu", True, (255, 255, 255))
+        red = cache.render(self.font, "Menu", True, (255, 0, 0))
+        boxed = cache.render(self.font, "Menu", True, (255, 255, 255), (0, 0, 0))
+        
+        self.assertIsNot(white, red)
+        self.assertIsNot(white, boxed)
+        self.assertEqual(cache.get_stats()["size"], 3)
+    
+    def test_lru_eviction(self):
+        """
+        Teste que le texte le moins récemment utilisé est évincé.
+        """
+        cache = TextCache(max_size=2)
+        a = cache.render(self.font, "A", True, (255, 255, 255))
+        cache.render(self.font, "B", True, (255, 255, 255))
+        cache.render(self.font, "A", True, (255, 255, 255))  # A devient le plus récent
+        cache.render(self.font, "C", True, (255, 255, 255))  # B est évincé
+        
+        self.assertEqual(cache.get_stats()["size"], 2)
+        self.assertIs(cache.render(self.font, "A", True, (255, 255, 255)), a)
+        misses = cache.misses
+        cache.render(self.font, "B", True, (255, 255, 255))
+        self.assertEqual(cache.misses, misses + 1)
+    
+    def test_clear(self):
+        """
+        Teste la remise à zéro du cache.
+        """
+        cache = TextCache()
+        cache.render(self.font, "A", True, (255, 255, 255))
+        cache.clear()
+        
+        self.assertEqual(cache.get_stats(), {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0})
+
+if __name__ == '__main__':
+    unittest.main()